@@ -0,0 +1,575 @@
+// Charts of the Wiz issue report computed in the browser, used when client_side_filtering is True in issue_report.py
+// The server sends the issue cube once (see client_issue_cube): for every dimension its distinct values and the value index of every row,
+// and the day, the created and the resolved issues of every row. The clientside callbacks below filter it and build the same charts
+// as the section callbacks of the server, so a change of a dropdown, of the date range or of the granularity never reaches the server.
+
+(function() {
+    // typed arrays of the encoded columns
+    const arrayTypes = {int8: Int8Array, int16: Int16Array, int32: Int32Array};
+
+    // number of milliseconds in a day, the days are day numbers (days since 1970-01-01)
+    const millisecondsPerDay = 86400000;
+
+    // decoded issue cube, and the rows of the last selection, shared by the callbacks of all the sections
+    let decodedCube = null;
+    let selectedRows = null;
+
+    function decodeColumn(column) {
+        // helper to decode a base64 column of integers
+        const text = atob(column.data);
+        const bytes = new Uint8Array(text.length);
+        for (let i = 0; i < text.length; i++) {
+            bytes[i] = text.charCodeAt(i);
+        }
+        return new arrayTypes[column.type](bytes.buffer);
+    }
+
+    function decodeCube(data) {
+        // decode the issue cube sent by the server, once per loaded report
+        if (decodedCube && decodedCube.fingerprint === data.fingerprint) {
+            return decodedCube;
+        }
+        const dimensions = {};
+        for (const [column, dimension] of Object.entries(data.dimensions)) {
+            dimensions[column] = {values: dimension.values, codes: decodeColumn(dimension.codes)};
+        }
+        // day numbers of the rows, -1 for the issues without a creation day
+        const days = Int32Array.from(decodeColumn(data.days), day => day < 0 ? -1 : day + data.first_day);
+        decodedCube = Object.assign({}, data, {
+            dimensions: dimensions,
+            days: days,
+            created: decodeColumn(data.created),
+            resolved: decodeColumn(data.resolved),
+            rows: days.length,
+        });
+        selectedRows = null;
+        return decodedCube;
+    }
+
+    function normalizeSelection(project, severity, csp, subscription) {
+        // same selection as normalize_selection: the sorted selected projects and the other dropdown values
+        let projects = typeof project === 'string' ? [project] : (project || []);
+        if (projects.includes('All Projects')) {
+            projects = ['All Projects'];
+        }
+        return [Array.from(new Set(projects)).sort(), severity, csp, subscription];
+    }
+
+    function projectRows(cube, projects) {
+        // helper to tell which Project Names values belong to at least one of the projects, like filter_by_projects
+        const wanted = new Set(projects.map(project => cube.projects.indexOf(project)));
+        return cube.membership.map(members => members.some(member => wanted.has(member)));
+    }
+
+    function valueRows(cube, column, value) {
+        // helper to tell which values of a dimension are the selected value
+        return cube.dimensions[column].values.map(other => other === value);
+    }
+
+    function filterRows(cube, tests) {
+        // helper to list the rows of the issue cube passing all the tests: the codes of a dimension and the accepted codes
+        const rows = [];
+        for (let row = 0; row < cube.rows; row++) {
+            let accepted = true;
+            for (const [codes, values] of tests) {
+                if (!values[codes[row]]) {
+                    accepted = false;
+                    break;
+                }
+            }
+            if (accepted) {
+                rows.push(row);
+            }
+        }
+        return Int32Array.from(rows);
+    }
+
+    function selectRows(cube, selection) {
+        // filter the issue cube with the normalized dropdown values, like filter_issue_cube. The rows of the last selection are kept for the other sections
+        const key = JSON.stringify(selection);
+        if (selectedRows && selectedRows.key === key) {
+            return selectedRows.rows;
+        }
+        const [projects, severity, csp, subscription] = selection;
+        const tests = [];
+        if (!projects.includes('All Projects')) {
+            tests.push([cube.dimensions['Project Names'].codes, projectRows(cube, projects)]);
+        }
+        if (severity !== 'All Severities') {
+            tests.push([cube.dimensions['Severity'].codes, valueRows(cube, 'Severity', severity)]);
+        }
+        if (csp !== 'All Resource Platforms') {
+            tests.push([cube.dimensions['Resource Platform'].codes, valueRows(cube, 'Resource Platform', csp)]);
+        }
+        if (subscription !== 'All Subscriptions') {
+            tests.push([cube.dimensions['Subscription ID'].codes, valueRows(cube, 'Subscription ID', subscription)]);
+        }
+        selectedRows = {key: key, rows: filterRows(cube, tests), allLines: new Map()};
+        return selectedRows.rows;
+    }
+
+    function normalizeWindow(cube, dateRange, granularity) {
+        // same date range as normalize_window: the first and last day numbers within the days of the report, and the granularity
+        let firstDay = cube.first_day;
+        let lastDay = cube.last_day;
+        if (dateRange) {
+            if (dateRange[0] !== null && dateRange[0] !== undefined) {
+                firstDay = Math.max(firstDay, Math.trunc(dateRange[0]));
+            }
+            if (dateRange[1] !== null && dateRange[1] !== undefined) {
+                lastDay = Math.min(lastDay, Math.trunc(dateRange[1]));
+            }
+        }
+        if (!(granularity in cube.granularities)) {
+            granularity = 'Day';
+        }
+        return [firstDay, lastDay, granularity];
+    }
+
+    function dateString(day) {
+        // helper to turn a day number into a 'YYYY-MM-DD' string
+        return new Date(day * millisecondsPerDay).toISOString().slice(0, 10);
+    }
+
+    function labelColor(cube, label) {
+        // color of a pie chart slice, computed by the server with label_color
+        return cube.colors[label];
+    }
+
+    function otherValuesLabel(cube, labels) {
+        // label of the slice or of the line merging the values beyond top_n, like other_values_label: 'Other', or 'Other (merged)' when a value of the chart is named 'Other'
+        let label = cube.other;
+        for (let count = 1; labels.includes(label); count++) {
+            label = count === 1 ? `${cube.other} (merged)` : `${cube.other} (merged ${count})`;
+        }
+        return label;
+    }
+
+    function pieChartSlices(cube, labels, values) {
+        // keep the top_n largest slices of a pie chart and merge the other ones into an 'Other' slice, like pie_chart_slices
+        if (cube.top_n && labels.length > cube.top_n + 1) {
+            // the sort is stable, the slices with the same number of issues keep their order
+            const order = values.map((value, i) => i).sort((a, b) => values[b] - values[a]);
+            const top = order.slice(0, cube.top_n);
+            const other = order.slice(cube.top_n).reduce((total, i) => total + values[i], 0);
+            return [top.map(i => labels[i]).concat([otherValuesLabel(cube, labels)]), top.map(i => values[i]).concat([other])];
+        }
+        return [labels, values];
+    }
+
+    function pieChartData(cube, labels, values, size) {
+        // helper to build the trace of a pie chart
+        [labels, values] = pieChartSlices(cube, labels, values);
+        const data = {labels: labels, values: values, type: 'pie', hole: 0.6, textposition: 'inside'};
+        if (size) {
+            data.width = 100;
+            data.height = 100;
+        }
+        data.marker = {colors: labels.map(label => labelColor(cube, label))};
+        return [data];
+    }
+
+    function inWindow(cube, row, window) {
+        // helper to tell if the issues of a row were created in the date range
+        const day = cube.days[row];
+        return day >= 0 && day >= window[0] && day <= window[1];
+    }
+
+    function statusPieChart(cube, rows, window) {
+        // Pie chart of the issues created in the date range by Status, like status_pie_chart
+        const codes = cube.dimensions['Status'].codes;
+        const counts = new Map();
+        for (const row of rows) {
+            if (codes[row] < 0) {
+                continue;
+            }
+            // the statuses are kept in the order they appear
+            const count = (counts.get(codes[row]) || 0) + (inWindow(cube, row, window) ? cube.created[row] : 0);
+            counts.set(codes[row], count);
+        }
+        const statuses = Array.from(counts.keys()).filter(code => counts.get(code) > 0);
+        return [{
+            id: 'open-resolved-issues-by-Status-pie-chart',
+            data: pieChartData(cube, statuses.map(code => cube.dimensions['Status'].values[code]), statuses.map(code => counts.get(code)), false),
+            layout: {title: 'All Issues by Status', visible: true, margin: {t: 50, b: 50, l: 0, r: 0}},
+        }];
+    }
+
+    function projectPieCharts(cube, rows, filter, projects, window) {
+        // Pie charts of the issues created in the date range by Wiz Project, one for each Status. An issue is counted once in every project it belongs to
+        const statusCodes = cube.dimensions['Status'].codes;
+        const projectCodes = cube.dimensions['Project Names'].codes;
+        // issues of every status and Project Names value, the statuses are kept in the order they appear in the issues
+        const valueCounts = new Map();
+        for (const row of rows) {
+            const status = statusCodes[row];
+            if (status < 0) {
+                continue;
+            }
+            if (!valueCounts.has(status)) {
+                valueCounts.set(status, new Float64Array(cube.membership.length));
+            }
+            if (inWindow(cube, row, window) && projectCodes[row] >= 0) {
+                valueCounts.get(status)[projectCodes[row]] += cube.created[row];
+            }
+        }
+        // then spread the counts of the Project Names values over their projects
+        const counts = new Map();
+        for (const [status, statusValueCounts] of valueCounts) {
+            const statusCounts = new Float64Array(cube.projects.length);
+            cube.membership.forEach((members, code) => {
+                for (const project of members) {
+                    statusCounts[project] += statusValueCounts[code];
+                }
+            });
+            counts.set(status, statusCounts);
+        }
+        const wizProjects = projects.includes('All Projects') ? cube.projects : projects;
+        const charts = [];
+        for (const [status, statusCounts] of counts) {
+            // a status without issues in the date range has no pie chart
+            if (!statusCounts.some(count => count > 0)) {
+                continue;
+            }
+            const statusName = cube.dimensions['Status'].values[status];
+            const values = wizProjects.map(project => {
+                const index = cube.projects.indexOf(project);
+                return index < 0 ? 0 : statusCounts[index];
+            });
+            charts.push({
+                id: `${statusName}-issues-by-${filter}-pie-chart`,
+                data: pieChartData(cube, wizProjects.slice(), values, false),
+                layout: {title: `${statusName} Issues by ${filter}`, visible: true, margin: {t: 50, b: 50, l: 0, r: 0}},
+            });
+        }
+        return charts;
+    }
+
+    function filterPieCharts(cube, rows, filter, window) {
+        // Pie charts of the issues created in the date range by value of a filter, one for each Status, like filter_pie_charts
+        const statusCodes = cube.dimensions['Status'].codes;
+        const valueCodes = cube.dimensions[filter].codes;
+        const values = cube.dimensions[filter].values;
+        // issues of every (status, value) pair, in the order the pairs appear
+        const counts = new Map();
+        for (const row of rows) {
+            if (statusCodes[row] < 0 || valueCodes[row] < 0) {
+                continue;
+            }
+            const pair = statusCodes[row] * values.length + valueCodes[row];
+            counts.set(pair, (counts.get(pair) || 0) + (inWindow(cube, row, window) ? cube.created[row] : 0));
+        }
+        const statuses = new Map();
+        for (const [pair, count] of counts) {
+            if (count > 0) {
+                const status = Math.floor(pair / values.length);
+                if (!statuses.has(status)) {
+                    statuses.set(status, []);
+                }
+                statuses.get(status).push([values[pair % values.length], count]);
+            }
+        }
+        const charts = [];
+        for (const [status, statusCounts] of statuses) {
+            const statusName = cube.dimensions['Status'].values[status];
+            // by decreasing number of issues, with the labels shortened to 36 characters for better display
+            statusCounts.sort((a, b) => b[1] - a[1]);
+            charts.push({
+                id: `${statusName}-issues-by-${filter}-pie-chart`,
+                data: pieChartData(cube, statusCounts.map(([value]) => value.slice(0, 36)), statusCounts.map(([, count]) => count), true),
+                layout: {title: `${statusName}  Issues by ${filter}`, visible: true, margin: {t: 50, b: 50, l: 0, r: 0}},
+            });
+        }
+        return charts;
+    }
+
+    function codeCounts(rows, codes, counts, size) {
+        // helper to add up the counts of the rows by code, the rows without a value (code -1) are left out
+        const totals = new Float64Array(size);
+        for (const row of rows) {
+            if (codes[row] >= 0) {
+                totals[codes[row]] += counts[row];
+            }
+        }
+        return totals;
+    }
+
+    function topLineValues(cube, values, counts) {
+        // split the values of a line chart into the top_n values with the most issues, in their original order, and the other values, like top_line_values
+        if (!cube.top_n || values.length <= cube.top_n + 1) {
+            return [values, []];
+        }
+        const top = new Set(values.slice().sort((a, b) => (counts.get(b) || 0) - (counts.get(a) || 0)).slice(0, cube.top_n));
+        return [values.filter(value => top.has(value)), values.filter(value => !top.has(value))];
+    }
+
+    function periodId(day, granularity) {
+        // helper to number the period of a day, the pandas periods of line_chart_granularities
+        const frequency = granularity[0];
+        if (frequency === 'W') {
+            // the weeks start on Monday, 1970-01-01 is a Thursday
+            return Math.floor((day + 3) / 7);
+        }
+        if (frequency !== 'M' && frequency !== 'Q' && frequency !== 'A' && frequency !== 'Y') {
+            return day;
+        }
+        const date = new Date(day * millisecondsPerDay);
+        const month = date.getUTCFullYear() * 12 + date.getUTCMonth();
+        if (frequency === 'M') {
+            return month;
+        }
+        return frequency === 'Q' ? Math.floor(month / 3) : date.getUTCFullYear();
+    }
+
+    function periodDays(cube, window) {
+        // split the date range into the periods of the granularity, like period_days
+        const frequency = cube.granularities[window[2]];
+        const firstDays = [];
+        const lastDays = [];
+        let previous = null;
+        for (let day = window[0]; day <= window[1]; day++) {
+            const period = periodId(day, frequency);
+            if (period !== previous) {
+                if (firstDays.length) {
+                    lastDays.push(day - 1);
+                }
+                firstDays.push(day);
+                previous = period;
+            }
+        }
+        if (firstDays.length) {
+            lastDays.push(window[1]);
+        }
+        return [firstDays, lastDays];
+    }
+
+    function largestTriangleOneBucket(x, y, threshold) {
+        // downsample a line with the Largest Triangle One Bucket algorithm, like largest_triangle_one_bucket
+        if (threshold < 3) {
+            return [0, y.length - 1];
+        }
+        const inner = y.length - 2;
+        const best = [];
+        const bestAreas = [];
+        for (let i = 0; i < inner; i++) {
+            const area = Math.abs((x[i] - x[i + 2]) * (y[i + 1] - y[i]) - (x[i] - x[i + 1]) * (y[i + 2] - y[i]));
+            const bucket = Math.floor(i * (threshold - 2) / inner);
+            // the first point of the largest area of each bucket is kept
+            if (best[bucket] === undefined || area > bestAreas[bucket]) {
+                best[bucket] = i;
+                bestAreas[bucket] = area;
+            }
+        }
+        return [0].concat(best.filter(i => i !== undefined).map(i => i + 1), [y.length - 1]);
+    }
+
+    function downsampleLine(x, y, maxPoints) {
+        // select the points of a line, like downsample_line: the points in the middle of a straight segment are dropped, then the line is reduced to maxPoints
+        let keep = y.map((value, i) => i);
+        if (!maxPoints || y.length <= 2) {
+            return keep;
+        }
+        keep = [0];
+        for (let i = 1; i < y.length - 1; i++) {
+            if ((y[i] - y[i - 1]) * (x[i + 1] - x[i]) !== (y[i + 1] - y[i]) * (x[i] - x[i - 1])) {
+                keep.push(i);
+            }
+        }
+        keep.push(y.length - 1);
+        if (keep.length > maxPoints) {
+            const kept = keep;
+            keep = largestTriangleOneBucket(kept.map(i => x[i]), kept.map(i => y[i]), maxPoints).map(i => kept[i]);
+        }
+        return keep;
+    }
+
+    function lineTraces(cube, rows, keys, codes, codeLines, window) {
+        // build the lines of a list of keys over the date range, like line_traces: a point is the open issues at the end of a period
+        // the issues of a row are on the lines codeLines[code] of the code of the row in codes (an issue can be on several lines), or on the only line without codes
+        const dayCount = cube.last_day - cube.first_day + 1;
+        const created = keys.map(() => new Float64Array(dayCount));
+        const resolved = keys.map(() => new Float64Array(dayCount));
+        for (const row of rows) {
+            const day = cube.days[row] - cube.first_day;
+            if (day < 0) {
+                continue;
+            }
+            const lines = codes ? (codes[row] < 0 ? [] : codeLines[codes[row]]) : [0];
+            for (const line of lines) {
+                created[line][day] += cube.created[row];
+                resolved[line][day] += cube.resolved[row];
+            }
+        }
+        const [firstDays, lastDays] = periodDays(cube, window);
+        return keys.map((name, key) => {
+            // first and last day with created issues and with resolved issues of the key, the line only covers the periods between them
+            const spans = [created[key], resolved[key]].map(daily => {
+                const first = daily.findIndex(count => count > 0);
+                return first < 0 ? null : [first + cube.first_day, daily.findLastIndex(count => count > 0) + cube.first_day];
+            });
+            // open issues at the end of every day
+            const open = new Float64Array(dayCount);
+            let total = 0;
+            for (let day = 0; day < dayCount; day++) {
+                total += created[key][day] - resolved[key][day];
+                open[day] = total;
+            }
+            const x = [];
+            const y = [];
+            firstDays.forEach((firstDay, period) => {
+                const lastDay = lastDays[period];
+                if (spans.some(span => span && firstDay <= span[1] && lastDay >= span[0])) {
+                    x.push(lastDay);
+                    y.push(open[lastDay - cube.first_day]);
+                }
+            });
+            const keep = downsampleLine(x, y, cube.max_points);
+            return {x: keep.map(i => dateString(x[i])), y: keep.map(i => y[i]), type: 'line', name: String(name).slice(0, 36)};
+        });
+    }
+
+    function allIssuesLine(cube, rows, window) {
+        // line of the open issues of the whole selection, shown on every line chart. It is kept for the other line charts of the selection
+        const key = JSON.stringify(window);
+        if (!selectedRows.allLines.has(key)) {
+            selectedRows.allLines.set(key, lineTraces(cube, rows, ['ALL'], null, null, window)[0]);
+        }
+        return selectedRows.allLines.get(key);
+    }
+
+    function lineChart(cube, rows, filter, projects, window) {
+        // Line chart of a filter over the date range, with a line for each value of the filter next to the ALL line, like line_chart
+        let keys;
+        let codes;
+        let codeLines;
+        if (filter === 'Project Names') {
+            // an issue is on the line of every project it belongs to, and once on the Other line
+            codes = cube.dimensions['Project Names'].codes;
+            // count the issues of each Project Names value first, then spread the counts over the projects
+            const valueCounts = codeCounts(rows, codes, cube.created, cube.membership.length);
+            const counts = new Map();
+            cube.membership.forEach((members, code) => {
+                for (const project of members) {
+                    counts.set(cube.projects[project], (counts.get(cube.projects[project]) || 0) + valueCounts[code]);
+                }
+            });
+            const [topProjects, otherProjects] = topLineValues(cube, projects.includes('All Projects') ? cube.projects : projects, counts);
+            const lines = new Map(topProjects.map((project, i) => [cube.projects.indexOf(project), i]));
+            const others = new Set(otherProjects.map(project => cube.projects.indexOf(project)));
+            keys = otherProjects.length ? topProjects.concat([otherValuesLabel(cube, topProjects.concat(otherProjects))]) : topProjects;
+            codeLines = cube.membership.map(members => {
+                const memberLines = members.filter(project => lines.has(project)).map(project => lines.get(project));
+                if (members.some(project => others.has(project))) {
+                    memberLines.push(topProjects.length);
+                }
+                return memberLines;
+            });
+        } else {
+            // the values of the filter in the order they appear, the values beyond top_n are merged into the Other line
+            codes = cube.dimensions[filter].codes;
+            const counts = new Map();
+            for (const row of rows) {
+                if (codes[row] >= 0) {
+                    counts.set(codes[row], (counts.get(codes[row]) || 0) + cube.created[row]);
+                }
+            }
+            const [topValues, otherValues] = topLineValues(cube, Array.from(counts.keys()), counts);
+            const lines = new Map(topValues.map((code, i) => [code, i]));
+            keys = topValues.map(code => cube.dimensions[filter].values[code]);
+            if (otherValues.length) {
+                keys.push(otherValuesLabel(cube, topValues.concat(otherValues).map(code => cube.dimensions[filter].values[code])));
+            }
+            codeLines = cube.dimensions[filter].values.map((value, code) => [lines.has(code) ? lines.get(code) : topValues.length]);
+        }
+        return [{
+            id: `issues-${filter}-line-chart`,
+            data: [allIssuesLine(cube, rows, window)].concat(lineTraces(cube, rows, keys, codes, codeLines, window)),
+            layout: {
+                title: `Issues over Time by ${filter}`,
+                xaxis: {title: window[2] === 'Day' ? 'Date' : `End of the ${window[2].toLowerCase()}`},
+                yaxis: {title: 'Number of Issues'},
+            },
+        }];
+    }
+
+    function sectionCharts(cube, kind, filter, selection, window) {
+        // compute the charts of a section of the page, like section_charts
+        const rows = selectRows(cube, selection);
+        if (kind === 'line') {
+            return lineChart(cube, rows, filter, selection[0], window);
+        }
+        if (filter === 'Status') {
+            return statusPieChart(cube, rows, window);
+        }
+        if (filter === 'Project Names') {
+            return projectPieCharts(cube, rows, filter, selection[0], window);
+        }
+        return filterPieCharts(cube, rows, filter, window);
+    }
+
+    function pieChartStyle(visible) {
+        // helper to show or hide a pie chart, like pie_chart_style
+        const style = {'width': '25%', 'max-height': '1000px'};
+        if (!visible) {
+            style.display = 'none';
+        }
+        return style;
+    }
+
+    function updateSection(kind, filter, graphIds, project, severity, csp, subscription, dateRange, granularity, data) {
+        // update the charts of a section of the page when a dropdown, the date range or the granularity changes, the figures of the hidden pie charts are kept
+        if (!data) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        const cube = decodeCube(data);
+        const charts = new Map();
+        for (const chart of sectionCharts(cube, kind, filter, normalizeSelection(project, severity, csp, subscription), normalizeWindow(cube, dateRange, granularity))) {
+            charts.set(chart.id, chart);
+        }
+        const figures = graphIds.map(graphId => charts.has(graphId) ? {data: charts.get(graphId).data, layout: charts.get(graphId).layout} : window.dash_clientside.no_update);
+        if (kind === 'line') {
+            return figures;
+        }
+        return figures.concat(graphIds.map(graphId => pieChartStyle(charts.has(graphId))));
+    }
+
+    function updateDropdowns(project, csp, data) {
+        // update the Subscription ID and Severity drop down menus with the values of the selected projects and resource platform, like update_dropdowns
+        if (!data) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        const cube = decodeCube(data);
+        const projects = normalizeSelection(project, null, null, null)[0];
+        const tests = [];
+        if (!projects.includes('All Projects')) {
+            tests.push([cube.dimensions['Project Names'].codes, projectRows(cube, projects)]);
+        }
+        if (csp !== 'All Resource Platforms') {
+            tests.push([cube.dimensions['Resource Platform'].codes, valueRows(cube, 'Resource Platform', csp)]);
+        }
+        const rows = filterRows(cube, tests);
+        const options = (column, all) => {
+            // the values of the rows in the order they appear
+            const codes = cube.dimensions[column].codes;
+            const seen = new Set();
+            for (const row of rows) {
+                if (codes[row] >= 0) {
+                    seen.add(codes[row]);
+                }
+            }
+            return [{label: all, value: all}].concat(Array.from(seen, code => ({label: cube.dimensions[column].values[code], value: cube.dimensions[column].values[code]})));
+        };
+        const subscriptionOptions = options('Subscription ID', 'All Subscriptions');
+        const severityOptions = options('Severity', 'All Severities');
+        // Keep the selected values when a new issue cube arrives (page load or reloaded report)
+        const triggered = (window.dash_clientside.callback_context.triggered || []).map(trigger => trigger.prop_id);
+        if (triggered.includes('client-cube.data')) {
+            return [window.dash_clientside.no_update, subscriptionOptions, window.dash_clientside.no_update, severityOptions];
+        }
+        return ['All Subscriptions', subscriptionOptions, 'All Severities', severityOptions];
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        wizCharts: {updateSection: updateSection, updateDropdowns: updateDropdowns},
+    });
+})();
@@ -0,0 +1,241 @@
+import argparse
+import glob
+import importlib
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import pandas as pd
+
+# default numbers of issues of the generated reports
+default_rows = [10000, 100000, 1000000]
+
+# a step is a regression when it is slower or uses more memory than the baseline by more than the tolerance
+default_tolerance = 0.25
+
+# differences below these values are noise, they are never flagged
+noise_seconds = 0.005
+noise_bytes = 1024 * 1024
+
+def measure(function, repeat)-> dict:
+    """
+    time a function and measure its peak memory
+    The memory is traced in a separate run, tracemalloc slows down the timed runs otherwise
+
+    Parameters:
+        - function without arguments and number of timed runs
+
+    Returns:
+        - dictionary of the median and minimum wall time in seconds and of the peak of the allocated memory in bytes
+    """
+    tracemalloc.start()
+    function()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {'seconds': statistics.median(timings), 'min_seconds': min(timings), 'peak_bytes': peak_bytes}
+
+def benchmark_selections(issue_report)-> dict:
+    """
+    build representative dropdown selections from the loaded report: everything, one and several projects, a severity and resource platform, a subscription
+
+    Parameters:
+        - issue_report module
+
+    Returns:
+        - dictionary of the selection names and dropdown values
+    """
+    projects = [project for project in issue_report.WIZ_PROJECTS if project != 'All Projects']
+    platforms = [platform for platform in issue_report.RESOURCE_PLATFORMS if platform != 'All Resource Platforms']
+    subscriptions = [subscription for subscription in issue_report.SUBSCRIPTON_IDS if subscription != 'All Subscriptions']
+    selections = {'all': (['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions')}
+    if projects:
+        selections['one project'] = (projects[:1], 'All Severities', 'All Resource Platforms', 'All Subscriptions')
+        selections['three projects'] = (projects[:3], 'All Severities', 'All Resource Platforms', 'All Subscriptions')
+    if platforms:
+        selections['severity and platform'] = (['All Projects'], 'HIGH', platforms[0], 'All Subscriptions')
+    if subscriptions:
+        selections['subscription'] = (['All Projects'], 'All Severities', 'All Resource Platforms', subscriptions[0])
+    return selections
+
+def benchmark_report(report, repeat)-> dict:
+    """
+    load the dashboard on a report and measure the load of the report and the computation of the charts
+    It runs in its own process (see run_benchmark) so the startup and the memory of every report are measured from scratch
+
+    Parameters:
+        - path of the issue report and number of timed runs of every step
+
+    Returns:
+        - dictionary of the number of issues and of the measures of every step
+    """
+    # remove the cache of a previous run, the startup always parses the CSV file
+    for cache_file in glob.glob(glob.escape(report) + '.cache*'):
+        os.remove(cache_file)
+
+    os.environ['WIZ_ISSUE_REPORT'] = report
+    start = time.perf_counter()
+    issue_report = importlib.import_module('issue_report')
+    startup_seconds = time.perf_counter() - start
+    # the startup runs once, its peak memory is the peak resident memory of the process
+    steps = {'startup': {'seconds': startup_seconds, 'min_seconds': startup_seconds, 'peak_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}}
+    if issue_report.issue_report_cache:
+        for cache_file in glob.glob(glob.escape(report + issue_report.issue_report_cache) + '*'):
+            os.remove(cache_file)
+
+    # load of the report
+    raw = pd.read_csv(report, usecols=issue_report.report_columns)
+    steps['read_csv'] = measure(lambda: pd.read_csv(report, usecols=issue_report.report_columns), repeat)
+    steps['normalize_datetime'] = measure(lambda: (issue_report.normalize_datetime(raw['Created At']), issue_report.normalize_datetime(raw['Resolved Time'])), repeat)
+    steps['load_issue_report'] = measure(lambda: issue_report.load_issue_report(report), repeat)
+    issues = issue_report.add_source_report(issue_report.load_issue_report(report), report)
+    steps['build_issue_cube'] = measure(lambda: issue_report.build_issue_cube(issues), repeat)
+
+    # charts and dropdowns of every selection
+    for name, selection in benchmark_selections(issue_report).items():
+        selected_project = issue_report.normalize_selection(*selection)[0]
+        cube = issue_report.filter_issue_cube(issue_report.ISSUE_CUBE, *issue_report.normalize_selection(*selection))
+        # every chart of the page without the figure cache, the query backend filters and adds up the rows of every section
+        steps[f'filter_charts [{name}]'] = measure(lambda: issue_report.filter_charts(*issue_report.normalize_selection(*selection)), repeat)
+        steps[f'daily counts [{name}]'] = measure(lambda: [issue_report.line_chart_counts(cube, filter, selected_project) for filter in issue_report.line_chart_filters]
+                                                   + [issue_report.pie_chart_counts(cube, filter) for filter in issue_report.pie_chart_filters], repeat)
+
+        # charts of the last quarter by week computed from the daily counts, what a change of the date range or of the granularity costs
+        window = (issue_report.DATASET_DAYS[1] - 90, issue_report.DATASET_DAYS[1], 'Week')
+        line_counts = {filter: issue_report.line_chart_counts(cube, filter, selected_project) for filter in issue_report.line_chart_filters}
+        pie_counts = {filter: issue_report.pie_chart_counts(cube, filter) for filter in issue_report.pie_chart_filters if filter != 'Status'}
+        all_counts = issue_report.all_issues_counts(cube)
+
+        def date_range_charts():
+            all_line = issue_report.all_issues_line(all_counts, window)
+            return ([issue_report.line_chart(counts, filter, all_line, window) for filter, counts in line_counts.items()]
+                    + [issue_report.filter_pie_charts(counts, filter, selected_project, window) for filter, counts in pie_counts.items()])
+        steps[f'date range charts [{name}]'] = measure(date_range_charts, repeat)
+
+        # the section callbacks of the page, called without the digests of displayed charts so they return every chart
+        def update_sections():
+            return [callback(*selection) for callback in issue_report.SECTION_CALLBACKS.values()]
+
+        def update_sections_cold():
+            issue_report.FIGURE_CACHE.clear()
+            return update_sections()
+        steps[f'update sections [{name}]'] = measure(update_sections_cold, repeat)
+        steps[f'update sections cached [{name}]'] = measure(update_sections, repeat)
+        steps[f'compute_charts parallel [{name}]'] = measure(lambda: (issue_report.FIGURE_CACHE.clear(), issue_report.compute_charts(*selection)), repeat)
+        steps[f'update_dropdowns [{name}]'] = measure(lambda: issue_report.update_dropdowns(selection[0], selection[2]), repeat)
+    return {'issues': len(issues), 'steps': steps}
+
+def run_benchmark(report, repeat)-> dict:
+    """
+    benchmark a report in a new Python process
+
+    Parameters:
+        - path of the issue report and number of timed runs of every step
+
+    Returns:
+        - result of benchmark_report
+    """
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', report, '--repeat', str(repeat)],
+                            check=True, stdout=subprocess.PIPE, text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    # the dashboard prints messages while loading, the result is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+def compare_results(results, baseline, tolerance)-> list:
+    """
+    compare the results with a saved baseline
+
+    Parameters:
+        - results and baseline of the benchmark and tolerated increase (0.25 for 25%)
+
+    Returns:
+        - list of the regressions, as (report, step, measure, baseline value, new value)
+    """
+    regressions = []
+    for report, result in results['reports'].items():
+        baseline_steps = baseline['reports'].get(report, {}).get('steps', {})
+        for step, measures in result['steps'].items():
+            if step not in baseline_steps:
+                continue
+            for measure_name, noise in (('seconds', noise_seconds), ('peak_bytes', noise_bytes)):
+                before, after = baseline_steps[step][measure_name], measures[measure_name]
+                if after > before * (1 + tolerance) and after - before > noise:
+                    regressions.append((report, step, measure_name, before, after))
+    return regressions
+
+def print_results(results, baseline):
+    """
+    print the measures of every step, next to the baseline when there is one
+    """
+    for report, result in results['reports'].items():
+        print(f"\n{report} ({result['issues']} issues)")
+        baseline_steps = (baseline or {}).get('reports', {}).get(report, {}).get('steps', {})
+        for step, measures in result['steps'].items():
+            line = f"  {step:<55} {measures['seconds'] * 1000:10.1f} ms {measures['peak_bytes'] / 1024 / 1024:10.1f} MB"
+            if step in baseline_steps:
+                line += f"   baseline {baseline_steps[step]['seconds'] * 1000:10.1f} ms {baseline_steps[step]['peak_bytes'] / 1024 / 1024:10.1f} MB"
+            print(line)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the load of the Wiz issue report and the computation of the charts')
+    parser.add_argument('--report', nargs='*', default=[], help='issue reports to benchmark, reports are generated when none is given')
+    parser.add_argument('--rows', type=int, nargs='*', default=default_rows, help=f'numbers of issues of the generated reports, defaults: {default_rows}')
+    parser.add_argument('--workdir', default='benchmark_reports', help='directory of the generated reports, they are reused by the next runs')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs of every step, the median is kept')
+    parser.add_argument('--output', default='benchmark_results.json', help='file the results are written to')
+    parser.add_argument('--baseline', help='results of a previous run to compare with, the script exits with an error when a step regressed')
+    parser.add_argument('--save-baseline', metavar='FILE', help='also save the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=default_tolerance, help='tolerated increase of the time and the memory of a step')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(benchmark_report(args.worker, args.repeat)))
+        sys.exit()
+
+    reports = [os.path.abspath(report) for report in args.report]
+    if not reports:
+        os.makedirs(args.workdir, exist_ok=True)
+        for rows in args.rows:
+            report = os.path.abspath(os.path.join(args.workdir, f'issues-{rows}.csv'))
+            if not os.path.exists(report):
+                print(f'generating {report}')
+                subprocess.run([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generate_report.py'), report, '--rows', str(rows)], check=True)
+            reports.append(report)
+
+    results = {
+        'environment': {'python': platform.python_version(), 'pandas': pd.__version__, 'machine': platform.machine(), 'cpus': os.cpu_count()},
+        'repeat': args.repeat,
+        'reports': {},
+    }
+    for report in reports:
+        print(f'benchmarking {report}')
+        results['reports'][os.path.basename(report)] = run_benchmark(report, args.repeat)
+
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as output:
+            json.dump(results, output, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    print_results(results, baseline)
+
+    if baseline:
+        regressions = compare_results(results, baseline, args.tolerance)
+        for report, step, measure_name, before, after in regressions:
+            print(f'REGRESSION {report} {step} {measure_name}: {before:.4g} -> {after:.4g}')
+        if regressions:
+            sys.exit(1)
+        print('\nno regression against the baseline')
@@ -0,0 +1,148 @@
+import argparse
+import numpy as np
+import pandas as pd
+
+# columns of the Wiz issue report, in the order of the export
+report_header = ['Issue ID', 'Title', 'Created At', 'Severity', 'Status', 'Project Names', 'Resource Platform', 'Subscription ID', 'Resource Region', 'Resource Type', 'Resolved Time', 'Description']
+
+# default number of distinct values of the columns, change them with --cardinality Column=N
+default_cardinality = {'Project Names': 20, 'Resource Platform': 5, 'Subscription ID': 50, 'Resource Region': 15, 'Resource Type': 40}
+
+# prefix of the generated values of the columns
+value_prefixes = {'Project Names': 'Project', 'Resource Platform': 'Platform', 'Subscription ID': 'sub', 'Resource Region': 'region', 'Resource Type': 'Type'}
+
+# Resource Platform values used first, like in a real tenant
+known_platforms = ['AWS', 'Azure', 'GCP', 'Kubernetes', 'OCI', 'Alibaba']
+
+# weights of the Severity and Status values
+severity_weights = {'CRITICAL': 0.05, 'HIGH': 0.2, 'MEDIUM': 0.35, 'LOW': 0.3, 'INFORMATIONAL': 0.1}
+status_weights = {'OPEN': 0.45, 'RESOLVED': 0.35, 'IN_PROGRESS': 0.1, 'REJECTED': 0.1}
+
+# number of Wiz Projects of an issue, from no project at all to 4 projects in the 'Project Names' string
+project_count_weights = [0.1, 0.6, 0.2, 0.07, 0.03]
+
+def column_values(column, cardinality)-> np.ndarray:
+    """
+    build the distinct values of a column
+
+    Parameters:
+        - column name and number of distinct values
+
+    Returns:
+        - array of the values
+    """
+    if column == 'Resource Platform':
+        values = known_platforms[:cardinality] + [f'{value_prefixes[column]} {i}' for i in range(len(known_platforms), cardinality)]
+    else:
+        values = [f'{value_prefixes[column]} {i}' for i in range(cardinality)]
+    return np.array(values, dtype=object)
+
+def pick(rng, values, size, empty_rate)-> np.ndarray:
+    """
+    pick random values with a skewed (Zipf like) distribution, a share of the values is left empty like in the reports
+
+    Parameters:
+        - random generator, array of the values, number of rows and share of empty values
+
+    Returns:
+        - array of the picked values
+    """
+    weights = 1 / np.arange(1, len(values) + 1)
+    picked = values[rng.choice(len(values), size=size, p=weights / weights.sum())]
+    picked[rng.random(size) < empty_rate] = ''
+    return picked
+
+def project_names(rng, projects, size)-> np.ndarray:
+    """
+    build the 'Project Names' strings, an issue can belong to several Wiz Projects separated by ', '
+
+    Parameters:
+        - random generator, array of the Wiz Projects and number of rows
+
+    Returns:
+        - array of the 'Project Names' strings
+    """
+    counts = rng.choice(len(project_count_weights), size=size, p=project_count_weights)
+    names = np.full(size, '', dtype=object)
+    for count in range(1, len(project_count_weights)):
+        rows = np.flatnonzero(counts == count)
+        if len(rows) == 0:
+            continue
+        # sorted distinct projects of each row
+        picked = np.sort(np.argsort(rng.random((len(rows), len(projects))), axis=1)[:, :min(count, len(projects))], axis=1)
+        names[rows] = [', '.join(projects[row]) for row in picked]
+    return names
+
+def format_resolved_time(times, anomaly)-> np.ndarray:
+    """
+    format the Resolved Time like the Wiz export: '2023-01-02 03:04:05.678 +0000 UTC', or with the duplicated time zone anomaly '... +0000 +0000'
+
+    Parameters:
+        - DatetimeIndex of the resolved times and mask of the rows with the anomaly
+
+    Returns:
+        - array of the formatted times
+    """
+    formatted = pd.Index(times.strftime('%Y-%m-%d %H:%M:%S.%f')).str[:-3].to_numpy(dtype=object)
+    return np.where(anomaly, formatted + ' +0000 +0000', formatted + ' +0000 UTC')
+
+def generate_chunk(rng, start, size, values, args)-> pd.DataFrame:
+    """
+    generate the rows of a chunk of the report
+
+    Parameters:
+        - random generator, index of the first row, number of rows, distinct values of the columns and command line arguments
+
+    Returns:
+        - dataframe of the rows, with the columns of the export
+    """
+    first_day = pd.Timestamp(args.start, tz='UTC')
+    created = first_day + pd.to_timedelta(rng.integers(0, args.days * 86400000, size=size), unit='ms')
+    status = rng.choice(list(status_weights), size=size, p=list(status_weights.values()))
+    resolved = created + pd.to_timedelta(rng.integers(0, args.resolution_days * 86400000, size=size), unit='ms')
+    resolved_time = format_resolved_time(resolved, rng.random(size) < args.anomaly_rate)
+    resolved_time[~np.isin(status, ['RESOLVED', 'REJECTED'])] = ''
+
+    return pd.DataFrame({
+        'Issue ID': [f'issue-{i:08d}' for i in range(start, start + size)],
+        'Title': 'Synthetic issue',
+        'Created At': created.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
+        'Severity': rng.choice(list(severity_weights), size=size, p=list(severity_weights.values())),
+        'Status': status,
+        'Project Names': project_names(rng, values['Project Names'], size),
+        'Resource Platform': pick(rng, values['Resource Platform'], size, 0.02),
+        'Subscription ID': pick(rng, values['Subscription ID'], size, 0.05),
+        'Resource Region': pick(rng, values['Resource Region'], size, 0.05),
+        'Resource Type': pick(rng, values['Resource Type'], size, 0.02),
+        'Resolved Time': resolved_time,
+        'Description': 'x' * args.description_length,
+    }, columns=report_header)
+
+def generate_report(args):
+    """
+    write a synthetic Wiz issue report in chunks, so reports larger than memory can be generated
+    """
+    rng = np.random.default_rng(args.seed)
+    cardinality = dict(default_cardinality)
+    for setting in args.cardinality:
+        column, count = setting.split('=')
+        cardinality[column] = int(count)
+    values = {column: column_values(column, count) for column, count in cardinality.items()}
+
+    for start in range(0, args.rows, args.chunk_size):
+        chunk = generate_chunk(rng, start, min(args.chunk_size, args.rows - start), values, args)
+        chunk.to_csv(args.output, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic Wiz issue report in csv')
+    parser.add_argument('output', help='path of the generated report')
+    parser.add_argument('--rows', type=int, default=100000, help='number of issues, 100000 by default')
+    parser.add_argument('--cardinality', nargs='*', default=[], metavar='COLUMN=N', help=f'number of distinct values of a column, defaults: {default_cardinality}')
+    parser.add_argument('--days', type=int, default=730, help='number of days the issues are created over')
+    parser.add_argument('--start', default='2022-01-01', help='day of the first issue')
+    parser.add_argument('--resolution-days', type=int, default=90, help='maximum number of days before an issue is resolved')
+    parser.add_argument('--anomaly-rate', type=float, default=0.3, help="share of the Resolved Time values ending with ' +0000 +0000' instead of ' +0000 UTC'")
+    parser.add_argument('--description-length', type=int, default=200, help='length of the Description column, which is not loaded by the dashboard')
+    parser.add_argument('--chunk-size', type=int, default=500000, help='number of rows generated at once')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random generator, the same seed generates the same report')
+    generate_report(parser.parse_args())
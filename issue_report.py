@@ -1,483 +1,2898 @@
 import dash
+import flask
 from dash import html
 from dash import dcc
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
-import random
+import plotly.io as pio
+import argparse
+import base64
+import re
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import queue
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import warnings
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from html import escape
+
+#initialize the issue report. It can also be a glob pattern or a list of paths to load the reports of several tenants in one dashboard
+# the WIZ_ISSUE_REPORT environment variable overrides it, the benchmark uses it to load the generated reports
+issue_report = os.environ.get('WIZ_ISSUE_REPORT', '<put the path of the issue report>')
+
+# number of processes loading the reports in parallel when several reports are loaded, None uses all the cores
+issue_report_workers = None
+
+# suffix added to the path of each issue report for the cache of the parsed report, set it to None to always read the CSV file
+issue_report_cache = '.cache.parquet'
+
+# also compare the content hash of the issue report to validate the cache, size and modification time are always compared
+issue_report_cache_hash = False
+
+# report file, or drop directory of report files, checked for new exports while the app runs. None disables the reload
+issue_report_watch = None
+
+# number of seconds between two checks of issue_report_watch
+issue_report_watch_interval = 60
+
+# number of rows read at once to stream reports larger than memory, None loads the whole report (and uses the cache)
+issue_report_chunk_size = None
+
+# maximum number of sections of charts kept in the figure cache (a line chart or the pie charts of a filter for a dropdown selection), and maximum total size of their charts in bytes
+figure_cache_entries = 512
+figure_cache_bytes = 256 * 1024 * 1024
+
+# engine answering the filters and the aggregations of the charts and the dropdowns: 'pandas' keeps the issue cube in memory,
+# 'sqlite' keeps it in the SQLite file query_backend_path, built from the reports read in chunks, and lets SQLite add up the rows: for reports larger than memory
+query_backend = 'pandas'
+
+# path of the SQLite file of the sqlite query backend, rebuilt when the reports change. The worker processes of a WSGI server share it, shared_dataset_path is not used with it
+query_backend_path = 'wiz_issue_cube.sqlite'
+
+# path of a SQLite file to share the figure cache between the Dash worker processes, None keeps the cache in the memory of each process
+figure_cache_path = None
+
+# directory of the dataset shared by the worker processes of a WSGI server (gunicorn -w 8 issue_report:server), None loads the reports in every process
+# the first process builds the issue cube once and saves its columns in the directory, the other processes map them read-only instead of reading the reports
+shared_dataset_path = None
+
+# number of threads computing the sections of the page in parallel when the whole page is built
+chart_section_workers = 4
+
+# set it to True to compute the charts of every section in a background job (needs the diskcache, multiprocess and psutil packages)
+# the requests of the page return at once, and the job of a section is cancelled when a newer selection arrives from the page, so the page follows the last selection instead of queuing every click
+background_callbacks = False
+
+# directory of the queue of the background jobs (progress and results of the jobs), shared by the worker processes of a WSGI server
+# the jobs run in their own processes, the figure cache is kept in this directory too when figure_cache_path is None
+background_cache_path = 'wiz_background_jobs'
+
+# set it to True to filter the issues and compute the charts in the browser: the page downloads the issue cube once (dictionary encoded, see client_issue_cube)
+# and the clientside callbacks of assets/wiz_charts.js apply the dropdowns, the date range and the granularity without any request to the server
+client_side_filtering = False
+
+# set it to True to time the callbacks and the chart builders and to expose the measures on the /metrics route, in the Prometheus text format
+# the functions are not wrapped at all when it is False
+metrics_enabled = False
+
+# optional file the spans of every callback request are appended to, one JSON line per request (needs metrics_enabled)
+metrics_trace_log = None
 
-#initialize the issue report
-issue_report = '<put the path of the issue report>'
+# mapping of some specific values to color for the pie chart
+wiz_colors = {'OPEN': 'red', 'RESOLVED': 'green','IN_PROGRESS':'orange','INFORMATIONAL':'lightgrey','REJECTED':'darkgrey','LOW': 'lightblue', 'MEDIUM': 'darkorange', 'HIGH': 'red', 'CRITICAL': 'darkred', 'Other': 'silver'}
+
+# maximum number of slices of a pie chart and of lines of a line chart (next to the ALL line), the smallest ones are merged into an 'Other' slice or line. None keeps them all
+chart_top_n = 12
+
+# maximum number of points of a line, longer histories are downsampled before they are sent to the browser. None sends every day
+line_chart_max_points = 400
+
+# set the default selected project
+selected_project = 'All Projects'
+
+# list of use cases for pie charts. These are based on the column names. If you need a new use case for pie charts just add it to the list
+pie_chart_filters = ['Status','Severity','Project Names','Resource Platform', 'Subscription ID', 'Resource Region','Resource Type']
+
+# list of use cases for line charts. These are based on the column names. If you need a new use case for line charts just add it to the list
+line_chart_filters = ['Project Names','Severity','Resource Platform','Subscription ID','Resource Region','Resource Type']
+
+# granularities of the line charts, with the pandas period of each option of the granularity selector
+line_chart_granularities = {'Day': 'D', 'Week': 'W', 'Month': 'M', 'Quarter': 'Q'}
+
+# format of the dates in the Wiz issue report, once the ' UTC' suffix is removed and the time zone joined to the time
+wiz_datetime_format = "%Y-%m-%d %H:%M:%S.%f%z"
+
+# convert  datacolumns to datetime format 
+def normalize_datetime(dates)-> pd.Series:
+    """
+    convert a column of the issue report to UTC datetimes
+    The reports repeat a lot of timestamps, so each distinct value is parsed only once and mapped back to the rows
+
+    Parameters:
+        - column of date strings
+
+    Returns:
+        - column of datetimes, empty or unparsable values are NaT
+    """
+    codes, unique_dates = pd.factorize(dates)
+    # join the time zone of any offset to the time and remove the ' UTC' suffix or the duplicated time zone indication ('+0000 +0000'),
+    # then convert with the explicit (ISO 8601) format
+    cleaned = pd.Series(unique_dates, dtype=object).str.replace(r' ([+-]\d{4})(?: UTC| \1)?$', r'\1', regex=True)
+    parsed = pd.to_datetime(cleaned, format=wiz_datetime_format, errors='coerce', utc=True)
+    # dates in another layout (like the ISO 8601 Created At) go through the generic parser
+    other_layout = parsed.isna() & cleaned.notna() & (cleaned != '')
+    if other_layout.any():
+        parsed[other_layout] = pd.to_datetime(cleaned[other_layout], errors='coerce', utc=True)
+    # map the parsed values back to the rows, missing values (code -1) pick the trailing NaT
+    parsed = pd.DatetimeIndex(parsed).append(pd.DatetimeIndex([pd.NaT], tz='UTC'))
+    return pd.Series(parsed[codes], index=dates.index, name=dates.name)
+
+# column identifying the issues, used to apply a new export on top of the loaded one
+issue_id_column = 'Issue ID'
+
+# columns of the issue report used by the charts and the reload, the other columns are not loaded
+report_columns = [issue_id_column, 'Created At', 'Resolved Time', 'Status', 'Severity', 'Project Names', 'Resource Platform', 'Subscription ID', 'Resource Region', 'Resource Type']
+
+# low cardinality columns, stored as categories
+categorical_columns = ['Status', 'Severity', 'Project Names', 'Resource Platform', 'Subscription ID', 'Resource Region', 'Resource Type']
+
+# default values of the empty cells
+default_values = {'Subscription ID': 'No Subscription', 'Project Names': 'No Project', 'Resource Platform': 'Unknown', 'Resource Type': 'Unknown', 'Resource Region': 'Unknown'}
+
+def normalize_issue_report(df)-> pd.DataFrame:
+    """
+    convert the date columns, fill the empty cells with defaults and store the low cardinality columns as categories
+
+    Parameters:
+        - data frame read from the issue report
+
+    Returns:
+        - normalized data frame
+    """
+    df = df[report_columns].copy()
+    df['Created At'] = normalize_datetime(df['Created At'])
+    df['Resolved Time'] = normalize_datetime(df['Resolved Time'])
+    for column, value in default_values.items():
+        df[column] = df[column].fillna(value=value)
+    for column in categorical_columns:
+        df[column] = df[column].astype('category')
+    return df
+
+def hash_issue_rows(df)-> np.ndarray:
+    """
+    hash the report columns of every issue as read from the CSV file, a new export only has to normalize the issues whose hash changed
+
+    Parameters:
+        - data frame read from the issue report
+
+    Returns:
+        - array of the row hashes
+    """
+    return pd.util.hash_pandas_object(df[report_columns], index=False).to_numpy()
+
+# version of the normalization of the reports, increased when normalize_issue_report parses the reports differently so the caches of the previous versions are rebuilt
+issue_report_cache_version = 2
+
+def issue_report_fingerprint(path)-> dict:
+    """
+    describe the version of the issue report the cache was built from
+
+    Parameters:
+        - path of the issue report
+
+    Returns:
+        - dictionary of the report size, modification time, optional content hash, loaded columns and version of the normalization
+    """
+    stat = os.stat(path)
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'columns': report_columns, 'version': issue_report_cache_version}
+    if issue_report_cache_hash:
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as report:
+            for block in iter(lambda: report.read(1 << 20), b''):
+                sha256.update(block)
+        fingerprint['sha256'] = sha256.hexdigest()
+    return fingerprint
+
+def load_issue_report(path, cache_path=None)-> pd.DataFrame:
+    """
+    load and normalize the issue report
+    When a cache path is given the normalized report is saved as Parquet next to a fingerprint of the CSV file,
+    the next loads read the Parquet file as long as the CSV file did not change.
+    The cache needs the pyarrow package, without it the CSV file is always read.
+
+    Parameters:
+        - path of the issue report and optional path of the cache
+
+    Returns:
+        - normalized data frame, with the Row Hash of every issue
+    """
+    if cache_path:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            warnings.warn('pyarrow is not installed, the issue report cache is disabled')
+            cache_path = None
+    if cache_path:
+        fingerprint = issue_report_fingerprint(path)
+        fingerprint_path = cache_path + '.json'
+        try:
+            with open(fingerprint_path) as fingerprint_file:
+                cache_hit = json.load(fingerprint_file) == fingerprint
+        except (OSError, ValueError):
+            cache_hit = False
+        if cache_hit:
+            return pd.read_parquet(cache_path, columns=report_columns + ['Row Hash'], memory_map=True)
+
+    report = pd.read_csv(path, usecols=report_columns)
+    df = normalize_issue_report(report)
+    df['Row Hash'] = hash_issue_rows(report)
+
+    if cache_path:
+        # write the fingerprint last so an interrupted write never validates a partial cache
+        # the files are written under a name of the process and replace the previous ones at once, the processes starting together
+        # (WSGI workers, parallel loads) read a whole cache or none, never the half written file of another process
+        building_path = f'{cache_path}.{os.getpid()}'
+        df.to_parquet(building_path, index=False)
+        os.replace(building_path, cache_path)
+        with open(building_path, 'w') as fingerprint_file:
+            json.dump(fingerprint, fingerprint_file)
+        os.replace(building_path, fingerprint_path)
+    return df
+
+# column naming the report each issue comes from
+source_report_column = 'Source Report'
+
+def issue_report_paths(reports)-> list:
+    """
+    helper to list the report files of issue_report
+
+    Parameters:
+        - path, glob pattern or list of them
+
+    Returns:
+        - list of the report files, from the oldest to the most recent
+    """
+    if isinstance(reports, str):
+        reports = [reports]
+    paths = []
+    for report in reports:
+        paths += sorted(glob.glob(report)) if glob.has_magic(report) else [report]
+    return sorted(paths, key=os.path.getmtime)
+
+def add_source_report(df, path)-> pd.DataFrame:
+    """
+    helper to name the issues after the report they come from, in the Source Report column
+
+    Parameters:
+        - data frame of the issues and path of their report
+
+    Returns:
+        - data frame with the Source Report column
+    """
+    df[source_report_column] = pd.Categorical.from_codes(np.zeros(len(df), dtype='int8'), [os.path.basename(path)])
+    return df
+
+def load_source_report(path)-> pd.DataFrame:
+    """
+    load one issue report, with its cache, and add its Source Report
+
+    Parameters:
+        - path of the issue report
+
+    Returns:
+        - normalized data frame
+    """
+    cache_path = path + issue_report_cache if issue_report_cache else None
+    return add_source_report(load_issue_report(path, cache_path), path)
+
+def process_item(function, index, item, results):
+    """
+    helper run by the forked processes of map_forked, it sends the result (or the error) of the function back to the parent process
+    """
+    try:
+        results.put((index, function(item), None))
+    except Exception as error:
+        results.put((index, None, error))
+
+# seconds map_forked waits for a result before checking that its processes are still alive
+map_forked_poll_interval = 1
+
+def map_forked(function, items, workers=None)-> list:
+    """
+    run a function on every item, in up to workers forked processes when there are several items
+    The processes are forked, so the function is not pickled: it can be a lambda, and the reports can be loaded while the module is imported.
+    Without fork (Windows) the items are processed one after the other
+
+    Parameters:
+        - function taking one item, list of items and maximum number of processes (None uses all the cores)
+
+    Returns:
+        - list of the results, in the order of the items
+    """
+    if len(items) == 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return [function(item) for item in items]
+    context = multiprocessing.get_context('fork')
+    workers = min(len(items), workers or os.cpu_count())
+    results = context.Queue()
+    pending = list(enumerate(items))
+    processes = {}
+    outputs = {}
+    while len(outputs) < len(items):
+        # start a process per item, up to the number of workers running at the same time
+        while pending and len(processes) - len(outputs) < workers:
+            index, item = pending.pop(0)
+            processes[index] = context.Process(target=process_item, args=(function, index, item, results))
+            processes[index].start()
+        try:
+            index, output, error = results.get(timeout=map_forked_poll_interval)
+        except queue.Empty:
+            # a process killed (out of memory, signal) never reports, its item would be waited for forever
+            # a process which reported has put its result in the queue before exiting, only a failed exit code without result is an error
+            dead = [index for index, process in processes.items() if index not in outputs and process.exitcode not in (None, 0)]
+            if not dead:
+                continue
+            output, error = None, RuntimeError(f'the process of {items[dead[0]]!r} exited with code {processes[dead[0]].exitcode} without a result')
+        if error is not None:
+            for process in processes.values():
+                process.terminate()
+            raise error
+        outputs[index] = output
+    for process in processes.values():
+        process.join()
+    return [outputs[index] for index in range(len(items))]
+
+def concat_issues(frames)-> pd.DataFrame:
+    """
+    helper to concatenate data frames of issues, keeping the categorical columns as categories
+
+    Parameters:
+        - list of data frames of issues
+
+    Returns:
+        - data frame of all the issues
+    """
+    issues = pd.concat(frames, ignore_index=True)
+    for column in frames[0].columns:
+        if isinstance(frames[0][column].dtype, pd.CategoricalDtype):
+            combined = pd.api.types.union_categoricals([pd.Categorical(frame[column]) for frame in frames], ignore_order=True)
+            issues[column] = pd.Series(combined, index=issues.index)
+    return issues
+
+def load_issue_reports(paths)-> pd.DataFrame:
+    """
+    load the issue reports in parallel and merge them
+    An issue found in several reports is kept from the most recent report
+
+    Parameters:
+        - list of the report files, from the oldest to the most recent
+
+    Returns:
+        - normalized data frame of the issues of all the reports
+    """
+    frames = map_forked(load_source_report, paths, issue_report_workers)
+    if len(frames) == 1:
+        return frames[0]
+    return concat_issues(frames).drop_duplicates(issue_id_column, keep='last', ignore_index=True)
+
+# list of the report files to load
+issue_report_files = issue_report_paths(issue_report)
+
+# read the data from the issue reports, or from their cache when the reports did not change
+# the issues are not kept in memory when the reports are streamed or when the workers share the dataset
+origin_df = None if issue_report_chunk_size or shared_dataset_path or query_backend == 'sqlite' else load_issue_reports(issue_report_files)
+
+# statuses of the resolved issues, their Resolved Time is used in the line charts
+resolved_statuses = ['RESOLVED', 'REJECTED']
+
+# statuses of the Wiz issues, the page has a pie chart of each filter for each status
+wiz_statuses = ['OPEN', 'IN_PROGRESS', 'RESOLVED', 'REJECTED']
+
+# columns the issue cube counts the issues by, next to the day
+cube_dimensions = ['Status', 'Severity', 'Project Names', 'Resource Platform', 'Subscription ID', 'Resource Region', 'Resource Type', source_report_column]
+
+def build_issue_cube(df)-> pd.DataFrame:
+    """
+    pre-aggregate the issues so the charts and the dropdowns never scan the issues again
+    The cube has one row per combination of cube_dimensions and Day with
+        - Created: number of issues created that day
+        - Resolved: number of issues resolved (or rejected) that day
+    Projects are counted through the Project Names value, so an issue belonging to several projects is counted once
+
+    Parameters:
+        - data frame of the issues
+
+    Returns:
+        - data frame of the cube
+    """
+    # group by the integer codes of the dimensions and of the days, empty values are regular codes (-1 and NaT)
+    categories = {column: pd.Categorical(df[column]) for column in cube_dimensions}
+    keys = pd.DataFrame({column: values.codes for column, values in categories.items()})
+    resolved_rows = (df['Status'].isin(resolved_statuses) & df['Resolved Time'].notna()).to_numpy()
+
+    keys['Day'] = pd.DatetimeIndex(df['Created At']).floor('D').asi8
+    created = keys.groupby(list(keys.columns), sort=False).size()
+    keys['Day'] = pd.DatetimeIndex(df['Resolved Time']).floor('D').asi8
+    resolved = keys[resolved_rows].groupby(list(keys.columns), sort=False).size()
+
+    # keep the created rows first, in order of appearance, so the values of the cube appear in the order of the issues
+    cube_index = created.index.append(resolved.index[~resolved.index.isin(created.index)])
+    cube = cube_index.to_frame(index=False)
+    cube['Created'] = created.reindex(cube_index, fill_value=0).to_numpy(dtype='int32')
+    cube['Resolved'] = resolved.reindex(cube_index, fill_value=0).to_numpy(dtype='int32')
+    return decode_issue_cube(cube, categories)
+
+def decode_issue_cube(cube, categories)-> pd.DataFrame:
+    """
+    helper to turn the integer codes of a cube grouped by codes back into categories and days
+
+    Parameters:
+        - cube of codes and the categories of each dimension
+
+    Returns:
+        - data frame of the cube
+    """
+    for column, values in categories.items():
+        cube[column] = pd.Categorical.from_codes(cube[column], values.categories)
+    cube['Day'] = pd.to_datetime(cube['Day'], utc=True)
+    return cube
+
+def merge_issue_cubes(cubes)-> pd.DataFrame:
+    """
+    add up the issue cubes built from different parts of the issues
+    The rows of the first cubes come first, so the values of the merged cube still appear in the order of the issues
+
+    Parameters:
+        - list of issue cubes
+
+    Returns:
+        - data frame of the merged cube
+    """
+    cube = pd.concat(cubes, ignore_index=True)
+    categories = {column: pd.Categorical(cube[column]) for column in cube_dimensions}
+    keys = [pd.Series(values.codes, name=column) for column, values in categories.items()]
+    keys.append(pd.Series(pd.DatetimeIndex(cube['Day']).asi8, name='Day'))
+    counts = cube[['Created', 'Resolved']].groupby(keys, sort=False).sum()
+    merged = counts.index.to_frame(index=False)
+    merged['Created'] = counts['Created'].to_numpy(dtype='int32')
+    merged['Resolved'] = counts['Resolved'].to_numpy(dtype='int32')
+    return decode_issue_cube(merged, categories)
+
+def stream_issue_cube(path, chunk_size)-> pd.DataFrame:
+    """
+    build the issue cube from a report larger than memory
+    The report is read in chunks of chunk_size rows, each chunk is normalized and folded into the cube,
+    so the memory used depends on the chunk size and on the size of the cube, not on the size of the report
+
+    Parameters:
+        - path of the issue report and number of rows per chunk
+
+    Returns:
+        - data frame of the cube
+    """
+    cube = None
+    for chunk in pd.read_csv(path, usecols=report_columns, chunksize=chunk_size):
+        chunk_cube = build_issue_cube(add_source_report(normalize_issue_report(chunk), path))
+        cube = chunk_cube if cube is None else merge_issue_cubes([cube, chunk_cube])
+    return cube
+
+def stream_issue_cubes(paths)-> pd.DataFrame:
+    """
+    build the issue cube of several reports larger than memory
+    An issue found in several reports is kept from the most recent report, like load_issue_reports: the issues are staged in a temporary SQLite file
+    keyed on the Issue ID (see sqlite_issue_chunks), then read back in chunks and folded into the cube
+
+    Parameters:
+        - list of the report files, from the oldest to the most recent
+
+    Returns:
+        - data frame of the cube
+    """
+    if len(paths) == 1:
+        return stream_issue_cube(paths[0], issue_report_chunk_size)
+    with tempfile.TemporaryDirectory(prefix='wiz-issue-report-') as staging_directory:
+        db = sqlite3.connect(os.path.join(staging_directory, 'staged_issues.sqlite'))
+        try:
+            cube = None
+            for issues in sqlite_issue_chunks(db, paths):
+                chunk_cube = build_issue_cube(issues)
+                cube = chunk_cube if cube is None else merge_issue_cubes([cube, chunk_cube])
+        finally:
+            db.close()
+    return cube
+
+def dataset_fingerprint(cube)-> str:
+    """
+    fingerprint of the loaded data, the figure cache only returns charts computed from the same data
+    The hashes of the rows are sorted first, so a cube reloaded incrementally and the cube of the same report loaded from scratch have the same fingerprint
+    in every worker process, whatever the order of their rows
+
+    Parameters:
+        - issue cube
+
+    Returns:
+        - hexadecimal digest of the cube content
+    """
+    return hashlib.sha256(np.sort(pd.util.hash_pandas_object(cube, index=False).to_numpy()).tobytes()).hexdigest()[:16]
+
+def report_signature(path)-> tuple:
+    """
+    helper to detect a new or modified report
+
+    Parameters:
+        - path of the report
+
+    Returns:
+        - tuple of the path, size and modification time of the report (None when it does not exist)
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+def lock_file(file, exclusive):
+    """
+    helper to lock a file shared by the worker processes: exclusive to build a dataset, shared to read it
+    fcntl only exists on Unix, the WSGI servers of Windows run in a single process so the lock is not needed there
+
+    Parameters:
+        - open file and True for an exclusive lock
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return
+    fcntl.flock(file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+def save_shared_dataset(cube, directory, sources):
+    """
+    save the issue cube in the shared dataset directory, one .npy file per column so the workers can map the columns without parsing them
+    Each version of the dataset has its own directory named after its fingerprint, current.json points to the version to map
+
+    Parameters:
+        - issue cube, shared dataset directory and signatures of the reports the cube was built from
+    """
+    fingerprint = dataset_fingerprint(cube)
+    version_path = os.path.join(directory, fingerprint)
+    if not os.path.isdir(version_path):
+        # write the version in a temporary directory first, the workers never see a partial version
+        building_path = tempfile.mkdtemp(prefix='.building-', dir=directory)
+        os.chmod(building_path, 0o755)
+        categories = {}
+        for column in cube_dimensions:
+            # the codes keep the smallest integer type of the categories, so the mapped codes are used as they are
+            np.save(os.path.join(building_path, f'{column}.npy'), cube[column].cat.codes.to_numpy())
+            categories[column] = list(cube[column].cat.categories)
+        np.save(os.path.join(building_path, 'Day.npy'), pd.DatetimeIndex(cube['Day']).asi8)
+        np.save(os.path.join(building_path, 'counts.npy'), cube[['Created', 'Resolved']].to_numpy(dtype='int32'))
+        with open(os.path.join(building_path, 'manifest.json'), 'w') as manifest_file:
+            json.dump({'fingerprint': fingerprint, 'rows': len(cube), 'categories': categories}, manifest_file)
+        os.rename(building_path, version_path)
+
+    current_path = os.path.join(directory, 'current.json')
+    with open(current_path + '.tmp', 'w') as current_file:
+        json.dump({'version': fingerprint, 'sources': sources}, current_file)
+    os.replace(current_path + '.tmp', current_path)
+
+    # remove the previous versions, the processes still mapping them keep their files until they map the new version
+    for entry in os.listdir(directory):
+        if entry != fingerprint and not entry.startswith('.') and os.path.isdir(os.path.join(directory, entry)):
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
+
+def map_shared_dataset(directory)-> tuple:
+    """
+    map the current version of the shared dataset read-only
+    The columns of the cube are views of the mapped files: the pages are read from the disk once and shared by all the processes
+
+    Parameters:
+        - shared dataset directory
+
+    Returns:
+        - tuple of the issue cube and of its fingerprint
+    """
+    with open(os.path.join(directory, 'current.json')) as current_file:
+        version_path = os.path.join(directory, json.load(current_file)['version'])
+    with open(os.path.join(version_path, 'manifest.json')) as manifest_file:
+        manifest = json.load(manifest_file)
+
+    # the frames are built and concatenated without copy, inserting a column would copy it
+    dimensions = {column: pd.Categorical.from_codes(np.load(os.path.join(version_path, f'{column}.npy'), mmap_mode='r'), manifest['categories'][column]) for column in cube_dimensions}
+    days = np.load(os.path.join(version_path, 'Day.npy'), mmap_mode='r').view('datetime64[ns]')
+    dimensions['Day'] = pd.arrays.DatetimeArray(days, dtype=pd.DatetimeTZDtype(tz='UTC'), copy=False)
+    # Created and Resolved are stored as one (rows, 2) array, pandas keeps it as a single block
+    counts = pd.DataFrame(np.load(os.path.join(version_path, 'counts.npy'), mmap_mode='r'), columns=['Created', 'Resolved'], copy=False)
+    cube = pd.concat([pd.DataFrame(dimensions, copy=False), counts], axis=1, copy=False)
+    return cube, manifest['fingerprint']
+
+def shared_dataset_built(directory, sources)-> bool:
+    """
+    helper to check that the current version of the shared dataset was built from the reports of the signatures
+    """
+    try:
+        with open(os.path.join(directory, 'current.json')) as current_file:
+            return json.load(current_file)['sources'] == sources
+    except (OSError, ValueError, KeyError):
+        return False
+
+def load_shared_dataset(directory, paths)-> tuple:
+    """
+    map the shared dataset of the reports, it is built from the reports when it is missing or when the reports changed
+    The processes take a lock on the directory: they check and map the dataset under a shared lock, the first one finding it missing or outdated
+    builds it under an exclusive lock while the other ones wait for it. A version is removed by a build, never while a process is mapping it
+
+    Parameters:
+        - shared dataset directory and list of the report files
+
+    Returns:
+        - tuple of the issue cube and of its fingerprint
+    """
+    os.makedirs(directory, exist_ok=True)
+    sources = [list(report_signature(path)) for path in paths]
+    with open(os.path.join(directory, '.lock'), 'w') as dataset_lock:
+        lock_file(dataset_lock, exclusive=False)
+        if not shared_dataset_built(directory, sources):
+            # the shared lock is released while waiting for the exclusive one, another process may have built the dataset in the meantime
+            lock_file(dataset_lock, exclusive=True)
+            if not shared_dataset_built(directory, sources):
+                cube = stream_issue_cubes(paths) if issue_report_chunk_size else build_issue_cube(load_issue_reports(paths))
+                save_shared_dataset(cube, directory, sources)
+        # the mapped files stay readable once mapped, even after a later build removed their version
+        return map_shared_dataset(directory)
+
+# number of nanoseconds in a day, the days of the date ranges and of the daily counts are day numbers (days since 1970-01-01)
+nanoseconds_per_day = 86400 * 10**9
+
+# index of the Wiz Projects of every Project Names value. Main challenge is Project Names column can contain multiple projects
+def build_project_membership(df)-> pd.DataFrame:
+    """
+    helper to build the project membership index out of the Project Names column
+    Each distinct Project Names value is split only once, project filters and per project counts
+    are then vectorized lookups in this index instead of splitting the Project Names of every issue
+
+    Parameters:
+        - data frame
+
+    Returns:
+        - data frame with one row per (Project Names, Project) pair
+    """
+    membership = pd.DataFrame({'Project Names': df['Project Names'].unique()})
+    membership['Project'] = membership['Project Names'].str.split(', ')
+    return membership.explode('Project').drop_duplicates().reset_index(drop=True)
+
+class PandasQueryBackend:
+    """
+    filters and aggregations of the issue cube kept in memory (or mapped from the shared dataset), with pandas
+    The chart builders add up the rows themselves, so the filtered rows are returned at the granularity of the cube
+    """
+
+    def __init__(self, cube, fingerprint):
+        """
+        Parameters:
+            - issue cube and its fingerprint
+        """
+        self.cube = cube
+        self.fingerprint = fingerprint
+
+    def daily_rows(self, selection, columns)-> pd.DataFrame:
+        """
+        rows of the issues of a selection with the created and resolved issues by day, for the chart builders
+
+        Parameters:
+            - normalized dropdown values and the columns the rows are grouped by next to the day
+
+        Returns:
+            - data frame with the columns, Day, Created and Resolved, the values appear in the order of the issues
+        """
+        return filter_issue_cube(self.cube, *selection)
+
+    def distinct_values(self, columns, selection=None)-> dict:
+        """
+        distinct values of columns, in the order they appear in the issues
+
+        Parameters:
+            - list of column names and optional normalized dropdown values, all the issues by default
+
+        Returns:
+            - dictionary of column -> list of values
+        """
+        df = self.cube if selection is None else filter_issue_cube(self.cube, *selection)
+        return {column: list(df[column].unique()) for column in columns}
+
+    def day_range(self)-> tuple:
+        """
+        first and last day of the issues, as day numbers
+        """
+        return dataset_days(self.cube)
+
+    def project_membership(self)-> pd.DataFrame:
+        """
+        project membership index of the Project Names values, see build_project_membership
+        """
+        return build_project_membership(self.cube)
+
+    def issue_cube(self)-> pd.DataFrame:
+        """
+        the whole issue cube
+        """
+        return self.cube
+
+class SQLiteQueryBackend:
+    """
+    filters and aggregations of the issue cube stored in a SQLite file, so the reports and the cube do not have to fit in memory
+    The issue_cube table has one row per combination of cube_dimensions and day (day number), in the order of the issues (rowid). The filter columns are indexed
+    and the project_membership table spreads the Project Names values over their Wiz Projects. The rows are added up by SQLite, only the aggregated rows are loaded
+    """
+
+    def __init__(self, path):
+        """
+        Parameters:
+            - path of the SQLite file, see build_sqlite_cube
+        """
+        self.path = path
+        self.local = threading.local()
+        self.fingerprint = self.connect().execute('SELECT fingerprint FROM dataset').fetchone()[0]
+
+    def connect(self):
+        """
+        open the SQLite file read-only, once per thread so the sections are queried in parallel, and again in a forked process
+        """
+        if getattr(self.local, 'pid', None) != os.getpid():
+            self.local.db = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, check_same_thread=False)
+            self.local.pid = os.getpid()
+        return self.local.db
+
+    def where(self, selection)-> tuple:
+        """
+        helper to turn normalized dropdown values into the WHERE clause of a query, like filter_issue_cube
+
+        Parameters:
+            - normalized dropdown values, or None for all the issues
+
+        Returns:
+            - tuple of the clause and of its parameters
+        """
+        if selection is None:
+            return '', []
+        selected_project, selected_severity, selected_csp, selected_subscription = selection
+        conditions, parameters = [], []
+        # the projects are looked up in the project membership table, an issue belonging to several selected projects is kept once
+        if 'All Projects' not in selected_project:
+            conditions.append(f'"Project Names" IN (SELECT project_names FROM project_membership WHERE project IN ({", ".join("?" * len(selected_project))}))')
+            parameters += list(selected_project)
+        for column, value, all_values in (('Severity', selected_severity, 'All Severities'), ('Resource Platform', selected_csp, 'All Resource Platforms'),
+                                          ('Subscription ID', selected_subscription, 'All Subscriptions')):
+            if value != all_values:
+                values = [value] if isinstance(value, str) else value
+                conditions.append(f'"{column}" IN ({", ".join("?" * len(values))})')
+                parameters += values
+        return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), parameters
+
+    def daily_rows(self, selection, columns)-> pd.DataFrame:
+        """
+        created and resolved issues of a selection by day and by the values of columns, added up by SQLite
+        The groups are sorted by their first row, so the values appear in the order of the issues like in the issue cube
+
+        Parameters:
+            - normalized dropdown values and the columns the rows are grouped by next to the day
+
+        Returns:
+            - data frame with the columns, Day, Created and Resolved
+        """
+        where, parameters = self.where(selection)
+        keys = ''.join(f'"{column}", ' for column in columns)
+        query = f'SELECT {keys}day AS "Day", SUM(created) AS "Created", SUM(resolved) AS "Resolved" FROM issue_cube{where} GROUP BY {keys}day ORDER BY MIN(rowid)'
+        rows = pd.read_sql_query(query, self.connect(), params=parameters)
+        rows['Day'] = pd.to_datetime(rows['Day'].astype('float64'), unit='D', utc=True)
+        rows[['Created', 'Resolved']] = rows[['Created', 'Resolved']].astype('int64')
+        return rows
+
+    def distinct_values(self, columns, selection=None)-> dict:
+        """
+        distinct values of columns, in the order they appear in the issues
+
+        Parameters:
+            - list of column names and optional normalized dropdown values, all the issues by default
+
+        Returns:
+            - dictionary of column -> list of values
+        """
+        where, parameters = self.where(selection)
+        db = self.connect()
+        return {column: [value for value, in db.execute(f'SELECT "{column}" FROM issue_cube{where} GROUP BY "{column}" ORDER BY MIN(rowid)', parameters)]
+                for column in columns}
+
+    def day_range(self)-> tuple:
+        """
+        first and last day of the issues, as day numbers
+        """
+        first_day, last_day = self.connect().execute('SELECT MIN(day), MAX(day) FROM issue_cube').fetchone()
+        if first_day is None:
+            return 0, 0
+        return first_day, last_day
+
+    def project_membership(self)-> pd.DataFrame:
+        """
+        project membership index of the Project Names values, see build_project_membership
+        """
+        return pd.read_sql_query('SELECT project_names AS "Project Names", project AS "Project" FROM project_membership ORDER BY rowid', self.connect())
+
+    def issue_cube(self)-> pd.DataFrame:
+        """
+        the whole issue cube loaded in memory, like build_issue_cube (the client side filtering mode sends it to the browser)
+        """
+        keys = ', '.join(f'"{column}"' for column in cube_dimensions)
+        cube = pd.read_sql_query(f'SELECT {keys}, day AS "Day", created AS "Created", resolved AS "Resolved" FROM issue_cube ORDER BY rowid', self.connect())
+        for column in cube_dimensions:
+            cube[column] = pd.Categorical(cube[column])
+        cube['Day'] = pd.to_datetime(cube['Day'].astype('float64'), unit='D', utc=True)
+        cube[['Created', 'Resolved']] = cube[['Created', 'Resolved']].astype('int32')
+        return cube
+
+# number of rows of the reports read at once to build the SQLite file of the sqlite query backend when issue_report_chunk_size is None
+sqlite_chunk_size = 100000
+
+def sqlite_rows(df, columns)-> zip:
+    """
+    helper to turn the rows of a data frame into SQLite rows: the dates become day numbers, None for the empty values
+
+    Parameters:
+        - data frame (issue cube or issues) and list of the columns of the rows
+
+    Returns:
+        - iterator of the rows
+    """
+    values = []
+    for column in columns:
+        if pd.api.types.is_datetime64_any_dtype(df[column]):
+            days = pd.DatetimeIndex(df[column])
+            values.append(pd.Series(days.asi8 // nanoseconds_per_day, dtype=object).where(~days.isna(), None).tolist())
+        else:
+            values.append(df[column].astype(object).where(df[column].notna(), None).tolist())
+    return zip(*values)
+
+# columns of the issues of several reports staged in the SQLite file while it is built, the dates are stored as day numbers since the cube counts the issues by day
+staged_issue_columns = report_columns + [source_report_column]
+
+def sqlite_issue_chunks(db, paths)-> iter:
+    """
+    read the normalized issues of the reports in chunks to build the SQLite file, with bounded memory
+    An issue found in several reports is kept from the most recent report, like load_issue_reports: the issues of several reports are first staged
+    in a table keyed on the Issue ID, the reports are inserted from the oldest to the most recent so the most recent issue replaces the previous ones
+
+    Parameters:
+        - connection of the SQLite file being built and list of the report files, from the oldest to the most recent
+
+    Returns:
+        - iterator of data frames of normalized issues, with their Source Report
+    """
+    chunk_size = issue_report_chunk_size or sqlite_chunk_size
+    chunks = ((report, chunk) for report in paths for chunk in pd.read_csv(report, usecols=report_columns, chunksize=chunk_size))
+    if len(paths) == 1:
+        for report, chunk in chunks:
+            yield add_source_report(normalize_issue_report(chunk), report)
+        return
+
+    keys = ', '.join(f'"{column}"' for column in staged_issue_columns)
+    db.execute(f'CREATE TABLE staged_issues ({keys}, PRIMARY KEY ("{issue_id_column}"))')
+    insert = f'INSERT OR REPLACE INTO staged_issues VALUES ({", ".join("?" * len(staged_issue_columns))})'
+    for report, chunk in chunks:
+        db.executemany(insert, sqlite_rows(add_source_report(normalize_issue_report(chunk), report), staged_issue_columns))
+    # a replaced issue gets a new rowid, the issues are read in the order of the concatenated reports without the replaced ones
+    for issues in pd.read_sql_query(f'SELECT {keys} FROM staged_issues ORDER BY rowid', db, chunksize=chunk_size):
+        for column in ['Created At', 'Resolved Time']:
+            issues[column] = pd.to_datetime(issues[column].astype('float64'), unit='D', utc=True)
+        yield issues
+    db.execute('DROP TABLE staged_issues')
+
+def build_sqlite_cube(path, paths, sources):
+    """
+    build the SQLite file of the sqlite query backend from the reports, with bounded memory
+    The reports are read in chunks (see sqlite_issue_chunks), the cube of every chunk is appended to a staging table and SQLite adds up the rows of the same
+    dimensions and day (sorting on disk), so the memory used depends on the chunk size and not on the size of the reports or of the cube
+
+    Parameters:
+        - path of the SQLite file, list of the report files and signatures of the reports
+    """
+    # the file is built next to the previous one and replaces it at once, the processes still reading the previous file keep it until they open the new one
+    building_path = f'{path}.building'
+    if os.path.exists(building_path):
+        os.remove(building_path)
+    db = sqlite3.connect(building_path)
+    keys = ', '.join(f'"{column}"' for column in cube_dimensions)
+    db.execute(f'CREATE TABLE chunk_cubes ({keys}, day INTEGER, created INTEGER, resolved INTEGER)')
+    insert = f'INSERT INTO chunk_cubes VALUES ({", ".join("?" * (len(cube_dimensions) + 3))})'
+    for issues in sqlite_issue_chunks(db, paths):
+        db.executemany(insert, sqlite_rows(build_issue_cube(issues), cube_dimensions + ['Day', 'Created', 'Resolved']))
+
+    # the rows of the cube keep the order of their first issue, like merge_issue_cubes
+    db.execute(f'CREATE TABLE issue_cube AS SELECT {keys}, day, SUM(created) AS created, SUM(resolved) AS resolved FROM chunk_cubes GROUP BY {keys}, day ORDER BY MIN(rowid)')
+    db.execute('DROP TABLE chunk_cubes')
+    for column in ['Project Names', 'Severity', 'Resource Platform', 'Subscription ID']:
+        db.execute(f'CREATE INDEX "issue_cube {column}" ON issue_cube ("{column}")')
+
+    # the Wiz Projects of every Project Names value
+    project_names = pd.DataFrame({'Project Names': [value for value, in db.execute('SELECT "Project Names" FROM issue_cube GROUP BY "Project Names" ORDER BY MIN(rowid)')]})
+    membership = build_project_membership(project_names)
+    db.execute('CREATE TABLE project_membership (project_names TEXT, project TEXT)')
+    db.executemany('INSERT INTO project_membership VALUES (?, ?)', membership.itertuples(index=False, name=None))
+    db.execute('CREATE INDEX "project_membership project" ON project_membership (project, project_names)')
+
+    db.execute('CREATE TABLE dataset (fingerprint TEXT, sources TEXT)')
+    db.execute('INSERT INTO dataset VALUES (?, ?)', (hashlib.sha256(json.dumps(sources).encode()).hexdigest()[:16], json.dumps(sources)))
+    db.commit()
+    # give the space of the staging table back
+    db.execute('VACUUM')
+    db.close()
+    os.replace(building_path, path)
+
+def load_sqlite_backend(path, paths)-> SQLiteQueryBackend:
+    """
+    open the SQLite file of the reports, it is built from the reports when it is missing or when the reports changed
+    The processes take a lock on the file: the first one builds it while the other ones wait for it and open it
+
+    Parameters:
+        - path of the SQLite file and list of the report files
+
+    Returns:
+        - SQLiteQueryBackend of the file
+    """
+    sources = [list(report_signature(path)) for path in paths]
+    with open(f'{path}.lock', 'w') as backend_lock:
+        lock_file(backend_lock, exclusive=True)
+        try:
+            db = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+            try:
+                built = json.loads(db.execute('SELECT sources FROM dataset').fetchone()[0]) == sources
+            finally:
+                db.close()
+        except (sqlite3.Error, TypeError, ValueError):
+            built = False
+        if not built:
+            build_sqlite_cube(path, paths, sources)
+    return SQLiteQueryBackend(path)
+
+# pre-aggregated issues used by the charts and the dropdowns, and the query backend filtering and aggregating them
+# the sqlite backend keeps the cube in its file, the cube is not loaded
+if query_backend == 'sqlite':
+    QUERY_BACKEND = load_sqlite_backend(query_backend_path, issue_report_files)
+    ISSUE_CUBE, DATASET_FINGERPRINT = None, QUERY_BACKEND.fingerprint
+else:
+    if shared_dataset_path:
+        ISSUE_CUBE, DATASET_FINGERPRINT = load_shared_dataset(shared_dataset_path, issue_report_files)
+    else:
+        if issue_report_chunk_size:
+            ISSUE_CUBE = stream_issue_cubes(issue_report_files)
+        else:
+            ISSUE_CUBE = build_issue_cube(origin_df)
+        DATASET_FINGERPRINT = dataset_fingerprint(ISSUE_CUBE)
+    QUERY_BACKEND = PandasQueryBackend(ISSUE_CUBE, DATASET_FINGERPRINT)
+
+# compare the reports in the pie and line charts when several reports are loaded
+if len(issue_report_files) > 1:
+    pie_chart_filters.append(source_report_column)
+    line_chart_filters.append(source_report_column)
+
+def filter_by_projects(df, selected_project)-> pd.DataFrame:
+    """
+    keep the issues that belong to at least one of the selected Wiz Projects
+
+    Parameters:
+        - data frame and selected Wiz Projects
+
+    Returns:
+        - filtered data frame
+    """
+    if isinstance(selected_project, str):
+        selected_project = [selected_project]
+    project_names = PROJECT_MEMBERSHIP.loc[PROJECT_MEMBERSHIP['Project'].isin(selected_project), 'Project Names']
+    return df[df['Project Names'].isin(project_names)]
+
+def count_by_project(df, by)-> pd.Series:
+    """
+    count the issues of each Wiz Project, an issue is counted once in every project it belongs to
+
+    Parameters:
+        - issue cube and the list of columns to group by next to the project
+
+    Returns:
+        - Series of counts indexed by the group by columns and the Project
+    """
+    # count the issues of each distinct Project Names value first, then spread the counts over the projects
+    counts = df.groupby(by + ['Project Names'], observed=True)['Created'].sum().reset_index(name='Count')
+    counts = counts.merge(PROJECT_MEMBERSHIP, on='Project Names')
+    return counts.groupby(by + ['Project'], observed=True)['Count'].sum()
+
+def explode_projects(df)-> pd.DataFrame:
+    """
+    spread the issues over their Wiz Projects, an issue belonging to several projects is repeated once per project
+
+    Parameters:
+        - data frame
+
+    Returns:
+        - data frame of the issues with an additional Project column
+    """
+    return df.merge(PROJECT_MEMBERSHIP, on='Project Names')
+
+# index of the Wiz Projects each Project Names value belongs to
+PROJECT_MEMBERSHIP = QUERY_BACKEND.project_membership()
+
+# list of available projects. 
+WIZ_PROJECTS = ['All Projects'] + list(PROJECT_MEMBERSHIP['Project'].unique())
+
+# list of available resource platforms
+RESOURCE_PLATFORMS =  ['All Resource Platforms'] + QUERY_BACKEND.distinct_values(['Resource Platform'])['Resource Platform']
+
+# list of available subscription IDs
+SUBSCRIPTON_IDS =  ['All Subscriptions'] + QUERY_BACKEND.distinct_values(['Subscription ID'])['Subscription ID']
+
+def day_number(date)-> int:
+    """
+    helper to turn a date ('2024-01-31') into a day number, None stays None
+    """
+    if date is None:
+        return None
+    return int(pd.Timestamp(date).floor('D').value // nanoseconds_per_day)
+
+def dataset_days(cube)-> tuple:
+    """
+    helper to find the first and the last day of the issue cube, as day numbers
+    """
+    days = pd.DatetimeIndex(cube['Day']).dropna()
+    if days.empty:
+        return 0, 0
+    return int(days.min().value // nanoseconds_per_day), int(days.max().value // nanoseconds_per_day)
+
+# first and last day of the loaded issues, the bounds of the date range slider
+DATASET_DAYS = QUERY_BACKEND.day_range()
+
+# list of available Severities
+
+SEVERITIES = ['All Severities','CRITICAL','HIGH','MEDIUM','LOW','INFORMATIONAL']
+
+# upper bounds of the histogram buckets of the durations (seconds) and of the response sizes (bytes)
+seconds_buckets = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+bytes_buckets = [1024 * 4 ** i for i in range(10)]
+
+class Metrics:
+    """
+    counters and histograms of the dashboard, rendered in the Prometheus text format
+    Each Dash worker process has its own measures
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (name, labels) -> value
+        self.counters = {}
+        # (name, labels) -> [count of each bucket, sum, count]
+        self.histograms = {}
+        self.buckets = {}
+
+    def increment(self, name, labels, value=1):
+        with self.lock:
+            self.counters[(name, labels)] = self.counters.get((name, labels), 0) + value
+
+    def observe(self, name, labels, value, buckets):
+        with self.lock:
+            histogram = self.histograms.get((name, labels))
+            if histogram is None:
+                histogram = self.histograms[(name, labels)] = [[0] * len(buckets), 0, 0]
+                self.buckets[name] = buckets
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[0][index] += 1
+                    break
+            histogram[1] += value
+            histogram[2] += 1
+
+    def render(self)-> str:
+        """
+        render the measures in the Prometheus text format
+
+        Returns:
+            - text of the /metrics route
+        """
+        def format_labels(labels, extra=()):
+            labels = tuple(labels) + tuple(extra)
+            if not labels:
+                return ''
+            values = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+            return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(labels, values)) + '}'
+
+        lines = []
+        with self.lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f'# TYPE {name} counter')
+                for (counter, labels), value in sorted(self.counters.items()):
+                    if counter == name:
+                        lines.append(f'{name}{format_labels(labels)} {value}')
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f'# TYPE {name} histogram')
+                for (histogram, labels), (counts, total, count) in sorted(self.histograms.items()):
+                    if histogram != name:
+                        continue
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets[name], counts):
+                        cumulative += bucket_count
+                        lines.append(f'{name}_bucket{format_labels(labels, [("le", bound)])} {cumulative}')
+                    lines.append(f'{name}_bucket{format_labels(labels, [("le", "+Inf")])} {count}')
+                    lines.append(f'{name}_sum{format_labels(labels)} {total}')
+                    lines.append(f'{name}_count{format_labels(labels)} {count}')
+        return '\n'.join(lines) + '\n'
+
+# measures of the dashboard, and spans of the callback request running in the current thread
+METRICS = Metrics()
+REQUEST_TRACE = threading.local()
+
+def record_span(name, seconds):
+    """
+    helper to record the duration of a function, and add it to the trace of the current request
+    """
+    METRICS.observe('wiz_span_seconds', (('span', name),), seconds, seconds_buckets)
+    spans = getattr(REQUEST_TRACE, 'spans', None)
+    if spans is not None:
+        spans.append({'span': name, 'seconds': round(seconds, 6)})
+
+def instrumented(function):
+    """
+    decorator timing every call of a function in the wiz_span_seconds histogram
+    The function is returned unchanged when metrics_enabled is False
+    """
+    if not metrics_enabled:
+        return function
+
+    @wraps(function)
+    def timed_function(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record_span(function.__name__, time.perf_counter() - start)
+    return timed_function
+
+def record_filter_rows(step, df, filtered_df)-> pd.DataFrame:
+    """
+    helper to count the issue cube rows going in and out of a filter step
+
+    Parameters:
+        - name of the filter step, data frame before and after the filter
+
+    Returns:
+        - the filtered data frame
+    """
+    if metrics_enabled:
+        METRICS.increment('wiz_filter_rows_in_total', (('step', step),), len(df))
+        METRICS.increment('wiz_filter_rows_out_total', (('step', step),), len(filtered_df))
+        spans = getattr(REQUEST_TRACE, 'spans', None)
+        if spans is not None:
+            spans.append({'filter': step, 'rows_in': len(df), 'rows_out': len(filtered_df)})
+    return filtered_df
+
+
+
+# label of the slice and of the line merging the values beyond chart_top_n
+other_label = 'Other'
+
+def other_values_label(labels)-> str:
+    """
+    label of the slice or of the line merging the values beyond chart_top_n: other_label, or 'Other (merged)' when a value of the chart
+    is already named like it ('Other (merged 2)' and so on), plotly would add up the slices of the same label otherwise
+
+    Parameters:
+        - labels of the values of the chart, the merged ones included
+
+    Returns:
+        - label of the merged values
+    """
+    labels = set(labels)
+    label, count = other_label, 0
+    while label in labels:
+        count += 1
+        label = f'{other_label} (merged)' if count == 1 else f'{other_label} (merged {count})'
+    return label
+
+def label_color(label)-> str:
+    """
+    color of a pie chart slice: the wiz_colors of the label, or a color derived from the label so a value has the same color on every chart and every page load
+    """
+    if label in wiz_colors:
+        return wiz_colors[label]
+    return '#' + hashlib.md5(str(label).encode()).hexdigest()[:6]
+
+def pie_chart_slices(labels, values)-> tuple:
+    """
+    keep the chart_top_n largest slices of a pie chart and merge the other ones into an 'Other' slice
+
+    Parameters:
+        - labels and values of the slices
+
+    Returns:
+        - tuple of the lists of labels and values
+    """
+    values = np.asarray(values, dtype='int64')
+    labels = list(labels)
+    if chart_top_n and len(labels) > chart_top_n + 1:
+        order = np.argsort(-values, kind='stable')
+        top, others = order[:chart_top_n], order[chart_top_n:]
+        labels = [labels[i] for i in top] + [other_values_label(labels)]
+        values = np.append(values[top], values[others].sum())
+    return labels, values.tolist()
+
+def top_line_values(counts, values)-> tuple:
+    """
+    split the values of a line chart into the chart_top_n values with the most issues and the values merged into the 'Other' line
+
+    Parameters:
+        - Series of the issue counts by value and list of the values
+
+    Returns:
+        - tuple of the list of the top values, in their original order, and of the list of the other values
+    """
+    if not chart_top_n or len(values) <= chart_top_n + 1:
+        return values, []
+    top = set(sorted(values, key=lambda value: -counts.get(value, 0))[:chart_top_n])
+    return [value for value in values if value in top], [value for value in values if value not in top]
+
+def largest_triangle_one_bucket(x, y, threshold)-> np.ndarray:
+    """
+    downsample a line with the Largest Triangle One Bucket algorithm: the first and last points are kept, the other points are split in buckets
+    and the point of each bucket making the largest triangle with its two neighbours is kept, which keeps the peaks and the steps of the line
+
+    Parameters:
+        - x and y arrays of the line and number of points to keep (smaller than the number of points)
+
+    Returns:
+        - indices of the kept points
+    """
+    # the first and last points are always kept, below 3 points there is no bucket left
+    if threshold < 3:
+        return np.array([0, len(y) - 1])
+    x = x.astype('float64')
+    y = y.astype('float64')
+    # area of the triangle of every inner point with the points before and after it
+    areas = np.abs((x[:-2] - x[2:]) * (y[1:-1] - y[:-2]) - (x[:-2] - x[1:-1]) * (y[2:] - y[:-2]))
+    buckets = np.arange(len(areas)) * (threshold - 2) // len(areas)
+    # the largest area of each bucket comes first once sorted by bucket and decreasing area
+    order = np.lexsort((-areas, buckets))
+    first_of_bucket = np.flatnonzero(np.diff(buckets[order], prepend=-1))
+    return np.concatenate(([0], order[first_of_bucket] + 1, [len(y) - 1]))
+
+def downsample_line(x, y, max_points)-> np.ndarray:
+    """
+    select the points of a line to send to the browser
+    The points in the middle of a straight segment are not needed to draw the line (days without any created or resolved issue for example),
+    when there are still more than max_points they are reduced with largest_triangle_one_bucket
+
+    Parameters:
+        - x (day numbers) and y arrays of the line and maximum number of points (None keeps all the points, the first and last points are always kept)
+
+    Returns:
+        - indices of the kept points
+    """
+    keep = np.arange(len(y))
+    if not max_points or len(y) <= 2:
+        return keep
+    dx = np.diff(x)
+    dy = np.diff(y)
+    # a point is in a straight segment when the slopes before and after it are the same
+    straight = dy[:-1] * dx[1:] == dy[1:] * dx[:-1]
+    keep = np.concatenate(([0], np.flatnonzero(~straight) + 1, [len(y) - 1]))
+    if len(keep) > max_points:
+        keep = keep[largest_triangle_one_bucket(x[keep], y[keep], max_points)]
+    return keep
+
+def line_chart_trace(name, dates, cumulative_open)-> dict:
+    """
+    build the trace of a line chart with plain lists, the days as 'YYYY-MM-DD' strings and the counts as integers, downsampled to line_chart_max_points
+
+    Parameters:
+        - name of the line, dates and cumulative open issues
+
+    Returns:
+        - trace dictionary
+    """
+    days = pd.DatetimeIndex(dates)
+    if days.tz is not None:
+        days = days.tz_convert(None)
+    days = days.to_numpy(dtype='datetime64[D]')
+    counts = np.asarray(cumulative_open, dtype='int64')
+    keep = downsample_line(days.astype('int64'), counts, line_chart_max_points)
+    return {'x': np.datetime_as_string(days[keep], unit='D').tolist(), 'y': counts[keep].tolist(), 'type': 'line', 'name': name}
+
+class DailyCounts:
+    """
+    created and resolved issues of a list of keys (the values of a filter, or pairs of a status and a value) for every day, stored as prefix sums
+    Only the days with issues are kept, sorted by key and by day. The issues of a key between two days are the difference of two prefix sums
+    and its open issues at the end of a day are the prefix sums up to that day, so a new date range or granularity never scans the issue cube again
+    """
+
+    # distance between the positions of two keys, larger than the number of days of any report
+    key_stride = 1 << 20
+
+    def __init__(self, keys, codes, days, created, resolved):
+        """
+        Parameters:
+            - list of the keys, and arrays of the rows of the counts: index of the key, day number, created and resolved issues
+        """
+        self.keys = list(keys)
+        self.first_day = int(days.min()) if len(days) else 0
+        positions = codes.astype('int64') * self.key_stride + (days.astype('int64') - self.first_day)
+        # add up the rows of the same key and day, only the distinct positions are sorted
+        daily = pd.DataFrame({'Created': np.asarray(created, dtype='int64'), 'Resolved': np.asarray(resolved, dtype='int64')}).groupby(positions).sum()
+        self.positions = daily.index.to_numpy(dtype='int64')
+        daily_created = daily['Created'].to_numpy()
+        daily_resolved = daily['Resolved'].to_numpy()
+        self.created = np.concatenate(([0], np.cumsum(daily_created)))
+        self.resolved = np.concatenate(([0], np.cumsum(daily_resolved)))
+
+        # first and last day with created issues and with resolved issues of every key, the line of a key only covers these days
+        cell_keys = self.positions // self.key_stride
+        cell_days = self.positions % self.key_stride + self.first_day
+        self.spans = []
+        for daily in (daily_created, daily_resolved):
+            first = np.full(len(self.keys), np.iinfo('int64').max)
+            last = np.full(len(self.keys), np.iinfo('int64').min)
+            keys, days = cell_keys[daily > 0], cell_days[daily > 0]
+            # the days of a key are sorted, its first and last rows are its first and last days
+            present, first_rows = np.unique(keys, return_index=True)
+            first[present] = days[first_rows]
+            present, last_rows = np.unique(keys[::-1], return_index=True)
+            last[present] = days[::-1][last_rows]
+            self.spans.append((first, last))
+
+    def day_positions(self, days)-> np.ndarray:
+        """
+        helper to find the number of rows of the counts up to the end of a day, for every key and day
+
+        Parameters:
+            - day numbers
+
+        Returns:
+            - 2D array of the row numbers, one row per key and one column per day
+        """
+        days = np.clip(np.asarray(days, dtype='int64') - self.first_day, -1, self.key_stride - 1)
+        return np.searchsorted(self.positions, np.arange(len(self.keys), dtype='int64')[:, None] * self.key_stride + days[None, :], side='right')
+
+    def counts(self, first_day, last_day)-> tuple:
+        """
+        created and resolved issues of every key between two days
+
+        Parameters:
+            - first and last day numbers, both included
+
+        Returns:
+            - tuple of the arrays of the created and of the resolved issues, in the order of the keys
+        """
+        rows = self.day_positions([first_day - 1, last_day])
+        return self.created[rows[:, 1]] - self.created[rows[:, 0]], self.resolved[rows[:, 1]] - self.resolved[rows[:, 0]]
+
+    def open_issues(self, days)-> np.ndarray:
+        """
+        open issues of every key at the end of each day: the issues created minus the issues resolved up to that day
+
+        Parameters:
+            - day numbers
+
+        Returns:
+            - 2D array of the open issues, one row per key and one column per day
+        """
+        rows = self.day_positions(days)
+        key_rows = self.day_positions([self.first_day - 1])
+        return (self.created[rows] - self.resolved[rows]) - (self.created[key_rows] - self.resolved[key_rows])
+
+    def active(self, first_days, last_days)-> np.ndarray:
+        """
+        tell which periods overlap the days between the first and the last created issue, or between the first and the last resolved issue, of every key
+
+        Parameters:
+            - first and last day numbers of the periods
+
+        Returns:
+            - 2D boolean array, one row per key and one column per period
+        """
+        first_days = np.asarray(first_days, dtype='int64')[None, :]
+        last_days = np.asarray(last_days, dtype='int64')[None, :]
+        active = np.zeros((len(self.keys), first_days.shape[1]), dtype=bool)
+        for first, last in self.spans:
+            active |= (first_days <= last[:, None]) & (last_days >= first[:, None])
+        return active
+
+def key_codes(df, columns)-> tuple:
+    """
+    helper to number the values (or the combinations of values) of columns in the order they first appear
+
+    Parameters:
+        - data frame and column name, or list of column names
+
+    Returns:
+        - tuple of the list of the keys and of the array of the key index of every row
+    """
+    groups = df.groupby(columns, observed=True, sort=False)
+    return list(groups.size().index), groups.ngroup().to_numpy()
+
+def daily_counts(keys, parts)-> DailyCounts:
+    """
+    helper to build the DailyCounts of rows of the issue cube, the rows without a key (index -1) are left out
+
+    Parameters:
+        - list of the keys and list of (rows of the issue cube, key index of every row)
+
+    Returns:
+        - DailyCounts of the keys
+    """
+    codes, days, created, resolved = [], [], [], []
+    for df, part_codes in parts:
+        part_days = pd.DatetimeIndex(df['Day'])
+        rows = (np.asarray(part_codes) >= 0) & ~part_days.isna()
+        codes.append(np.asarray(part_codes)[rows])
+        days.append(part_days.asi8[rows] // nanoseconds_per_day)
+        created.append(df['Created'].to_numpy()[rows])
+        resolved.append(df['Resolved'].to_numpy()[rows])
+    return DailyCounts(keys, np.concatenate(codes), np.concatenate(days), np.concatenate(created), np.concatenate(resolved))
+
+def window_counts(counts, window)-> dict:
+    """
+    helper to count the issues created in a date range for every key of DailyCounts, the keys without issues are left out
+
+    Parameters:
+        - DailyCounts and date range (first day, last day, granularity)
+
+    Returns:
+        - dictionary of key -> number of issues, in the order of the keys
+    """
+    created, _ = counts.counts(window[0], window[1])
+    return {key: count for key, count in zip(counts.keys, created.tolist()) if count > 0}
+
+@instrumented
+def pie_chart_counts(df, filter)-> tuple:
+    """
+    Computes the daily counts of the pie charts of a filter: the issues of every status and value of the filter, or of every status for the Status filter
+    The pie charts of any date range are then counted from them
+
+    Parameters:
+        - issue cube and filter (column name)
+
+    Returns:
+        - DailyCounts by Status and value, in the order they appear, or by Status
+    """
+    if filter == 'Status':
+        status_values, status_codes = key_codes(df, 'Status')
+        return daily_counts(status_values, [(df, status_codes)])
+    if filter != 'Project Names':
+        pairs, pair_codes = key_codes(df, ['Status', filter])
+        return daily_counts(pairs, [(df, pair_codes)])
+
+    # an issue is counted once in every project it belongs to
+    statuses = list(df['Status'].unique())
+    projects_df = explode_projects(df[['Status', 'Project Names', 'Day', 'Created', 'Resolved']])
+    pairs, pair_codes = key_codes(projects_df, ['Status', 'Project'])
+    # keep the statuses in the order they appear in the issues, the rows of the issues of a project come together once exploded
+    order = np.argsort([statuses.index(status) for status, _ in pairs], kind='stable')
+    return daily_counts([pairs[i] for i in order], [(projects_df, np.argsort(order)[pair_codes])])
+
+@instrumented
+def status_pie_chart(counts, window)-> dict:
+    """
+    Creates the Pie chart of the issues created in a date range by Status
+
+    Parameters:
+        - daily counts of the Status filter (see pie_chart_counts) and date range (first day, last day, granularity)
+
+    Returns:
+        - pie chart
+    """
+    # Count the issues of every Status, in the order the statuses appear
+    status_counts = window_counts(counts, window)
+    labels, values = pie_chart_slices(list(status_counts), list(status_counts.values()))
+    
+    # Data and layout for the open and resolved issues pie chart
+    open_resolved_issues_pie_chart_data = [
+        {
+            'labels': labels,
+            'values': values,
+            'type': 'pie',
+            'hole': 0.6,
+            'textposition': 'inside',
+            'marker': {'colors': [label_color(label) for label in labels]}
+        }
+    ]
+    open_resolved_issues_pie_chart_layout = {
+        'title': f'All Issues by Status',
+        'visible': True,
+        'margin': {'t': 50, 'b': 50, 'l': 0, 'r': 0}
+    }
+    
+    # Create graph object for open and resolved issues pie chart
+    return {
+        'id': 'open-resolved-issues-by-Status-pie-chart',
+        'data': open_resolved_issues_pie_chart_data,
+        'layout': open_resolved_issues_pie_chart_layout
+    }
+
+@instrumented
+def filter_pie_charts(counts, filter, selected_project, window)-> list:
+    """
+    Creates the Pie charts of a filter, one for each Status, of the issues created in a date range
+
+    Parameters:
+        - daily counts of the filter (see pie_chart_counts), filter (column name), Wiz Projects and date range (first day, last day, granularity)
+
+    Returns:
+        - List of pie charts
+    """
+    pie_charts = []
+    value_counts = window_counts(counts, window)
+    # Retrieve dynamicaly the list of Status, in the order they appear. A status without issues in the date range has no pie chart
+    status_values = list(dict.fromkeys(status for status, _ in value_counts))
+    if 'All Projects' in selected_project:
+        wiz_projects = [p for p in WIZ_PROJECTS if p !=  'All Projects']
+    else:
+        wiz_projects = selected_project
+    if filter == 'Project Names':
+        # Compute counts for issues by project name
+        for status in status_values:
+            labels = []
+            values = []
+            for project_name in wiz_projects:
+                labels.append(project_name)
+                values.append(value_counts.get((status, project_name), 0))
+            labels, values = pie_chart_slices(labels, values)
+            status_issues_byfilter_pie_chart_data = [
+                {
+                    'labels': labels,
+                    'values': values,
+                    'type': 'pie',
+                    'hole': 0.6,
+                    'textposition': 'inside',
+                    'marker': {'colors': [label_color(label) for label in labels]}
+                }
+            ]
+            status_issues_byfilter_pie_chart_layout = {
+                'title': f'{status} Issues by {filter}',
+                'visible': True,
+                'margin': {'t': 50, 'b': 50, 'l': 0, 'r': 0}
+            }
+                
+            # Create graph object for issues by project name pie chart
+            graph = {
+                'id': f'{status}-issues-by-{filter}-pie-chart',
+                'data': status_issues_byfilter_pie_chart_data,
+                'layout': status_issues_byfilter_pie_chart_layout
+            }
+            pie_charts.append(graph)
+    else:
+        # Compute counts for issues by filter option (severity, platform, etc.)
+        for status in status_values:
+            # Select the values with issues of the specific status, by decreasing number of issues
+            status_issues_byfilter = sorted(((value, count) for (value_status, value), count in value_counts.items() if value_status == status), key=lambda item: -item[1])
+            # Shorten labels to 36 characters for better display
+            labels, values = pie_chart_slices([value[:36] for value, _ in status_issues_byfilter], [count for _, count in status_issues_byfilter])
+            # Define the data and layout of the pie chart
+            status_issues_byfilter_pie_chart_data = [
+                {'labels': labels, 'values': values, 'type': 'pie',
+                'hole': 0.6, 'textposition': 'inside', 'width': 100, 'height': 100,
+                'marker': {'colors': [label_color(label) for label in labels]}
+                },
+            ]
+            status_issues_byfilter_pie_chart_layout = {
+                'title': f'{status}  Issues by {filter}', 'visible': True,
+                'margin': {'t': 50, 'b': 50, 'l': 0, 'r': 0}
+            }            
+            # Create the graph object with an ID and add it to the list of pie charts
+            graph = {'id': f'{status}-issues-by-{filter}-pie-chart',
+                    'data': status_issues_byfilter_pie_chart_data,
+                    'layout': status_issues_byfilter_pie_chart_layout}
+            pie_charts.append(graph)
+
+    # Return the list of pie charts
+    return pie_charts
+
+def period_days(first_day, last_day, granularity)-> tuple:
+    """
+    split a date range into the periods of a granularity, the first and the last periods are cut at the date range
+
+    Parameters:
+        - first and last day numbers of the date range and granularity (a key of line_chart_granularities)
+
+    Returns:
+        - tuple of the arrays of the first and of the last day numbers of the periods
+    """
+    days = np.arange(first_day, last_day + 1, dtype='int64')
+    if len(days) == 0:
+        return days, days
+    periods = pd.DatetimeIndex(days.astype('datetime64[D]')).to_period(line_chart_granularities[granularity]).asi8
+    starts = np.flatnonzero(np.diff(periods, prepend=periods[0] - 1))
+    return days[starts], days[np.append(starts[1:] - 1, len(days) - 1)]
+
+def line_traces(counts, window)-> list:
+    """
+    build the lines of DailyCounts over a date range, a point is the open issues at the end of a period of the granularity
+    A line only has the periods between its first and last created or resolved issue
+
+    Parameters:
+        - DailyCounts of the lines and date range (first day, last day, granularity)
+
+    Returns:
+        - list of the traces, in the order of the keys
+    """
+    first_days, last_days = period_days(*window)
+    open_issues = counts.open_issues(last_days)
+    active = counts.active(first_days, last_days)
+    dates = last_days.astype('datetime64[D]')
+    return [line_chart_trace(str(key)[:36], dates[active[i]], open_issues[i, active[i]]) for i, key in enumerate(counts.keys)]
+
+@instrumented
+def all_issues_counts(df)-> DailyCounts:
+    """
+    daily counts of the ALL line, all the issues of the selection
+
+    Parameters:
+        - issue cube
+
+    Returns:
+        - DailyCounts of the ALL key
+    """
+    return daily_counts(['ALL'], [(df, np.zeros(len(df), dtype='int64'))])
+
+def all_issues_line(counts, window)-> dict:
+    """
+    line of the cumulative open issues of the whole selection, shown on every line chart
+
+    Parameters:
+        - daily counts of all the issues (see all_issues_counts) and date range (first day, last day, granularity)
+
+    Returns:
+        - trace of the ALL line
+    """
+    return line_traces(counts, window)[0]
+
+@instrumented
+def line_chart_counts(df, filter, selected_project)-> DailyCounts:
+    """
+    Computes the daily counts of the lines of a line chart, a line for each value of the filter
+    The values beyond chart_top_n (by number of issues of the selection, so the lines do not change with the date range) are merged into the Other line
+
+    Parameters:
+        - issue cube, filter (column name) and Wiz Projects
+
+    Returns:
+        - DailyCounts of the lines
+    """
+    # Calculate daily counts for created and resolved issues by project (special filter, an issue can belong to multiple projects)
+    if filter == "Project Names":
+            if 'All Projects' in selected_project:
+                wiz_projects = [p for p in WIZ_PROJECTS if p !=  'All Projects']
+            else:
+                wiz_projects = selected_project
+            # the projects beyond chart_top_n are merged into the Other line: the issues belonging to at least one of them
+            wiz_projects, other_projects = top_line_values(count_by_project(df, []), wiz_projects)
+            projects_df = explode_projects(df[['Project Names', 'Day', 'Created', 'Resolved']])
+            parts = [(projects_df, pd.Categorical(projects_df['Project'], categories=wiz_projects).codes)]
+            if other_projects:
+                other_df = filter_by_projects(df, other_projects)
+                parts.append((other_df, np.full(len(other_df), len(wiz_projects))))
+                return daily_counts(wiz_projects + [other_values_label(wiz_projects + other_projects)], parts)
+            return daily_counts(wiz_projects, parts)
+
+    # Calculate daily counts for created and resolved issues by filter
+    values = list(df[filter].unique())
+    values, other_values = top_line_values(df.groupby(filter, observed=True)['Created'].sum(), values)
+    codes = pd.Categorical(df[filter], categories=values).codes.astype('int64')
+    if other_values:
+        # every value which is not in the top values is an other value
+        codes[codes < 0] = len(values)
+        return daily_counts(values + [other_values_label(values + other_values)], [(df, codes)])
+    return daily_counts(values, [(df, codes)])
+
+@instrumented
+def line_chart(counts, filter, all_line_chart_data, window)-> dict:
+    """
+    Creates the Line chart of a filter over a date range, with a line for each value of the filter next to the ALL line
+
+    Parameters:
+        - daily counts of the lines (see line_chart_counts), filter (column name), trace of the ALL line and date range (first day, last day, granularity)
+
+    Returns:
+        - line chart
+    """
+    # Initialize the list of line chart data for the current filter option with the ALL line, then a line for each value of the filter
+    filter_line_chart_data = [all_line_chart_data] + line_traces(counts, window)
+
+    # Define the layout for the current line chart
+    filter_line_chart_layout = {
+        'title': f'Issues over Time by {filter}',
+        'xaxis': {'title': 'Date' if window[2] == 'Day' else f'End of the {window[2].lower()}'},
+        'yaxis': {'title': 'Number of Issues'}
+    }
 
-# read the data from a CSV file
-origin_df = pd.read_csv(issue_report)
+    # Combine the line chart data and layout into a dictionary
+    return {
+    'id':f'issues-{filter}-line-chart',
+    'data': filter_line_chart_data,
+    'layout': filter_line_chart_layout
+    }
 
-# mapping of some specific values to color for the pie chart
-wiz_colors = {'OPEN': 'red', 'RESOLVED': 'green','IN_PROGRESS':'orange','INFORMATIONAL':'lightgrey','REJECTED':'darkgrey','LOW': 'lightblue', 'MEDIUM': 'darkorange', 'HIGH': 'red', 'CRITICAL': 'darkred'}
+def create_figure_chart(data,layout)->dict:
+    """
+    create a plotly figure from data and layout dictionaries
 
-# set the default selected project
-selected_project = 'All Projects'
+    Parameters:
+        - data and layout
 
-# list of use cases for pie charts. These are based on the column names. If you need a new use case for pie charts just add it to the list
-pie_chart_filters = ['Status','Severity','Project Names','Resource Platform', 'Subscription ID', 'Resource Region','Resource Type']
+    Returns:
+        - Figure dictionary
+    """
+    return {
+        'data': data,
+        'layout': layout
+    }
 
-# list of use cases for line charts. These are based on the column names. If you need a new use case for line charts just add it to the list
-line_chart_filters = ['Project Names','Severity','Resource Platform','Subscription ID','Resource Region','Resource Type']
+def group_pie_charts(pie_charts)->dict:
+    """
+     group the pie charts by filter
 
-# convert  datacolumns to datetime format 
-def normalize_datetime(date_str):
+    Parameters:
+        - pie charts
+
+    Returns:
+        - dictionary of filter -> list of pie charts
+    """
+    pie_chart_groups = {filter: [] for filter in pie_chart_filters}  # create empty list for each filter group
+
+    # group pie charts by filter
+    for chart in pie_charts:
+        filter_name = chart['id'].split('-')[-3] # extract filter name from chart id
+        pie_chart_groups[filter_name].append(chart)
+    return pie_chart_groups
+
+class FigureCache:
+    """
+    LRU cache of the computed pie and line charts, keyed by the dropdown selection and the dataset fingerprint
+    Entries are pickled, the cache is limited both in number of entries and in total bytes.
+    Without a path the entries are kept in memory, with a path they are kept in a SQLite file shared by all the processes using it.
+    """
+
+    def __init__(self, max_entries, max_bytes, path=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.lock = threading.Lock()
+        if path:
+            self.db = None
+            self.pid = None
+        else:
+            self.entries = OrderedDict()
+            self.size = 0
+
+    def connect(self):
+        """
+        open the SQLite file, once per process: a connection can not be used by a forked process
+        """
+        if self.pid != os.getpid():
+            self.db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.db.execute('CREATE TABLE IF NOT EXISTS figures (key TEXT PRIMARY KEY, value BLOB, size INTEGER, last_used REAL)')
+            self.db.commit()
+            self.pid = os.getpid()
+
+    def get(self, key):
+        """
+        return the cached charts of the key, or None
+        """
+        with self.lock:
+            if self.path:
+                self.connect()
+                row = self.db.execute('SELECT value FROM figures WHERE key = ?', (key,)).fetchone()
+                if row:
+                    self.db.execute('UPDATE figures SET last_used = ? WHERE key = ?', (time.time(), key))
+                    self.db.commit()
+                value = row[0] if row else None
+            else:
+                value = self.entries.get(key)
+                if value is not None:
+                    self.entries.move_to_end(key)
+        # the lookups of every process are counted on its /metrics route, like the other measures
+        if metrics_enabled:
+            METRICS.increment('wiz_figure_cache_misses_total' if value is None else 'wiz_figure_cache_hits_total', ())
+        if value is None:
+            return None
+        return pickle.loads(value)
+
+    def put(self, key, charts):
+        """
+        cache the charts of the key and evict the least recently used entries over the limits
+        """
+        value = pickle.dumps(charts, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(value) > self.max_bytes:
+            return
+        with self.lock:
+            if self.path:
+                self.connect()
+                self.db.execute('INSERT OR REPLACE INTO figures VALUES (?, ?, ?, ?)', (key, value, len(value), time.time()))
+                # evict the least recently used entries until the cache fits in its limits
+                while True:
+                    count, size = self.db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM figures').fetchone()
+                    if count <= self.max_entries and size <= self.max_bytes:
+                        break
+                    self.db.execute('DELETE FROM figures WHERE key = (SELECT key FROM figures ORDER BY last_used LIMIT 1)')
+                self.db.commit()
+            else:
+                if key in self.entries:
+                    self.size -= len(self.entries.pop(key))
+                self.entries[key] = value
+                self.size += len(value)
+                while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.size -= len(evicted)
+
+    def clear(self):
+        """
+        remove all the entries, used when the issue report is reloaded
+        """
+        with self.lock:
+            if self.path:
+                self.connect()
+                self.db.execute('DELETE FROM figures')
+                self.db.commit()
+            else:
+                self.entries.clear()
+                self.size = 0
+
+# number of seconds the results of the background jobs are kept, another page asking for the same section and selection gets them without waiting
+background_result_seconds = 600
+
+# number of milliseconds between two polls of a background job by the page
+background_poll_interval = 500
+
+def open_background_cache(path):
+    """
+    open the queue of the background jobs of the section callbacks, the progress and the results of the jobs are kept in a diskcache directory
+
+    Parameters:
+        - directory of the queue
+
+    Returns:
+        - diskcache Cache, or None when the diskcache, multiprocess or psutil package is not installed
+    """
     try:
-        # Attempt to directly convert using the specified format
-        return pd.to_datetime(date_str, format="%Y-%m-%d %H:%M:%S.%f %z UTC")
-    except ValueError:
-        # If the above fails, try removing the duplicated time zone indication and then convert
-        cleaned_str = date_str.replace(' +0000 +0000', ' +0000')
-        return pd.to_datetime(cleaned_str, format="%Y-%m-%d %H:%M:%S.%f %z")
-    
-origin_df['Created At'] = pd.to_datetime(origin_df['Created At'])
-origin_df['Resolved Time'] = origin_df['Resolved Time'].apply(normalize_datetime)
+        import diskcache
+        import multiprocess  # noqa: F401
+        import psutil  # noqa: F401
+    except ImportError:
+        warnings.warn('diskcache, multiprocess or psutil is not installed, the charts are computed in the requests instead of background jobs')
+        return None
+    return diskcache.Cache(path)
+
+# queue of the background jobs, None computes the charts in the requests
+BACKGROUND_CACHE = open_background_cache(background_cache_path) if background_callbacks else None
+
+# cache of the charts computed by the section callbacks
+# the background jobs are forked processes, they share the figure cache through a SQLite file
+if BACKGROUND_CACHE is not None and not figure_cache_path:
+    figure_cache_path = os.path.join(background_cache_path, 'figures.sqlite')
+FIGURE_CACHE = FigureCache(figure_cache_entries, figure_cache_bytes, figure_cache_path)
+
+def normalize_values(values, all_values):
+    """
+    helper to normalize the severity, resource platform or subscription of a selection, a filter preset can give a list of values
 
+    Parameters:
+        - a value or a list of values and the value selecting everything ('All Severities')
 
+    Returns:
+        - the value, or the sorted values when several values are selected
+    """
+    if isinstance(values, str):
+        return values
+    values = sorted(set(values))
+    if all_values in values:
+        return all_values
+    return values[0] if len(values) == 1 else values
+
+def normalize_selection(selected_project, selected_severity, selected_csp, selected_subscription)-> tuple:
+    """
+    normalize the dropdown values so the same selection always gives the same figure cache key
 
-# fill empty values with defaults
-origin_df['Subscription ID'].fillna(value='No Subscription', inplace=True)
-origin_df['Project Names'].fillna(value='No Project', inplace=True)
-origin_df['Resource Platform'].fillna(value='Unknown', inplace=True)
-origin_df['Resource Type'].fillna(value='Unknown', inplace=True)
-origin_df['Resource Region'].fillna(value='Unknown', inplace=True)
+    Parameters:
+        - the values of the project, severity, resource platform and subscription dropdowns (the filter presets can give lists of values)
 
-# set the data to be used
-df = origin_df
+    Returns:
+        - tuple of the sorted selected projects and the other dropdown values
+    """
+    if isinstance(selected_project, str):
+        selected_project = [selected_project]
+    if 'All Projects' in selected_project:
+        selected_project = ['All Projects']
+    return (sorted(set(selected_project)), normalize_values(selected_severity, 'All Severities'), normalize_values(selected_csp, 'All Resource Platforms'),
+            normalize_values(selected_subscription, 'All Subscriptions'))
 
-# helper function to extract unique project names from a DataFrame. Main challenge is Project Names column can contain multiple projects
-def get_wiz_projects(df)-> list:
+def normalize_window(date_range, granularity)-> tuple:
     """
-    helper to retrieve the list of Wiz Project from the Project Names column
-    We need it because multiple Wiz projects can share the same OU/Subscription
+    normalize the values of the date range slider and of the granularity selector so the same date range always gives the same figure cache key
 
     Parameters:
-        - data frame
+        - first and last day numbers (None for the first or the last day of the report) and granularity
 
     Returns:
-        - List of unique Wiz Projects
+        - tuple of the first and last day numbers, within the days of the report, and of the granularity (by day by default)
     """
-    non_sorted_projects = df['Project Names'].unique()
-    projects = set()
-    for p in non_sorted_projects:
-        projects.update(p.split(', '))
-    return list(projects)
+    first_day, last_day = DATASET_DAYS
+    if date_range:
+        if date_range[0] is not None:
+            first_day = max(first_day, int(date_range[0]))
+        if date_range[1] is not None:
+            last_day = min(last_day, int(date_range[1]))
+    if granularity not in line_chart_granularities:
+        granularity = 'Day'
+    return first_day, last_day, granularity
+
+# sections of the page, each one is computed, cached and updated on its own: a line chart, or the pie charts of a filter
+CHART_SECTIONS = [('line', filter) for filter in line_chart_filters] + [('pie', filter) for filter in pie_chart_filters]
+
+# threads computing the sections of the page in parallel
+SECTION_POOL = ThreadPoolExecutor(chart_section_workers)
+
+# locks keeping the threads from computing the same figure cache entry twice, one lock per key being computed
+# the charts are computed from cached daily counts while their lock is held, locks shared by several keys could wait for each other
+SECTION_LOCKS = weakref.WeakValueDictionary()
+SECTION_LOCKS_GUARD = threading.Lock()
+
+def cached_charts(key, compute):
+    """
+    return the charts (or the daily counts) of a figure cache key, they are computed only once when several threads ask for the same missing key
 
-# list of available projects. 
-WIZ_PROJECTS = ['All Projects'] + get_wiz_projects(df)
+    Parameters:
+        - key (list of JSON values, the dataset fingerprint is added to it) and function computing the charts
 
-# list of available resource platforms
-RESOURCE_PLATFORMS =  ['All Resource Platforms'] + list(df['Resource Platform'].unique())
+    Returns:
+        - the cached or computed charts
+    """
+    key = json.dumps([DATASET_FINGERPRINT] + key)
+    charts = FIGURE_CACHE.get(key)
+    if charts is None:
+        with SECTION_LOCKS_GUARD:
+            lock = SECTION_LOCKS.setdefault(key, threading.Lock())
+        with lock:
+            charts = FIGURE_CACHE.get(key)
+            if charts is None:
+                charts = compute()
+                FIGURE_CACHE.put(key, charts)
+    return charts
+
+def reset_section_threads():
+    """
+    recreate the locks and the thread pool of the sections in a forked process (background job, export of the presets)
+    A lock held by another thread when the process was forked would never be released in the new process
+    """
+    global SECTION_POOL, SECTION_LOCKS, SECTION_LOCKS_GUARD
+    SECTION_POOL = ThreadPoolExecutor(chart_section_workers)
+    SECTION_LOCKS = weakref.WeakValueDictionary()
+    SECTION_LOCKS_GUARD = threading.Lock()
+    FIGURE_CACHE.lock = threading.Lock()
+    METRICS.lock = threading.Lock()
 
-# list of available subscription IDs
-SUBSCRIPTON_IDS =  ['All Subscriptions'] + list(df['Subscription ID'].unique())
+os.register_at_fork(after_in_child=reset_section_threads)
 
-# list of available Severities
+def section_title(section)-> str:
+    """
+    helper to name a section of the page
+    """
+    kind, filter = section
+    return f'Issues over time by {filter}' if kind == 'line' else f'Issues by {filter}'
 
-SEVERITIES = ['All Severities','CRITICAL','HIGH','MEDIUM','LOW','INFORMATIONAL']
+def section_columns(section)-> list:
+    """
+    helper to list the columns the query backend groups the rows of a section by, next to the day
+    """
+    kind, filter = section
+    if kind == 'line' or filter == 'Status':
+        return [filter]
+    return ['Status', filter]
+
+def section_counts(section, df, selected_project)-> DailyCounts:
+    """
+    compute the daily counts of a section of the page from the rows of the query backend
 
+    Parameters:
+        - section (kind of chart and filter), rows of the selection (see section_columns) and Wiz Projects
 
+    Returns:
+        - DailyCounts of the section
+    """
+    kind, filter = section
+    if kind == 'line':
+        return line_chart_counts(df, filter, selected_project)
+    return pie_chart_counts(df, filter)
 
-def pie_chart_use_cases(df, selected_project)->list:
+def counts_charts(section, counts, selected_project, window, all_line_chart_data=None)-> list:
     """
-    Creates a list of Pie charts Based on pie_chart_filters
+    build the charts of a section of the page from its daily counts
 
     Parameters:
-        - data frame and Wiz Projects
+        - section (kind of chart and filter), daily counts of the section, Wiz Projects, normalized date range and the trace of the ALL line for the line charts
 
     Returns:
-        - List pie charts
+        - list of the charts of the section
     """
+    kind, filter = section
+    if kind == 'line':
+        return [line_chart(counts, filter, all_line_chart_data, window)]
+    if filter == 'Status':
+        return [status_pie_chart(counts, window)]
+    return filter_pie_charts(counts, filter, selected_project, window)
+
+def section_charts(section, selection, window=None, progress=None)-> list:
+    """
+    compute the charts of a section of the page over a date range, or return them from the figure cache
+    The daily counts of the section are computed once for a selection and cached too, the charts of another date range or granularity are computed from them
 
-    pie_charts = []
-    # Retrieve dynamicaly the list of Status.
-    status_values = df['Status'].unique()
-    
-    # Data and layout for the open and resolved issues pie chart
-    open_resolved_issues_pie_chart_data = [
-        {
-            'labels': status_values,
-            'values': [df['Status'].value_counts()[status] for status in status_values],
-            'type': 'pie',
-            'hole': 0.6,
-            'textposition': 'inside',
-            'marker': {'colors': [wiz_colors.get(label,f'#{random.randint(0, 0xffffff):06x}') for label in status_values]}
-        }
-    ]
-    open_resolved_issues_pie_chart_layout = {
-        'title': f'All Issues by Status',
-        'visible': True,
-        'margin': {'t': 50, 'b': 50, 'l': 0, 'r': 0}
-    }
-    
-    # Create graph object for open and resolved issues pie chart
-    graph = {
-        'id': 'open-resolved-issues-by-Status-pie-chart',
-        'data': open_resolved_issues_pie_chart_data,
-        'layout': open_resolved_issues_pie_chart_layout
-    }
-    pie_charts.append(graph)
+    Parameters:
+        - section (kind of chart and filter), the normalized dropdown values, the normalized date range (first day, last day, granularity), the whole report by day by default,
+          and an optional function receiving the progress messages of the computation
+
+    Returns:
+        - list of the charts of the section
+    """
+    kind, filter = section
+    selected_project = selection[0]
+    window = window or normalize_window(None, None)
+
+    def compute_counts():
+        if progress:
+            progress(f'{section_title(section)}: filtering the issues')
+        df = QUERY_BACKEND.daily_rows(selection, section_columns(section))
+        if progress:
+            progress(f"{section_title(section)}: counting {int(df['Created'].sum()):,} issues by day")
+        return section_counts(section, df, selected_project)
+
+    def compute_all_line():
+        counts = cached_charts(['ALL counts', selection], lambda: all_issues_counts(QUERY_BACKEND.daily_rows(selection, [])))
+        return all_issues_line(counts, window)
+
+    def compute():
+        counts = cached_charts([section, 'counts', selection], compute_counts)
+        if progress:
+            progress(f'{section_title(section)}: computing the charts')
+        # the ALL line is shared by the line charts of the selection
+        all_line_chart_data = cached_charts(['ALL line', selection, window], compute_all_line) if kind == 'line' else None
+        return counts_charts(section, counts, selected_project, window, all_line_chart_data)
+    # the pie charts do not depend on the granularity
+    return cached_charts([section, selection, window if kind == 'line' else window[:2]], compute)
+
+def compute_charts(selected_project, selected_severity, selected_csp, selected_subscription, date_range=None, granularity=None)-> tuple:
+    """
+    compute the pie and line charts of all the sections of the page in parallel, or return them from the figure cache
+
+    Parameters:
+        - the values of the project, severity, resource platform and subscription dropdowns, and of the date range slider and the granularity selector
+
+    Returns:
+        - tuple of the list of pie charts and the list of line charts
+    """
+    selection = normalize_selection(selected_project, selected_severity, selected_csp, selected_subscription)
+    window = normalize_window(date_range, granularity)
+    sections = dict(zip(CHART_SECTIONS, SECTION_POOL.map(lambda section: section_charts(section, selection, window), CHART_SECTIONS)))
+    pie_charts = [chart for filter in pie_chart_filters for chart in sections[('pie', filter)]]
+    line_charts = [chart for filter in line_chart_filters for chart in sections[('line', filter)]]
+    return pie_charts, line_charts
+
+def filter_charts(selected_project, selected_severity, selected_csp, selected_subscription, window=None)-> tuple:
+    """
+    compute the pie and line charts of the normalized dropdown values without the figure cache, the query backend filters and adds up the rows of every section
+
+    Parameters:
+        - the normalized values of the project, severity, resource platform and subscription dropdowns and the optional normalized date range
+
+    Returns:
+        - tuple of the list of pie charts and the list of line charts
+    """
+    selection = (selected_project, selected_severity, selected_csp, selected_subscription)
+    window = window or normalize_window(None, None)
+    # the ALL line is shared by the line charts
+    all_line_chart_data = all_issues_line(all_issues_counts(QUERY_BACKEND.daily_rows(selection, [])), window)
+    sections = {}
+    for section in CHART_SECTIONS:
+        counts = section_counts(section, QUERY_BACKEND.daily_rows(selection, section_columns(section)), selected_project)
+        sections[section] = counts_charts(section, counts, selected_project, window, all_line_chart_data)
+    pie_charts = [chart for filter in pie_chart_filters for chart in sections[('pie', filter)]]
+    line_charts = [chart for filter in line_chart_filters for chart in sections[('line', filter)]]
+    return pie_charts, line_charts
+
+def matching_rows(column, value)-> pd.Series:
+    """
+    helper to select the rows of a column equal to a dropdown value, or to one of the values of a list (filter presets)
+    """
+    if isinstance(value, str):
+        return column == value
+    return column.isin(value)
+
+@instrumented
+def filter_issue_cube(df, selected_project, selected_severity, selected_csp, selected_subscription)-> pd.DataFrame:
+    """
+    filter the issue cube with the normalized dropdown values
+
+    Parameters:
+        - issue cube and the normalized values of the project, severity, resource platform and subscription dropdowns
+
+    Returns:
+        - filtered issue cube
+    """
+    # Filter the data based on the selected project
+    if 'All Projects' not in selected_project:
+        df = record_filter_rows('project', df, filter_by_projects(df, selected_project))
+
+    # Filter the data based on the severity
+    if selected_severity != 'All Severities':
+        df = record_filter_rows('severity', df, df[matching_rows(df['Severity'], selected_severity)])
+
+    # Filter the data based on the selected resource platform
+    if selected_csp != 'All Resource Platforms':
+        df = record_filter_rows('resource platform', df, df[matching_rows(df['Resource Platform'], selected_csp)])
     
-    if 'All Projects' in selected_project:
-        wiz_projects = [p for p in WIZ_PROJECTS if p !=  'All Projects']
-    else:
-        wiz_projects = selected_project
-    # Loop over filter use cases and compute the necessary counts
-    for filter in pie_chart_filters:
-        if filter == 'Project Names':
-            # Compute counts for issues by project name
-            for status in status_values:
-                labels = []
-                values = []
-                for project_name in wiz_projects:
-                    labels.append(project_name)
-                    values.append(df[df['Status'] == status][filter].str.split(', ').apply(lambda x: any([k for k in x if k == project_name])).sum())
-                status_issues_byfilter_pie_chart_data = [
-                    {
-                        'labels': labels,
-                        'values': values,
-                        'type': 'pie',
-                        'hole': 0.6,
-                        'textposition': 'inside',
-                        'marker': {'colors': [wiz_colors.get(label,f'#{random.randint(0, 0xffffff):06x}') for label in labels]}
-                    }
-                ]
-                status_issues_byfilter_pie_chart_layout = {
-                    'title': f'{status} Issues by {filter}',
-                    'visible': True,
-                    'margin': {'t': 50, 'b': 50, 'l': 0, 'r': 0}
-                }
-                
-                # Create graph object for issues by project name pie chart
-                graph = {
-                    'id': f'{status}-issues-by-{filter}-pie-chart',
-                    'data': status_issues_byfilter_pie_chart_data,
-                    'layout': status_issues_byfilter_pie_chart_layout
-                }
-                pie_charts.append(graph)
-        elif filter != 'Status':
-            # Compute counts for issues by filter option (severity, platform, etc.)
-            for status in status_values:
-                # Select rows with the specific status and group by the filter option
-                status_issues_groupby_filter = df[df['Status'] == status][filter].value_counts().reset_index(name='Count')
-                # Shorten labels to 36 characters for better display
-                labels = [label[:36] for label in status_issues_groupby_filter['index']]
-                values = status_issues_groupby_filter['Count']
-                # Define the data and layout of the pie chart
-                status_issues_byfilter_pie_chart_data = [
-                    {'labels': labels, 'values': values, 'type': 'pie',
-                    'hole': 0.6, 'textposition': 'inside', 'width': 100, 'height': 100,
-                    'marker': {'colors': [wiz_colors.get(label, f'#{random.randint(0, 0xffffff):06x}')
-                                            for label in labels]}
-                    },
-                ]
-                status_issues_byfilter_pie_chart_layout = {
-                    'title': f'{status}  Issues by {filter}', 'visible': True,
-                    'margin': {'t': 50, 'b': 50, 'l': 0, 'r': 0}
-                }            
-                # Create the graph object with an ID and add it to the list of pie charts
-                graph = {'id': f'{status}-issues-by-{filter}-pie-chart',
-                        'data': status_issues_byfilter_pie_chart_data,
-                        'layout': status_issues_byfilter_pie_chart_layout}
-                pie_charts.append(graph)
+    # Filter the data based on the selected subscription ID
+    if selected_subscription != 'All Subscriptions':
+        df = record_filter_rows('subscription', df, df[matching_rows(df['Subscription ID'], selected_subscription)])
+    return df
 
-    # Return the list of pie charts
-    return pie_charts
+# only one reload at a time
+DATASET_LOCK = threading.Lock()
 
-def cumulative_line_chart_df(df):
-    created_issues_daily_count = df.set_index('Created At').resample('D').size().fillna(0).reset_index(name='Count_created')
-    resolved_issues_daily_count = df[df['Status'].isin(['RESOLVED', 'REJECTED'])].set_index('Resolved Time').resample('D').size().fillna(0).reset_index(name='Count_resolved')   
-    # Merge created and resolved counts into a single DataFrame based on date using an outer join
-    if not created_issues_daily_count.empty and not resolved_issues_daily_count.empty:
-        open_issues_count = pd.merge(created_issues_daily_count, resolved_issues_daily_count, left_on='Created At', right_on='Resolved Time', how='outer', suffixes=('_created', '_resolved'))
-    else:
-        if created_issues_daily_count.empty and resolved_issues_daily_count.empty:
-            open_issues_count = pd.DataFrame(columns=['Created At', 'Resolved Time', 'Count_created', 'Count_resolved'])
-        elif created_issues_daily_count.empty:
-            open_issues_count = resolved_issues_daily_count.copy()
-            open_issues_count['Created At'] = open_issues_count['Resolved Time']
-            open_issues_count['Count_created'] = 0
+def apply_issue_report(df, cube, path)-> tuple:
+    """
+    apply a new export of the issue report on top of the loaded issues
+    The new export is compared to the loaded issues by Issue ID and Row Hash, only the inserted, updated and removed
+    issues are normalized and their counts added to (or removed from) the issue cube
+
+    Parameters:
+        - loaded issues, issue cube and path of the new export
+
+    Returns:
+        - tuple of the issues and the issue cube of the new export, None when nothing changed
+    """
+    report = pd.read_csv(path, usecols=report_columns)
+    loaded_ids = pd.Index(df[issue_id_column])
+    if not loaded_ids.is_unique or report[issue_id_column].duplicated().any():
+        # the issues can not be matched one to one, load the new export from scratch
+        issues = add_source_report(normalize_issue_report(report), path)
+        issues['Row Hash'] = hash_issue_rows(report)
+        return issues, build_issue_cube(issues)
+
+    # the exports of a drop directory have a new file name, the kept issues are counted under the new export like after a fresh load
+    source = os.path.basename(path)
+    if list(df[source_report_column].cat.categories) != [source]:
+        df = df.assign(**{source_report_column: pd.Categorical.from_codes(np.zeros(len(df), dtype='int8'), [source])})
+        cube = cube.assign(**{source_report_column: pd.Categorical.from_codes(np.zeros(len(cube), dtype='int8'), [source])})
+
+    # match the issues of the new export with the loaded ones
+    report_hashes = hash_issue_rows(report)
+    positions = loaded_ids.get_indexer(report[issue_id_column])
+    unchanged = (positions >= 0) & (df['Row Hash'].to_numpy()[positions] == report_hashes)
+    kept = np.zeros(len(df), dtype=bool)
+    kept[positions[unchanged]] = True
+    if unchanged.all() and kept.all():
+        return None
+
+    # inserted and updated issues of the new export, updated and removed issues of the loaded ones
+    added = add_source_report(normalize_issue_report(report[~unchanged]), path)
+    added['Row Hash'] = report_hashes[~unchanged]
+    removed = df[~kept]
+
+    removed_cube = build_issue_cube(removed)
+    removed_cube[['Created', 'Resolved']] = -removed_cube[['Created', 'Resolved']]
+    cube = merge_issue_cubes([cube, build_issue_cube(added), removed_cube])
+    cube = cube[(cube['Created'] != 0) | (cube['Resolved'] != 0)].reset_index(drop=True)
+    return concat_issues([df[kept], added]), cube
+
+def reload_issue_report(path):
+    """
+    load a new export of the issue report while the app runs and refresh everything derived from the data:
+    project membership, dropdown values, days of the report, dataset fingerprint and figure cache
+    The connected pages notice the new DATASET_FINGERPRINT and refresh their dropdowns and charts
+
+    Parameters:
+        - path of the new export
+    """
+    global origin_df, ISSUE_CUBE, QUERY_BACKEND, PROJECT_MEMBERSHIP, WIZ_PROJECTS, RESOURCE_PLATFORMS, SUBSCRIPTON_IDS, DATASET_DAYS, DATASET_FINGERPRINT
+    with DATASET_LOCK:
+        backend = None
+        if query_backend == 'sqlite':
+            # the first worker noticing the new export builds the SQLite file, the other ones open it
+            backend = load_sqlite_backend(query_backend_path, [path])
+            if backend.fingerprint == DATASET_FINGERPRINT:
+                return
+            issues, cube, fingerprint = None, None, backend.fingerprint
+        elif shared_dataset_path:
+            # the first worker noticing the new export builds the shared dataset, the other ones map it
+            cube, fingerprint = load_shared_dataset(shared_dataset_path, [path])
+            if fingerprint == DATASET_FINGERPRINT:
+                return
+            issues = None
+        elif origin_df is None:
+            # streamed reports do not keep the issues, the cube is built again
+            issues, cube = None, stream_issue_cube(path, issue_report_chunk_size)
+            fingerprint = dataset_fingerprint(cube)
         else:
-            open_issues_count = created_issues_daily_count.copy()
-            open_issues_count['Resolved Time'] = open_issues_count['Created At']
-            open_issues_count['Count_resolved'] = 0
+            applied = apply_issue_report(origin_df, ISSUE_CUBE, path)
+            if applied is None:
+                return
+            issues, cube = applied
+            fingerprint = dataset_fingerprint(cube)
+        backend = backend or PandasQueryBackend(cube, fingerprint)
+        PROJECT_MEMBERSHIP = backend.project_membership()
+        origin_df, ISSUE_CUBE, QUERY_BACKEND = issues, cube, backend
+        WIZ_PROJECTS = ['All Projects'] + list(PROJECT_MEMBERSHIP['Project'].unique())
+        values = backend.distinct_values(['Resource Platform', 'Subscription ID'])
+        RESOURCE_PLATFORMS = ['All Resource Platforms'] + values['Resource Platform']
+        SUBSCRIPTON_IDS = ['All Subscriptions'] + values['Subscription ID']
+        DATASET_DAYS = backend.day_range()
+        DATASET_FINGERPRINT = fingerprint
+        FIGURE_CACHE.clear()
+
+def latest_issue_report(path)-> str:
+    """
+    helper to find the report to load from a report file or a drop directory
+
+    Parameters:
+        - path of a report file or of a drop directory
+
+    Returns:
+        - path of the report file, the most recent CSV file of a drop directory (None when it is empty)
+    """
+    if not os.path.isdir(path):
+        return path
+    reports = glob.glob(os.path.join(path, '*.csv'))
+    return max(reports, key=os.path.getmtime) if reports else None
 
-    # Fill any missing values in the 'Count_created' and 'Count_resolved' columns with 0
-    open_issues_count['Count_created'] = open_issues_count['Count_created'].fillna(0)
-    open_issues_count['Count_resolved'] = open_issues_count['Count_resolved'].fillna(0)
+def watch_issue_report(path, interval):
+    """
+    check the report file or drop directory every interval seconds and reload the new exports
+    A new export is only loaded once its size and modification time did not change between two checks,
+    so a file still being written is not loaded
 
-    # Use either 'Created At' or 'Resolved Time' as the 'Date' column and fill any missing values
-    open_issues_count['Date'] = open_issues_count['Created At'].fillna(open_issues_count['Resolved Time'])
+    Parameters:
+        - path of a report file or of a drop directory and the number of seconds between two checks
+    """
+    loaded = report_signature(issue_report_files[-1])
+    pending = None
+    while True:
+        time.sleep(interval)
+        signature = report_signature(latest_issue_report(path))
+        if signature is None or signature == loaded:
+            pending = None
+        elif signature != pending:
+            pending = signature
+        else:
+            try:
+                reload_issue_report(signature[0])
+            except Exception as error:
+                print(f'failed to reload {signature[0]}: {error}')
+            loaded, pending = signature, None
 
-    # Calculate the cumulative sum of open issues
-    open_issues_count['Cumulative Open'] = open_issues_count['Count_created'] - open_issues_count['Count_resolved']
-    open_issues_count['Cumulative Open'] = open_issues_count['Cumulative Open'].cumsum()
-    return open_issues_count
+def export_file_name(name)-> str:
+    """
+    helper to turn a preset or chart name into a file name
+    """
+    return re.sub(r'[^\w.-]+', '_', name).strip('_') or 'charts'
 
-def line_chart_use_cases (df,selected_project)->list:
+def export_directory_names(presets)-> list:
     """
-    Creates a list of Line charts Based on line_chart_filters
+    helper to name the directories of the presets after the presets, the names giving the same directory ('A/B' and 'A B') get a suffix
+    so a preset never overwrites the charts of another one
 
     Parameters:
-        - data frame
+        - list of presets
 
     Returns:
-        - List of line charts
+        - list of the directory names, in the order of the presets
+    """
+    names, used = [], set()
+    for preset in presets:
+        base = name = export_file_name(preset['name'])
+        suffix = 1
+        # the names are compared ignoring the case, like the file systems of Windows and macOS
+        while name.lower() in used:
+            suffix += 1
+            name = f'{base}-{suffix}'
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+def export_preset(directory, formats, preset, directory_name=None)-> list:
     """
-    # Initialize an empty list to store the line chart data and layout for each filter option
-    line_charts =[]
+    compute the charts of a filter preset and write them in a directory named after the preset
+        - html: one standalone page with all the charts, grouped like on the web page
+        - json: one plotly figure per chart
+        - png: one image per chart, needs the kaleido package
 
-    # Loop over all filter options
-    for filter in line_chart_filters:
-        # Initialize an empty list to store the line chart data for the current filter option
-        line_charts_data =[]
+    Parameters:
+        - export directory, list of formats and preset: dictionary of the name and of the optional project, severity, platform, subscription,
+          start and end ('2024-01-31', the first and last day of the report by default) and granularity of the line charts (Day, Week, Month or Quarter),
+          name of the directory of the preset (named after the preset by default)
 
-        # Calculate daily counts for All created and ALL resolved issues
-        open_issues_count = cumulative_line_chart_df(df)
-        line_charts_data+=[{'x': open_issues_count['Date'], 'y': open_issues_count['Cumulative Open'], 'type': 'line', 'name': 'ALL'}]
+    Returns:
+        - list of the written files
+    """
+    selection = normalize_selection(preset.get('project', 'All Projects'), preset.get('severity', 'All Severities'),
+                                    preset.get('platform', 'All Resource Platforms'), preset.get('subscription', 'All Subscriptions'))
+    window = normalize_window([day_number(preset.get('start')), day_number(preset.get('end'))], preset.get('granularity'))
+    pie_charts, line_charts = filter_charts(*selection, window)
+    preset_directory = os.path.join(directory, directory_name or export_file_name(preset['name']))
+    os.makedirs(preset_directory, exist_ok=True)
+    files = []
+
+    # one file per chart
+    for chart in line_charts + pie_charts:
+        figure = create_figure_chart(chart['data'], chart['layout'])
+        for format in set(formats) & {'json', 'png'}:
+            path = os.path.join(preset_directory, f"{export_file_name(chart['id'])}.{format}")
+            if format == 'json':
+                pio.write_json(figure, path, validate=False)
+            else:
+                pio.write_image(figure, path, validate=False)
+            files.append(path)
+
+    # one page with the line charts and the pie charts grouped by filter, plotly.js is included once
+    if 'html' in formats:
+        sections = [('Wiz Issues over Time', line_charts)] + [(f'Issues by {filter}', charts) for filter, charts in group_pie_charts(pie_charts).items()]
+        body = [f"<h1>{escape(preset['name'])}</h1>"]
+        include_plotlyjs = True
+        for title, charts in sections:
+            body.append(f'<h2>{title}</h2>')
+            for chart in charts:
+                body.append(pio.to_html(create_figure_chart(chart['data'], chart['layout']), full_html=False, include_plotlyjs=include_plotlyjs, validate=False))
+                include_plotlyjs = False
+        path = os.path.join(preset_directory, 'index.html')
+        with open(path, 'w') as page:
+            page.write('<html><head><meta charset="utf-8"></head><body>' + '\n'.join(body) + '</body></html>')
+        files.append(path)
+    return files
+
+def export_charts(directory, presets, formats, workers=None)-> list:
+    """
+    export the charts of every filter preset without running the Dash server, the presets are exported in parallel processes
 
-        # Calculate daily counts for created and resolved issues by project (special filter, uses contains instead of equal)
+    Parameters:
+        - export directory, list of presets, list of formats and maximum number of processes
 
+    Returns:
+        - list of the written files
+    """
+    if 'png' in formats:
+        try:
+            import kaleido  # noqa: F401
+        except ImportError:
+            print('kaleido is not installed, the charts are not exported as png')
+            formats = [format for format in formats if format != 'png']
+    exported = map_forked(lambda item: export_preset(directory, formats, *item), list(zip(presets, export_directory_names(presets))), workers)
+    return [path for files in exported for path in files]
+
+# statuses of the pie charts of the page, the pie charts of the statuses without issues in the selection are hidden
+# a status first seen in a reloaded report is only shown after a restart
+PIE_CHART_STATUSES = wiz_statuses + sorted(status for status in QUERY_BACKEND.distinct_values(['Status'])['Status'] if status not in wiz_statuses)
+
+def section_graph_ids(section)-> list:
+    """
+    helper to list the ids of the graphs of a section of the page
+    """
+    kind, filter = section
+    if kind == 'line':
+        return [f'issues-{filter}-line-chart']
+    if filter == 'Status':
+        return ['open-resolved-issues-by-Status-pie-chart']
+    return [f'{status}-issues-by-{filter}-pie-chart' for status in PIE_CHART_STATUSES]
+
+def section_digests_id(section)-> str:
+    """
+    helper to name the store of the digests of the charts displayed in a section
+    """
+    return f'{section[0]}-{section[1]}-digests'
 
-        if filter == "Project Names":
-                if 'All Projects' in selected_project:
-                    wiz_projects = [p for p in WIZ_PROJECTS if p !=  'All Projects']
-                else:
-                    wiz_projects = selected_project
-                for project_name in wiz_projects:                    
-                    df_filter= df [df[filter].str.split(', ').apply(lambda x: any([k for k in x if k == project_name]))]
-                    open_issues_count = cumulative_line_chart_df(df_filter)
-                    line_charts_data+=[{'x': open_issues_count['Date'], 'y': open_issues_count['Cumulative Open'], 'type': 'line', 'name': f'{project_name[:36]}'}]
+def section_progress_id(section)-> str:
+    """
+    helper to name the progress message of the background job of a section
+    """
+    return f'{section[0]}-{section[1]}-progress'
 
-        else:    
-        # Calculate daily counts for created and resolved issues by filter
-            for f in df[filter].unique():
-                df_filter = df[df[filter]==f]
-                open_issues_count = cumulative_line_chart_df(df_filter)
-                line_charts_data+=[{'x': open_issues_count['Date'], 'y': open_issues_count['Cumulative Open'], 'type': 'line', 'name': f'{f[:36]}'}]
+def chart_digest(chart)-> str:
+    """
+    digest of the data and of the layout of a chart, the layout of a line chart changes with the granularity (title of the x axis)
+    """
+    return hashlib.md5(json.dumps([chart['data'], chart['layout']], sort_keys=True, default=str).encode()).hexdigest()
 
-        # Combine all line chart data for the current filter option
-        filter_line_chart_data = (line_charts_data)
+def pie_chart_style(visible)-> dict:
+    """
+    helper to show or hide a pie chart
+    """
+    style = {'width': '25%','max-height':'1000px'}
+    if not visible:
+        style['display'] = 'none'
+    return style
 
-        # Define the layout for the current line chart
-        filter_line_chart_layout = {
-            'title': f'Issues over Time by {filter}',
-            'xaxis': {'title': 'Date'},
-            'yaxis': {'title': 'Number of Issues'}
-        }
+def date_range_marks(first_day, last_day)-> dict:
+    """
+    helper to label the date range slider with the first day of every month, or of every quarter or year for the longer reports
+    """
+    for frequency, label in (('MS', '%Y-%m'), ('QS', '%Y-%m'), ('YS', '%Y')):
+        starts = pd.date_range(pd.Timestamp(first_day, unit='D'), pd.Timestamp(last_day, unit='D'), freq=frequency)
+        if len(starts) <= 12:
+            break
+    return {int(day.value // nanoseconds_per_day): day.strftime(label) for day in starts}
 
-        # Combine the line chart data and layout into a dictionary and append it to the list of line charts
-        graph={
-        'id':f'issues-{filter}-line-chart',
-        'data': filter_line_chart_data,
-        'layout': filter_line_chart_layout
-        }
-        line_charts.append(graph)
+def encode_client_column(values)-> dict:
+    """
+    helper to encode a column of integers for the browser, in the smallest integer type holding its values
 
-    # Return the list of line charts
-    return line_charts
+    Parameters:
+        - array of integers
 
-def create_figure_chart(data,layout)->dict:
+    Returns:
+        - dictionary of the type name and of the base64 little endian values
     """
-    create a plotly figure from data and layout dictionaries
+    values = np.asarray(values, dtype='int64')
+    for name, dtype in (('int8', '<i1'), ('int16', '<i2'), ('int32', '<i4')):
+        if len(values) == 0 or (values.min() >= np.iinfo(dtype).min and values.max() <= np.iinfo(dtype).max):
+            break
+    return {'type': name, 'data': base64.b64encode(values.astype(dtype).tobytes()).decode('ascii')}
+
+def client_issue_cube(cube)-> dict:
+    """
+    build the issue cube sent to the browser in client side filtering mode
+    Each dimension is dictionary encoded: its distinct values and the index of the value of every row. The days, created and resolved issues of the rows
+    are integer columns too, and the project membership, the colors of the labels (label_color) and the chart settings complete it
 
     Parameters:
-        - data and layout
+        - issue cube
 
     Returns:
-        - Figure dictionary
+        - dictionary of the encoded issue cube, see assets/wiz_charts.js
     """
+    days = pd.DatetimeIndex(cube['Day'])
+    # day numbers relative to the first day of the report, -1 for the issues without a creation day
+    day_numbers = np.where(days.isna(), -1, days.asi8 // nanoseconds_per_day - DATASET_DAYS[0])
+    dimensions = {}
+    labels = {other_label}
+    for column in cube_dimensions:
+        values = pd.Categorical(cube[column])
+        dimensions[column] = {'values': values.categories.tolist(), 'codes': encode_client_column(values.codes)}
+        labels.update(str(value)[:36] for value in values.categories)
+
+    # the Wiz Projects of every Project Names value
+    projects = [project for project in WIZ_PROJECTS if project != 'All Projects']
+    project_index = {project: i for i, project in enumerate(projects)}
+    members = PROJECT_MEMBERSHIP.groupby('Project Names', sort=False)['Project'].agg(list).to_dict()
+    membership = [[project_index[project] for project in members.get(value, [])] for value in dimensions['Project Names']['values']]
+    labels.update(projects)
+    # the label of the merged values of a chart is the first of other_label, 'Other (merged)'... which is not a value of the chart
+    labels.add(other_values_label(labels))
+
     return {
-        'data': data,
-        'layout': layout
+        'fingerprint': DATASET_FINGERPRINT,
+        'first_day': DATASET_DAYS[0],
+        'last_day': DATASET_DAYS[1],
+        'days': encode_client_column(day_numbers),
+        'created': encode_client_column(cube['Created']),
+        'resolved': encode_client_column(cube['Resolved']),
+        'dimensions': dimensions,
+        'projects': projects,
+        'membership': membership,
+        'colors': {label: label_color(label) for label in labels},
+        'granularities': line_chart_granularities,
+        'top_n': chart_top_n,
+        'max_points': line_chart_max_points,
+        'other': other_label,
     }
 
-def generate_pie_chart_div(pie_charts)->list:
+# issue cube of the loaded report sent to the browsers in client side filtering mode, built by the first page load
+CLIENT_ISSUE_CUBE = None
+
+def build_layout():
+    """
+    Define the layout of the web page using Dash HTML components, These are the parameters when the page first start. The section callbacks are used when the page is refreshed.
+    The layout is built on each page load, so the export mode never builds the Dash components and a reloaded report shows up in a new page
+    """
+    # In client side filtering mode the browser computes the charts once it received the issue cube
+    if client_side_filtering:
+        return page_layout([])
+    # Generate the charts of the default selection
+    pie_charts, line_charts = compute_charts('All Projects', 'All Severities', 'All Resource Platforms', 'All Subscriptions')
+    return page_layout(pie_charts + line_charts)
+
+def page_layout(charts)-> html.Div:
     """
-     generate a list of divs containing pie charts grouped by filter
+    build the components of the web page
 
     Parameters:
-        - pie charts
+        - list of the pie and line charts displayed on the page
 
     Returns:
-        - list of divs
+        - Div of the page
     """
-    pie_chart_groups = {filter: [] for filter in pie_chart_filters}  # create empty list for each filter group
+    charts = {chart['id']: chart for chart in charts}
 
-    # group pie charts by filter
-    for chart in pie_charts:
-        filter_name = chart['id'].split('-')[-3] # extract filter name from chart id
-        pie_chart_groups[filter_name].append(chart)
+    def figure(graph_id):
+        if graph_id not in charts:
+            return {'data': [], 'layout': {}}
+        return create_figure_chart(charts[graph_id]['data'], charts[graph_id]['layout'])
 
-    # create a div for each filter group
-    pie_chart_divs = {}
-    for filter, charts in pie_chart_groups.items():
-        # create a list of pie charts for each filter
-        chart_divs = [dcc.Graph(id=chart['id'], figure=create_figure_chart(chart['data'], chart['layout']),style={'width': '25%','max-height':'1000px'}) for chart in charts]
-        # create a div for the group and add the chart divs
-        pie_chart_div = html.Div([
+    # Group pie charts of the same pie chart fileter on the same Divs, with a graph for every status
+    pie_charts_div = html.Div(children=[
+        html.Div([
             html.H2(f'Issues by {filter}'),
-            html.Div(children=chart_divs,style={'display': 'flex','flex-wrap': 'wrap'})
+            html.Div(children=[dcc.Graph(id=graph_id, figure=figure(graph_id), style=pie_chart_style(graph_id in charts)) for graph_id in section_graph_ids(('pie', filter))],
+                     style={'display': 'flex','flex-wrap': 'wrap'})
         ],id=f'id-div-{filter.strip()}')
-        pie_chart_divs[filter]=pie_chart_div
-
-    return pie_chart_divs
-
-# Generate pie charts 
-pie_charts = pie_chart_use_cases(df, 'All Projects')
-# Group pie charts of the same pie chart fileter on the same Divs 
-pie_charts_div = html.Div(children=list(generate_pie_chart_div(pie_charts).values()))
-
-# Generate line charts
-line_charts = line_chart_use_cases(df,'All Projects')
-line_charts_html = [
-    dcc.Graph(id=chart['id'], figure=create_figure_chart(chart['data'], chart['layout']), style={'width': '50%'})
-    for chart in line_charts
-]
-# Combine the line charts into a single div
-line_charts_div = html.Div(children=line_charts_html,style={'display': 'flex', 'flex-wrap': 'wrap'})
-
-# Start a Dash app
-app = dash.Dash()
-
-# Define the layout of the web page using Dash HTML components, These are the parameters when the page first start. update_chart function is used when the page is refreshed.
-app.layout = html.Div(children=[
-    # Add dropdowns to select project name, resource platform, and subscription ID
-    html.Div([
-        html.Label('Project Name'),
-        dcc.Dropdown(
-            id='project-dropdown',
-            options=[{'label': i, 'value': i} for i in  WIZ_PROJECTS],
-            value='All Projects',
-            style={'width': '300px'},
-            multi=True
-        ),
-        html.Label('Severity'),
-        dcc.Dropdown(
-            id='severity-dropdown',
-            options=[{'label': i, 'value': i} for i in  SEVERITIES],
-            value='All Severities',
-            style={'width': '300px'}
-        ),
-        html.Label('Resource Platform'),
-        dcc.Dropdown(
-            id='csp-dropdown',
-            options=[{'label': i, 'value': i} for i in   RESOURCE_PLATFORMS],
-            value='All Resource Platforms',
-            style={'width': '300px'}
-        ),
-        html.Label('Subscription ID'),
-        dcc.Dropdown(
-            id='subscription-dropdown',
-            options=[{'label': i, 'value': i} for i in   SUBSCRIPTON_IDS],
-            value='All Subscriptions',
-            style={'width': '400px'}
-        )
-    ],style={'display': 'flex','flex-wrap': 'wrap'}),
-    
-    # Add a header for the line charts section
-    html.H1(children='Wiz Issues over Time'), 
-    # Insert the line charts section
-    line_charts_div,
-    
-    # Add a header for the pie charts section
-    html.H1(children='Wiz Issues Pie Charts'),   
-    # Insert the pie charts section
-    pie_charts_div,
-])
-
-# Define the output elements for the callback function 
-output_id_div_filters = [dash.dependencies.Output(f'id-div-{filter.strip()}', 'children') for filter in pie_chart_filters]
-output_line_charts = [dash.dependencies.Output(chart['id'], 'figure') for chart in line_charts]
-
-# Define the callback function to update the charts based on user inputs 
-@app.callback(
-    output_line_charts, output_id_div_filters,
-    [dash.dependencies.Input('project-dropdown', 'value'),dash.dependencies.Input('severity-dropdown', 'value'),dash.dependencies.Input('csp-dropdown', 'value'),dash.dependencies.Input('subscription-dropdown', 'value')]
-)
-def update_chart(selected_project, selected_severity,selected_csp, selected_subscription)->list:
-    """
-    This function is called when the user selects an option in any of the dropdown menus. 
-    It updates the charts displayed on the web page based on the selected inputs. 
-    """
-    df = origin_df
-    
-    # Filter the data based on the selected project
-    if 'All Projects' not in selected_project:
-        df = df[df['Project Names'].str.split(', ').apply(lambda x: any([k for k in x if k in selected_project]))]
-        
+        for filter in pie_chart_filters
+    ])
 
+    # Generate line charts
+    line_charts_html = [
+        dcc.Graph(id=graph_id, figure=figure(graph_id), style={'width': '50%'})
+        for filter in line_chart_filters for graph_id in section_graph_ids(('line', filter))
+    ]
+    # Combine the line charts into a single div
+    line_charts_div = html.Div(children=line_charts_html,style={'display': 'flex', 'flex-wrap': 'wrap'})
 
-    # Filter the data based on the severity
-
-    if 'All Severities' not in selected_severity:
-        df = df[df['Severity'] == selected_severity]
+    # Digests of the displayed charts, the section callbacks only send the charts that changed
+    digest_stores = [
+        dcc.Store(id=section_digests_id(section), data=[chart_digest(charts[graph_id]) if graph_id in charts else None for graph_id in section_graph_ids(section)])
+        for section in CHART_SECTIONS
+    ]
 
-    # Filter the data based on the selected resource platform
-    if 'All Resource Platforms' not in selected_csp:
-        df = df[df['Resource Platform'] == selected_csp]
+    # Progress of the background jobs, the message of a section is only shown while its job runs
+    progress_div = html.Div(children=[
+        html.Div(f'{section_title(section)}: waiting', id=section_progress_id(section), style={'display': 'none'})
+        for section in CHART_SECTIONS
+    ]) if BACKGROUND_CACHE is not None else html.Div()
+
+    return html.Div(children=[
+        # Add dropdowns to select project name, resource platform, and subscription ID
+        html.Div([
+            html.Label('Project Name'),
+            dcc.Dropdown(
+                id='project-dropdown',
+                options=[{'label': i, 'value': i} for i in  WIZ_PROJECTS],
+                value='All Projects',
+                style={'width': '300px'},
+                multi=True
+            ),
+            html.Label('Severity'),
+            dcc.Dropdown(
+                id='severity-dropdown',
+                options=[{'label': i, 'value': i} for i in  SEVERITIES],
+                value='All Severities',
+                style={'width': '300px'}
+            ),
+            html.Label('Resource Platform'),
+            dcc.Dropdown(
+                id='csp-dropdown',
+                options=[{'label': i, 'value': i} for i in   RESOURCE_PLATFORMS],
+                value='All Resource Platforms',
+                style={'width': '300px'}
+            ),
+            html.Label('Subscription ID'),
+            dcc.Dropdown(
+                id='subscription-dropdown',
+                options=[{'label': i, 'value': i} for i in   SUBSCRIPTON_IDS],
+                value='All Subscriptions',
+                style={'width': '400px'}
+            )
+        ],style={'display': 'flex','flex-wrap': 'wrap'}),
+
+        # Add the date range of the charts and the granularity of the line charts
+        html.Div([
+            html.Label('Date Range'),
+            dcc.RangeSlider(
+                id='date-range',
+                min=DATASET_DAYS[0],
+                max=DATASET_DAYS[1],
+                step=1,
+                value=list(DATASET_DAYS),
+                marks=date_range_marks(*DATASET_DAYS),
+                allowCross=False
+            ),
+            html.Label('Granularity'),
+            dcc.RadioItems(
+                id='granularity',
+                options=list(line_chart_granularities),
+                value='Day',
+                inline=True
+            )
+        ]),
+
+        # Insert the progress of the sections being computed
+        progress_div,
     
-    # Filter the data based on the selected subscription ID
-    if 'All Subscriptions' not in selected_subscription:
-        df = df[df['Subscription ID'] == selected_subscription]
-
+        # Add a header for the line charts section
+        html.H1(children='Wiz Issues over Time'), 
+        # Insert the line charts section
+        line_charts_div,
     
-    # Refresh the pie charts based on the filtered data
-    refresh_pie_charts = pie_chart_use_cases(df, selected_project)
-    pie_chart_divs = generate_pie_chart_div(refresh_pie_charts)
-
-    div_children = []
+        # Add a header for the pie charts section
+        html.H1(children='Wiz Issues Pie Charts'),   
+        # Insert the pie charts section
+        pie_charts_div,
+
+        # Check for a reloaded issue report, the pages refresh when the data version changes
+        dcc.Interval(id='reload-interval', interval=issue_report_watch_interval * 1000, disabled=not issue_report_watch),
+        dcc.Store(id='dataset-version', data=DATASET_FINGERPRINT),
+    ] + digest_stores + ([dcc.Store(id='client-cube')] if client_side_filtering else []))
+
+# Start a Dash app, the scripts of the client side filtering mode are only served in that mode
+app = dash.Dash(assets_folder=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets'), include_assets_files=client_side_filtering)
+# the components of the page without any chart let Dash check the callbacks without computing the charts when the app starts
+app.validation_layout = page_layout([])
+app.layout = build_layout
+
+# Flask server of the app, for the WSGI servers
+server = app.server
+
+def triggered_by(component_id)-> bool:
+    """
+    helper to know if a callback was triggered by a component, False when the callback function is called directly
+    """
+    try:
+        return dash.callback_context.triggered_id == component_id
+    except dash.exceptions.MissingCallbackContextException:
+        return False
 
-    for filter_name in pie_chart_filters:
-        if filter_name in pie_chart_divs:
-            div_children.append(pie_chart_divs[filter_name])
+# Inputs of the section callbacks, every chart depends on all the dropdowns and on the loaded report
+section_inputs = [dash.dependencies.Input('project-dropdown', 'value'),dash.dependencies.Input('severity-dropdown', 'value'),dash.dependencies.Input('csp-dropdown', 'value'),dash.dependencies.Input('subscription-dropdown', 'value'),
+                  dash.dependencies.Input('date-range', 'value'),dash.dependencies.Input('granularity', 'value'),dash.dependencies.Input('dataset-version', 'data')]
 
-    # Refresh the line charts based on the filtered data
-    refresh_line_charts = line_chart_use_cases(df,selected_project)
-    updated_line_charts_figure = [create_figure_chart(chart['data'], chart['layout']) for chart in refresh_line_charts]
+def section_callback(section, background=False):
+    """
+    build the callback function updating the charts of a section of the page
+    Each section has its own callback: the browser sends the requests of the sections in parallel and displays each section as soon as it is computed.
+    Only the charts whose data or layout changed are sent, the graphs already displayed only get their new data and layout (partial update of the figure)
 
-    # Return the updated line charts and pie charts as a list of figures and divs
-    return updated_line_charts_figure + div_children
+    Parameters:
+        - section (kind of chart and filter) and True for a background callback, which receives the function setting its progress message first
 
-@app.callback(
-    [dash.dependencies.Output('subscription-dropdown', 'value'),
-     dash.dependencies.Output('subscription-dropdown', 'options'),
-     dash.dependencies.Output('severity-dropdown', 'value'),
-     dash.dependencies.Output('severity-dropdown', 'options')],
-    [dash.dependencies.Input('project-dropdown', 'value'),
-     dash.dependencies.Input('csp-dropdown', 'value')]
-)
-def update_dropdowns(selected_project, selected_csp):
+    Returns:
+        - callback function
+    """
+    graph_ids = section_graph_ids(section)
+
+    def update_section(selected_project, selected_severity, selected_csp, selected_subscription, date_range=None, granularity=None, dataset_version=None, digests=None, progress=None)->list:
+        """
+        This function is called when the user selects an option in any of the dropdown menus, or changes the date range or the granularity.
+        It updates the charts of its section of the web page based on the selected inputs.
+        """
+        # Compute the charts based on the selected inputs, or get them from the figure cache
+        selection = normalize_selection(selected_project, selected_severity, selected_csp, selected_subscription)
+        charts = {chart['id']: chart for chart in section_charts(section, selection, normalize_window(date_range, granularity), progress)}
+        new_digests = [chart_digest(charts[graph_id]) if graph_id in charts else None for graph_id in graph_ids]
+        digests = digests or [None] * len(graph_ids)
+        if new_digests == digests:
+            raise dash.exceptions.PreventUpdate
+
+        figures = []
+        styles = []
+        for graph_id, new_digest, digest in zip(graph_ids, new_digests, digests):
+            if new_digest is None or new_digest == digest:
+                # the chart did not change, or it is hidden
+                figures.append(dash.no_update)
+            elif digest is None:
+                figures.append(create_figure_chart(charts[graph_id]['data'], charts[graph_id]['layout']))
+            else:
+                figure = dash.Patch()
+                figure['data'] = charts[graph_id]['data']
+                figure['layout'] = charts[graph_id]['layout']
+                figures.append(figure)
+            # show or hide the pie charts of the statuses with or without issues
+            styles.append(dash.no_update if (new_digest is None) == (digest is None) else pie_chart_style(new_digest is not None))
+
+        if section[0] == 'line':
+            return figures + [new_digests]
+        return figures + styles + [new_digests]
+
+    update_section.__name__ = f"update_{section[0]}_{section[1].replace(' ', '_')}"
+    if not background:
+        return update_section
+
+    def update_section_job(set_progress, *args)->list:
+        """
+        background job of the section, it runs in its own process and reports its progress to the page
+        """
+        return update_section(*args, progress=set_progress)
+
+    update_section_job.__name__ = update_section.__name__
+    return update_section_job
+
+# Define the callback functions to update the charts based on user inputs, one per section of the page
+SECTION_CALLBACKS = {}
+for section in CHART_SECTIONS:
+    section_outputs = [dash.dependencies.Output(graph_id, 'figure') for graph_id in section_graph_ids(section)]
+    if section[0] == 'pie':
+        section_outputs += [dash.dependencies.Output(graph_id, 'style') for graph_id in section_graph_ids(section)]
+    section_outputs.append(dash.dependencies.Output(section_digests_id(section), 'data'))
+    if client_side_filtering:
+        # The browser computes the charts of the section from the issue cube, the digests are not needed since nothing is sent
+        app.clientside_callback(
+            f"function(...values) {{ return window.dash_clientside.wizCharts.updateSection({json.dumps(section[0])}, {json.dumps(section[1])}, {json.dumps(section_graph_ids(section))}, ...values); }}",
+            section_outputs[:-1], section_inputs[:-1] + [dash.dependencies.Input('client-cube', 'data')])
+        continue
+    section_state = [dash.dependencies.State(section_digests_id(section), 'data')]
+    if BACKGROUND_CACHE is None:
+        SECTION_CALLBACKS[section] = app.callback(section_outputs, section_inputs, section_state)(instrumented(section_callback(section)))
+        continue
+    # The job of a section runs in a forked process, the page polls its progress and its result.
+    # When the selection changes before the job finished, the page sends the previous job with the new request and it is terminated.
+    # Dash names the results after the source of the callback and its arguments, which are the same for all the sections: each section has its own manager naming its results after the section and the dataset
+    manager = dash.DiskcacheManager(BACKGROUND_CACHE, cache_by=[lambda: DATASET_FINGERPRINT, lambda section=section: section], expire=background_result_seconds)
+    progress_id = section_progress_id(section)
+    SECTION_CALLBACKS[section] = app.callback(
+        section_outputs, section_inputs, section_state,
+        background=True, manager=manager, interval=background_poll_interval,
+        progress=[dash.dependencies.Output(progress_id, 'children')],
+        progress_default=[f'{section_title(section)}: waiting'],
+        running=[(dash.dependencies.Output(progress_id, 'style'), {'display': 'block'}, {'display': 'none'})],
+    )(instrumented(section_callback(section, background=True)))
+
+@instrumented
+def update_dropdowns(selected_project, selected_csp, dataset_version=None):
     """
     This function is called when the user selects an option in any of the dropdown menus. 
     It updates the Subscription ID drop down menu 
+    When the issue report is reloaded only the options are updated, the selected values are kept
     """
-    # Filter the dataframe based on the selected project and resource platform
-    if 'All Projects'  in selected_project:
-        df = origin_df
-    else:
-        df = origin_df[origin_df['Project Names'].str.split(', ').apply(lambda x: any([k for k in x if k in selected_project]))]
-    
-    if selected_csp != 'All Resource Platforms':
-        df = df[df['Resource Platform'] == selected_csp]
-    
-    # Get the list of unique resource platforms and subscription IDs
-    subscription_ids = df['Subscription ID'].unique()
+    # Get the list of unique subscription IDs and severities of the selected project and resource platform
+    values = QUERY_BACKEND.distinct_values(['Subscription ID', 'Severity'], normalize_selection(selected_project, 'All Severities', selected_csp, 'All Subscriptions'))
+    subscription_ids = values['Subscription ID']
 
-    severities = df ['Severity'].unique()
+    severities = values['Severity']
     
     # Create a list of dictionaries for the options in the dropdown boxes
     subscription_options = [{'label': 'All Subscriptions', 'value': 'All Subscriptions'}] + [{'label': subscription, 'value': subscription} for subscription in subscription_ids]
     
     severity_options = [{'label': 'All Severities', 'value': 'All Severities'}] + [{'label': severity, 'value': severity} for severity in severities]
 
+    # Keep the selected values when the issue report is reloaded
+    if triggered_by('dataset-version'):
+        return dash.no_update, subscription_options, dash.no_update, severity_options
+
     # Return the default value and the updated list of options for the dropdowns
     return 'All Subscriptions', subscription_options, 'All Severities', severity_options
 
+# Define the callback function to update the dropdowns, in the browser in client side filtering mode
+dropdowns_outputs = [dash.dependencies.Output('subscription-dropdown', 'value'),
+                     dash.dependencies.Output('subscription-dropdown', 'options'),
+                     dash.dependencies.Output('severity-dropdown', 'value'),
+                     dash.dependencies.Output('severity-dropdown', 'options')]
+if client_side_filtering:
+    app.clientside_callback(
+        dash.dependencies.ClientsideFunction('wizCharts', 'updateDropdowns'),
+        dropdowns_outputs,
+        [dash.dependencies.Input('project-dropdown', 'value'),
+         dash.dependencies.Input('csp-dropdown', 'value'),
+         dash.dependencies.Input('client-cube', 'data')]
+    )
+
+    @app.callback(
+        dash.dependencies.Output('client-cube', 'data'),
+        [dash.dependencies.Input('dataset-version', 'data')]
+    )
+    @instrumented
+    def send_client_issue_cube(dataset_version):
+        """
+        This function is called when the page is loaded and when the issue report is reloaded.
+        It sends the issue cube to the browser, which then computes the dropdowns and the charts by itself
+        """
+        global CLIENT_ISSUE_CUBE
+        with DATASET_LOCK:
+            if CLIENT_ISSUE_CUBE is None or CLIENT_ISSUE_CUBE['fingerprint'] != DATASET_FINGERPRINT:
+                CLIENT_ISSUE_CUBE = client_issue_cube(QUERY_BACKEND.issue_cube())
+            return CLIENT_ISSUE_CUBE
+else:
+    app.callback(dropdowns_outputs, [dash.dependencies.Input('project-dropdown', 'value'),
+                                     dash.dependencies.Input('csp-dropdown', 'value'),
+                                     dash.dependencies.Input('dataset-version', 'data')])(update_dropdowns)
+
+@app.callback(
+    dash.dependencies.Output('dataset-version', 'data'),
+    [dash.dependencies.Input('reload-interval', 'n_intervals')],
+    [dash.dependencies.State('dataset-version', 'data')]
+)
+def check_dataset_version(n_intervals, dataset_version):
+    """
+    This function is called periodically when the issue report is watched.
+    It updates the data version of the page when the issue report was reloaded, which refreshes the dropdowns and the charts
+    The version is the fingerprint of the data, so the worker processes of a WSGI server which loaded the same data give the same version
+    """
+    if dataset_version == DATASET_FINGERPRINT:
+        return dash.no_update
+    return DATASET_FINGERPRINT
+
+@app.callback(
+    [dash.dependencies.Output('project-dropdown', 'options'),
+     dash.dependencies.Output('csp-dropdown', 'options'),
+     dash.dependencies.Output('date-range', 'min'),
+     dash.dependencies.Output('date-range', 'max'),
+     dash.dependencies.Output('date-range', 'marks'),
+     dash.dependencies.Output('date-range', 'value')],
+    [dash.dependencies.Input('dataset-version', 'data')],
+    [dash.dependencies.State('date-range', 'value'),
+     dash.dependencies.State('date-range', 'min'),
+     dash.dependencies.State('date-range', 'max')]
+)
+def update_report_dropdowns(dataset_version, date_range=None, first_day=None, last_day=None):
+    """
+    This function is called when the issue report is reloaded.
+    It updates the Project Name and Resource Platform drop down menus and the days of the date range slider
+    A date range covering the whole previous report covers the whole new report, another date range is kept
+    """
+    project_options = [{'label': i, 'value': i} for i in WIZ_PROJECTS]
+    csp_options = [{'label': i, 'value': i} for i in RESOURCE_PLATFORMS]
+    if not date_range or list(date_range) == [first_day, last_day]:
+        date_range = list(DATASET_DAYS)
+    return project_options, csp_options, DATASET_DAYS[0], DATASET_DAYS[1], date_range_marks(*DATASET_DAYS), date_range
+
+# Measure the callback requests and expose the measures
+if metrics_enabled:
+    @app.server.before_request
+    def start_request_trace():
+        REQUEST_TRACE.start = time.perf_counter()
+        REQUEST_TRACE.spans = [] if flask.request.path.endswith('_dash-update-component') else None
+
+    @app.server.after_request
+    def record_request_metrics(response):
+        spans = getattr(REQUEST_TRACE, 'spans', None)
+        if spans is None:
+            return response
+        REQUEST_TRACE.spans = None
+        # the request time includes the JSON serialization of the figures by Dash
+        seconds = time.perf_counter() - REQUEST_TRACE.start
+        output = (flask.request.get_json(silent=True) or {}).get('output', '')
+        callback = app.callback_map[output]['callback'].__name__ if output in app.callback_map else 'unknown'
+        size = response.calculate_content_length() or 0
+        METRICS.observe('wiz_callback_seconds', (('callback', callback),), seconds, seconds_buckets)
+        METRICS.observe('wiz_response_bytes', (('callback', callback),), size, bytes_buckets)
+        if metrics_trace_log:
+            trace = {'time': time.time(), 'callback': callback, 'status': response.status_code, 'seconds': round(seconds, 6), 'bytes': size, 'spans': spans}
+            with METRICS.lock, open(metrics_trace_log, 'a') as trace_log:
+                trace_log.write(json.dumps(trace) + '\n')
+        return response
+
+    @app.server.route('/metrics')
+    def metrics():
+        return flask.Response(METRICS.render(), mimetype='text/plain; version=0.0.4')
+
+# Reload the new exports of the issue report in the background
+# several reports are only loaded at start, a new export would replace the issues of all of them
+if issue_report_watch and len(issue_report_files) > 1:
+    warnings.warn('issue_report_watch is ignored when several reports are loaded')
+elif issue_report_watch:
+    threading.Thread(target=watch_issue_report, args=(issue_report_watch, issue_report_watch_interval), daemon=True).start()
+
 
 # Run the app
 if __name__ == '__main__':
-    app.run_server(debug=True)
+    parser = argparse.ArgumentParser(description='Present the Wiz issue report in Pie and Line charts')
+    parser.add_argument('--export', metavar='DIRECTORY', help='export the charts to DIRECTORY instead of running the Dash server')
+    parser.add_argument('--per-project', action='store_true', help='also export the charts of each Wiz Project')
+    parser.add_argument('--presets', metavar='FILE', help='JSON list of filter presets to export: {"name", "project", "severity", "platform", "subscription", "start", "end", "granularity"}')
+    parser.add_argument('--format', nargs='+', choices=['html', 'json', 'png'], default=['html', 'json'], help='formats of the exported charts')
+    parser.add_argument('--workers', type=int, help='number of processes exporting the presets, all the cores by default')
+    args = parser.parse_args()
+
+    if args.export:
+        presets = [{'name': 'All Projects'}]
+        if args.presets:
+            with open(args.presets) as presets_file:
+                presets = json.load(presets_file)
+        if args.per_project:
+            presets += [{'name': project, 'project': [project]} for project in WIZ_PROJECTS if project != 'All Projects']
+        for path in export_charts(args.export, presets, args.format, args.workers):
+            print(path)
+    else:
+        app.run_server(debug=True)
@@ -0,0 +1,51 @@
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import pytest
+
+# the dashboard loads its reports when it is imported, the tests import it once on two small synthetic reports
+# sharing part of their issues: the most recent report updates the issues of the oldest one and adds new issues
+repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repository)
+
+report_directory = tempfile.mkdtemp(prefix='wiz-issue-report-tests-')
+
+# (file name, number of issues, seed of the generator, modification time): the issues 0 to 2999 are in both reports
+test_reports = [('oldest.csv', 3000, 0, 1700000000), ('newest.csv', 4000, 1, 1700100000)]
+
+for name, rows, seed, mtime in test_reports:
+    path = os.path.join(report_directory, name)
+    subprocess.run([sys.executable, os.path.join(repository, 'generate_report.py'), path, '--rows', str(rows), '--seed', str(seed),
+                    '--days', '120', '--cardinality', 'Subscription ID=12', 'Resource Type=20'], check=True)
+    # the reports are loaded from the oldest to the most recent modification time
+    os.utime(path, (mtime, mtime))
+
+os.environ['WIZ_ISSUE_REPORT'] = os.path.join(report_directory, '*.csv')
+
+@pytest.fixture(scope='session')
+def issue_report():
+    """
+    the dashboard module, loaded on the test reports
+    """
+    return importlib.import_module('issue_report')
+
+@pytest.fixture(scope='session')
+def report_paths()-> list:
+    """
+    paths of the test reports, from the oldest to the most recent
+    """
+    return [os.path.join(report_directory, name) for name, _, _, _ in test_reports]
+
+@pytest.fixture
+def chart_settings(issue_report, monkeypatch):
+    """
+    change the chart settings of the dashboard for a test, the figure cache is emptied before and after so no chart of other settings is returned
+    """
+    def change(**settings):
+        for name, value in settings.items():
+            monkeypatch.setattr(issue_report, name, value)
+        issue_report.FIGURE_CACHE.clear()
+    yield change
+    issue_report.FIGURE_CACHE.clear()
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+def zigzag(points)-> tuple:
+    """
+    a line without any straight segment, so every point is needed to draw it
+    """
+    x = np.arange(points, dtype='int64')
+    y = np.where(x % 2 == 0, x, -x) * (1 + x % 3)
+    return x, y
+
+@pytest.mark.parametrize('max_points', [None, 0])
+def test_downsample_line_without_limit_keeps_every_point(issue_report, max_points):
+    x, y = zigzag(50)
+    assert issue_report.downsample_line(x, y, max_points).tolist() == list(range(50))
+
+@pytest.mark.parametrize('points', [0, 1, 2])
+def test_downsample_line_of_two_points_or_less(issue_report, points):
+    x, y = zigzag(points)
+    assert issue_report.downsample_line(x, y, 1).tolist() == list(range(points))
+
+def test_downsample_line_drops_the_middle_of_straight_segments(issue_report):
+    x = np.arange(10, dtype='int64')
+    y = np.array([0, 1, 2, 3, 3, 3, 3, 5, 7, 6])
+    # the points of a segment are dropped whatever the limit, the corners are kept
+    assert issue_report.downsample_line(x, y, 100).tolist() == [0, 3, 6, 8, 9]
+
+@pytest.mark.parametrize('max_points', [1, 2])
+def test_downsample_line_below_three_points_keeps_the_ends(issue_report, max_points):
+    x, y = zigzag(30)
+    assert issue_report.downsample_line(x, y, max_points).tolist() == [0, 29]
+
+@pytest.mark.parametrize('max_points', [3, 4, 10, 49])
+def test_downsample_line_keeps_max_points(issue_report, max_points):
+    x, y = zigzag(50)
+    keep = issue_report.downsample_line(x, y, max_points)
+    assert len(keep) == max_points
+    assert keep[0] == 0 and keep[-1] == 49
+    assert (np.diff(keep) > 0).all()
+
+def test_largest_triangle_one_bucket_keeps_the_peak_of_every_bucket(issue_report):
+    x = np.arange(11, dtype='int64')
+    y = np.zeros(11)
+    y[[2, 7]] = [10, -10]
+    # two buckets of the 9 inner points: the peak of each one is kept
+    assert issue_report.largest_triangle_one_bucket(x, y, 4).tolist() == [0, 2, 7, 10]
+
+def test_other_values_label_never_names_a_value(issue_report):
+    assert issue_report.other_values_label(['a', 'b']) == 'Other'
+    assert issue_report.other_values_label(['a', 'Other']) == 'Other (merged)'
+    assert issue_report.other_values_label(['Other', 'Other (merged)']) == 'Other (merged 2)'
+
+def test_pie_chart_slices_merge_the_smallest_slices(issue_report, chart_settings):
+    chart_settings(chart_top_n=2)
+    labels, values = issue_report.pie_chart_slices(['a', 'b', 'c', 'd'], [5, 1, 7, 2])
+    assert (labels, values) == (['c', 'a', 'Other'], [7, 5, 3])
+    # a value named like the merged slice keeps its own slice, plotly would add up the slices of the same label
+    labels, values = issue_report.pie_chart_slices(['Other', 'b', 'c', 'd'], [5, 1, 7, 2])
+    assert (labels, values) == (['c', 'Other', 'Other (merged)'], [7, 5, 3])
+    # one slice more than the limit is kept, merging it would not make the chart smaller
+    assert issue_report.pie_chart_slices(['a', 'b', 'c'], [1, 2, 3]) == (['a', 'b', 'c'], [1, 2, 3])
+
+def test_top_line_values_keep_the_original_order(issue_report, chart_settings):
+    chart_settings(chart_top_n=2)
+    counts = {'a': 1, 'b': 9, 'c': 3, 'd': 5}
+    assert issue_report.top_line_values(counts, ['a', 'b', 'c', 'd']) == (['b', 'd'], ['a', 'c'])
+
+def test_line_chart_labels_are_unique(issue_report, chart_settings):
+    # the generated values are named like the merged line: it gets another name
+    chart_settings(chart_top_n=3)
+    selection = issue_report.normalize_selection(['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions')
+    cube = issue_report.ISSUE_CUBE.copy()
+    cube['Resource Type'] = cube['Resource Type'].cat.rename_categories({'Type 0': 'Other'})
+    counts = issue_report.line_chart_counts(cube, 'Resource Type', selection[0])
+    # the three most frequent values, in the order they appear, then the merged line
+    assert sorted(counts.keys[:3]) == ['Other', 'Type 1', 'Type 2']
+    assert counts.keys[3] == 'Other (merged)'
+    chart = issue_report.line_chart(counts, 'Resource Type', {'name': 'ALL'}, issue_report.normalize_window(None, None))
+    names = [trace['name'] for trace in chart['data']]
+    assert len(names) == len(set(names))
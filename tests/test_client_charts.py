@@ -0,0 +1,73 @@
+import json
+import os
+import shutil
+import subprocess
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+
+# node script loading assets/wiz_charts.js in a fake browser window, it reads the payload, the sections and the dropdown values on its standard input
+# and prints the figures and styles returned by every section and the dropdown options for each case
+node_script = """
+const no_update = {no_update: true};
+global.window = {dash_clientside: {no_update: no_update, PreventUpdate: {}, callback_context: {triggered: []}}};
+require(process.argv[1]);
+const charts = window.dash_clientside.wizCharts;
+const input = JSON.parse(require('fs').readFileSync(0));
+const results = input.cases.map(args => ({
+    sections: input.sections.map(([kind, filter, ids]) => charts.updateSection(kind, filter, ids, ...args, input.payload)),
+    dropdowns: charts.updateDropdowns(args[0], args[2], input.payload),
+}));
+process.stdout.write(JSON.stringify(results));
+"""
+
+def client_cases(issue_report)-> list:
+    """
+    dropdown values, date ranges and granularities of the compared pages: projects in another order, a single value, a missing project selection
+    """
+    projects, platforms, subscriptions = issue_report.WIZ_PROJECTS[1:], issue_report.RESOURCE_PLATFORMS[1:], issue_report.SUBSCRIPTON_IDS[1:]
+    first_day, last_day = issue_report.DATASET_DAYS
+    return [
+        [['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions', None, 'Day'],
+        [projects[:1], 'All Severities', 'All Resource Platforms', 'All Subscriptions', [first_day + 30, last_day - 20], 'Week'],
+        [projects[:3][::-1], 'HIGH', 'All Resource Platforms', 'All Subscriptions', None, 'Month'],
+        [['All Projects'], 'All Severities', platforms[0], 'All Subscriptions', [first_day, first_day + 100], 'Quarter'],
+        [['All Projects'], 'All Severities', 'All Resource Platforms', subscriptions[1], [last_day - 90, last_day], 'Week'],
+        ['All Projects', 'CRITICAL', platforms[-1], 'All Subscriptions', [last_day - 10, last_day], 'Day'],
+        [[], 'All Severities', 'All Resource Platforms', 'All Subscriptions', None, 'Day'],
+    ]
+
+def run_client(issue_report, cases)-> list:
+    """
+    results of the client side callbacks of every case, computed by assets/wiz_charts.js in node
+    """
+    sections = [[kind, filter, issue_report.section_graph_ids((kind, filter))] for kind, filter in issue_report.CHART_SECTIONS]
+    payload = issue_report.client_issue_cube(issue_report.ISSUE_CUBE)
+    script = os.path.join(os.path.dirname(os.path.abspath(issue_report.__file__)), 'assets', 'wiz_charts.js')
+    output = subprocess.run(['node', '-e', node_script, script], input=json.dumps({'payload': payload, 'sections': sections, 'cases': cases}, default=str),
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+@pytest.mark.parametrize('settings', [{}, {'chart_top_n': 3, 'line_chart_max_points': 20}, {'chart_top_n': None, 'line_chart_max_points': None}])
+def test_client_charts_match_the_server_charts(issue_report, chart_settings, settings):
+    chart_settings(**settings)
+    cases = client_cases(issue_report)
+    for args, result in zip(cases, run_client(issue_report, cases)):
+        selection = issue_report.normalize_selection(*args[:4])
+        window = issue_report.normalize_window(*args[4:])
+        for (kind, filter), section in zip(issue_report.CHART_SECTIONS, result['sections']):
+            ids = issue_report.section_graph_ids((kind, filter))
+            # same JSON as the figures sent by the server
+            expected = {chart['id']: json.loads(json.dumps({'data': chart['data'], 'layout': chart['layout']}, default=str))
+                        for chart in issue_report.section_charts((kind, filter), selection, window)}
+            figures, styles = section[:len(ids)], section[len(ids):]
+            for position, id in enumerate(ids):
+                if id in expected:
+                    assert figures[position] == expected[id], (args, id)
+                else:
+                    # a chart without issues is not sent, a pie chart of it is hidden
+                    assert figures[position] == {'no_update': True}, (args, id)
+                    if kind == 'pie':
+                        assert styles[position]['display'] == 'none', (args, id)
+        dropdowns = issue_report.update_dropdowns(args[0], args[2])
+        assert [result['dropdowns'][1], result['dropdowns'][3]] == json.loads(json.dumps([dropdowns[1], dropdowns[3]], default=str)), args
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+# day number of the first day of the random counts, a monday (2024-01-01)
+first_day = 19723
+
+@pytest.fixture
+def random_counts(issue_report)-> tuple:
+    """
+    DailyCounts of random rows of three keys, with several rows of the same key and day, and a brute force table of the same counts
+    """
+    rng = np.random.default_rng(0)
+    rows = 400
+    codes = rng.integers(0, 3, rows)
+    days = first_day + rng.integers(0, 200, rows)
+    # the last key only has issues during a month, its line stops there
+    days[codes == 2] = first_day + 40 + rng.integers(0, 30, (codes == 2).sum())
+    created = rng.integers(0, 4, rows)
+    resolved = rng.integers(0, 3, rows)
+    counts = issue_report.DailyCounts(['a', 'b', 'c'], codes, days, created, resolved)
+    table = pd.DataFrame({'key': codes, 'day': days, 'created': created, 'resolved': resolved})
+    return counts, table
+
+def test_counts_of_a_range_are_the_sums_of_its_days(random_counts):
+    counts, table = random_counts
+    for first, last in [(first_day, first_day + 199), (first_day + 13, first_day + 13), (first_day + 50, first_day + 120),
+                        (first_day - 30, first_day - 1), (first_day + 150, first_day + 400)]:
+        created, resolved = counts.counts(first, last)
+        in_range = table[(table['day'] >= first) & (table['day'] <= last)]
+        expected = in_range.groupby('key')[['created', 'resolved']].sum().reindex(range(3), fill_value=0)
+        assert created.tolist() == expected['created'].tolist(), (first, last)
+        assert resolved.tolist() == expected['resolved'].tolist(), (first, last)
+
+def test_open_issues_at_the_end_of_every_day(random_counts):
+    counts, table = random_counts
+    days = np.arange(first_day - 5, first_day + 210)
+    open_issues = counts.open_issues(days)
+    for key in range(3):
+        rows = table[table['key'] == key]
+        expected = [int((rows['created'] - rows['resolved'])[rows['day'] <= day].sum()) for day in days]
+        assert open_issues[key].tolist() == expected
+
+@pytest.mark.parametrize('granularity', ['Day', 'Week', 'Month', 'Quarter'])
+def test_periods_split_the_range(issue_report, granularity):
+    first, last = first_day + 3, first_day + 250
+    starts, ends = issue_report.period_days(first, last, granularity)
+    # the periods follow each other without a gap and are cut at the range
+    assert starts[0] == first and ends[-1] == last
+    assert (starts[1:] == ends[:-1] + 1).all()
+    # every period is within one period of the granularity, and two periods are never in the same one
+    periods = pd.DatetimeIndex(np.concatenate([starts, ends]).astype('datetime64[D]')).to_period(issue_report.line_chart_granularities[granularity])
+    assert (periods[:len(starts)] == periods[len(starts):]).all()
+    assert periods[:len(starts)].is_unique
+    if granularity == 'Week':
+        # the weeks end on sunday
+        assert all(pd.Timestamp(day, unit='D').dayofweek == 6 for day in ends[:-1])
+
+@pytest.mark.parametrize('granularity', ['Day', 'Week', 'Month', 'Quarter'])
+def test_line_points_are_the_open_issues_at_the_end_of_the_periods(issue_report, chart_settings, random_counts, granularity):
+    chart_settings(line_chart_max_points=None)
+    counts, table = random_counts
+    window = (first_day + 10, first_day + 180, granularity)
+    starts, ends = issue_report.period_days(*window)
+    for key, trace in enumerate(issue_report.line_traces(counts, window)):
+        rows = table[table['key'] == key]
+        with_issues = rows[(rows['created'] > 0) | (rows['resolved'] > 0)]
+        expected = []
+        for start, end in zip(starts, ends):
+            # a period is drawn when it overlaps the days of the created issues, or of the resolved issues, of the line
+            spans = [(rows.loc[rows[column] > 0, 'day'].min(), rows.loc[rows[column] > 0, 'day'].max()) for column in ['created', 'resolved']]
+            if any(start <= span_last and end >= span_first for span_first, span_last in spans):
+                expected.append((str(pd.Timestamp(end, unit='D').date()), int((rows['created'] - rows['resolved'])[rows['day'] <= end].sum())))
+        assert list(zip(trace['x'], trace['y'])) == expected, trace['name']
+        assert len(with_issues) > 0
+
+def test_window_counts_leave_out_the_keys_without_issues(issue_report, random_counts):
+    counts, table = random_counts
+    # only the first two keys have issues after the month of the last one
+    window = (first_day + 100, first_day + 199, 'Day')
+    expected = table[(table['day'] >= window[0]) & (table['day'] <= window[1])].groupby('key')['created'].sum()
+    assert issue_report.window_counts(counts, window) == {['a', 'b', 'c'][key]: count for key, count in expected.items() if count > 0}
+    assert 'c' not in issue_report.window_counts(counts, window)
+
+@pytest.mark.parametrize('filter', ['Severity', 'Project Names', 'Resource Type'])
+def test_pie_charts_count_the_issues_created_in_the_range(issue_report, chart_settings, filter):
+    chart_settings(chart_top_n=None)
+    selection = issue_report.normalize_selection(['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions')
+    dataset_first_day, dataset_last_day = issue_report.DATASET_DAYS
+    window = issue_report.normalize_window([dataset_first_day + 30, dataset_last_day - 40], 'Month')
+    issues = issue_report.origin_df
+    created_days = pd.DatetimeIndex(issues['Created At']).floor('D').asi8 // issue_report.nanoseconds_per_day
+    issues = issues[(created_days >= window[0]) & (created_days <= window[1])]
+    if filter == 'Project Names':
+        issues = issues.assign(**{filter: issues[filter].astype(str).str.split(', ')}).explode(filter)
+    expected = issues.groupby(['Status', filter], observed=True).size()
+    charts = issue_report.section_charts(('pie', filter), selection, window)
+    assert {chart['id'] for chart in charts} == {f'{status}-issues-by-{filter}-pie-chart' for status in issues['Status'].unique()}
+    for chart in charts:
+        status = chart['id'].split('-issues-by-')[0]
+        values = {label: value for label, value in zip(chart['data'][0]['labels'], chart['data'][0]['values']) if value}
+        assert values == {value: count for value, count in expected[status].items() if count}
@@ -0,0 +1,55 @@
+import pickle
+import pytest
+
+# size of a pickled entry of the tests, every entry has the same size
+entry_bytes = len(pickle.dumps('x' * 1000, protocol=pickle.HIGHEST_PROTOCOL))
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def figure_cache(issue_report, request, tmp_path):
+    """
+    build a figure cache kept in memory, or in a SQLite file shared by the processes
+    """
+    def build(max_entries, max_bytes):
+        return issue_report.FigureCache(max_entries, max_bytes, str(tmp_path / 'figures.sqlite') if request.param == 'sqlite' else None)
+    return build
+
+def test_least_recently_used_entries_are_evicted_over_the_number_of_entries(figure_cache):
+    cache = figure_cache(3, 100 * entry_bytes)
+    for key in 'abc':
+        cache.put(key, 'x' * 1000)
+    # a read entry is the most recently used
+    assert cache.get('a') == 'x' * 1000
+    cache.put('d', 'x' * 1000)
+    assert cache.get('b') is None
+    assert [key for key in 'acd' if cache.get(key) is not None] == ['a', 'c', 'd']
+
+def test_least_recently_used_entries_are_evicted_over_the_bytes(figure_cache):
+    cache = figure_cache(100, 2 * entry_bytes + 10)
+    cache.put('a', 'x' * 1000)
+    cache.put('b', 'x' * 1000)
+    cache.put('c', 'x' * 1000)
+    assert cache.get('a') is None
+    assert cache.get('b') is not None and cache.get('c') is not None
+    # an entry larger than the cache is not kept and evicts nothing
+    cache.put('d', 'x' * (3 * entry_bytes))
+    assert cache.get('d') is None
+    assert cache.get('b') is not None and cache.get('c') is not None
+
+def test_replaced_entry_is_counted_once(figure_cache):
+    cache = figure_cache(2, 2 * entry_bytes)
+    cache.put('a', 'x' * 1000)
+    cache.put('a', 'y' * 1000)
+    cache.put('b', 'x' * 1000)
+    assert cache.get('a') == 'y' * 1000 and cache.get('b') is not None
+
+def test_hits_and_misses_are_exposed_on_the_metrics(issue_report, figure_cache, monkeypatch):
+    monkeypatch.setattr(issue_report, 'metrics_enabled', True)
+    monkeypatch.setattr(issue_report, 'METRICS', issue_report.Metrics())
+    cache = figure_cache(10, 100 * entry_bytes)
+    cache.put('a', 'x' * 1000)
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+    lines = issue_report.METRICS.render().splitlines()
+    assert 'wiz_figure_cache_hits_total 2' in lines
+    assert 'wiz_figure_cache_misses_total 1' in lines
@@ -0,0 +1,53 @@
+import dash
+import pandas as pd
+import pytest
+
+def cube_sums(issue_report, cube)-> list:
+    """
+    created and resolved issues of a cube by dimensions and day, sorted so cubes built in chunks or in another order are compared
+    """
+    columns = issue_report.cube_dimensions + ['Day']
+    cube = cube.astype({column: object for column in issue_report.cube_dimensions})
+    sums = cube.groupby(columns, dropna=False)[['Created', 'Resolved']].sum().reset_index()
+    sums = sums[(sums['Created'] > 0) | (sums['Resolved'] > 0)]
+    return sorted(sums.itertuples(index=False, name=None), key=repr)
+
+@pytest.mark.parametrize('chunk_size', [500, 7000])
+def test_streamed_reports_give_the_issue_cube(issue_report, report_paths, monkeypatch, chunk_size):
+    # an issue of both reports is counted once, from the most recent report, like when the reports are loaded in memory
+    monkeypatch.setattr(issue_report, 'issue_report_chunk_size', chunk_size)
+    streamed = issue_report.stream_issue_cubes(report_paths)
+    assert cube_sums(issue_report, streamed) == cube_sums(issue_report, issue_report.ISSUE_CUBE)
+    assert streamed['Created'].sum() == len(issue_report.origin_df)
+
+@pytest.fixture
+def loaded_data(issue_report, monkeypatch):
+    """
+    restore the data of the dashboard after a test reloading a report
+    """
+    for name in ['origin_df', 'ISSUE_CUBE', 'QUERY_BACKEND', 'PROJECT_MEMBERSHIP', 'WIZ_PROJECTS', 'RESOURCE_PLATFORMS', 'SUBSCRIPTON_IDS', 'DATASET_DAYS', 'DATASET_FINGERPRINT']:
+        monkeypatch.setattr(issue_report, name, getattr(issue_report, name))
+    yield
+    issue_report.FIGURE_CACHE.clear()
+
+def test_reloaded_report_gives_the_cube_of_a_fresh_load(issue_report, report_paths, loaded_data, tmp_path):
+    # a new export with removed, updated and unchanged issues, under another file name like in a drop directory
+    report = pd.read_csv(report_paths[-1])
+    report = report.drop(index=range(50))
+    report.loc[100:199, 'Severity'] = 'LOW'
+    report.loc[300:349, 'Status'] = 'RESOLVED'
+    path = str(tmp_path / 'export.csv')
+    report.to_csv(path, index=False)
+
+    issue_report.reload_issue_report(path)
+    fresh = issue_report.build_issue_cube(issue_report.load_issue_reports([path]))
+    assert cube_sums(issue_report, issue_report.ISSUE_CUBE) == cube_sums(issue_report, fresh)
+    assert sorted(issue_report.origin_df[issue_report.issue_id_column]) == sorted(report[issue_report.issue_id_column])
+    # the version of the pages is the same in a worker which reloaded the export and in a worker which loaded it at start
+    assert issue_report.DATASET_FINGERPRINT == issue_report.dataset_fingerprint(fresh)
+    assert issue_report.check_dataset_version(1, 'previous') == issue_report.DATASET_FINGERPRINT
+
+    # the same export again changes nothing
+    issue_report.reload_issue_report(path)
+    assert issue_report.DATASET_FINGERPRINT == issue_report.dataset_fingerprint(fresh)
+    assert issue_report.check_dataset_version(2, issue_report.DATASET_FINGERPRINT) is dash.no_update
@@ -0,0 +1,85 @@
+import pandas as pd
+import pytest
+
+def baseline_cumulative_line_chart_df(df)-> pd.DataFrame:
+    """
+    cumulative open issues of a data frame of issues, as computed by the first version of the dashboard (one resample per line)
+    """
+    created_issues_daily_count = df.set_index('Created At').resample('D').size().fillna(0).reset_index(name='Count_created')
+    resolved_issues_daily_count = df[df['Status'].isin(['RESOLVED', 'REJECTED'])].set_index('Resolved Time').resample('D').size().fillna(0).reset_index(name='Count_resolved')
+    if not created_issues_daily_count.empty and not resolved_issues_daily_count.empty:
+        open_issues_count = pd.merge(created_issues_daily_count, resolved_issues_daily_count, left_on='Created At', right_on='Resolved Time', how='outer', suffixes=('_created', '_resolved'))
+    elif created_issues_daily_count.empty and resolved_issues_daily_count.empty:
+        open_issues_count = pd.DataFrame(columns=['Created At', 'Resolved Time', 'Count_created', 'Count_resolved'])
+    elif created_issues_daily_count.empty:
+        open_issues_count = resolved_issues_daily_count.copy()
+        open_issues_count['Created At'] = open_issues_count['Resolved Time']
+        open_issues_count['Count_created'] = 0
+    else:
+        open_issues_count = created_issues_daily_count.copy()
+        open_issues_count['Resolved Time'] = open_issues_count['Created At']
+        open_issues_count['Count_resolved'] = 0
+    open_issues_count['Count_created'] = open_issues_count['Count_created'].fillna(0)
+    open_issues_count['Count_resolved'] = open_issues_count['Count_resolved'].fillna(0)
+    open_issues_count['Date'] = open_issues_count['Created At'].fillna(open_issues_count['Resolved Time'])
+    open_issues_count['Cumulative Open'] = (open_issues_count['Count_created'] - open_issues_count['Count_resolved']).cumsum()
+    return open_issues_count
+
+def baseline_trace(df, name)-> dict:
+    """
+    line of the first version of the dashboard, with the days and counts formatted like line_chart_trace
+    """
+    open_issues_count = baseline_cumulative_line_chart_df(df)
+    days = pd.DatetimeIndex(open_issues_count['Date']).strftime('%Y-%m-%d').tolist()
+    return {'name': name, 'x': days, 'y': open_issues_count['Cumulative Open'].astype('int64').tolist()}
+
+def baseline_line_chart(issue_report, issues, filter, selected_project)-> list:
+    """
+    lines of a line chart of the first version of the dashboard: the ALL line, then a line per Wiz Project or per value of the filter
+    """
+    lines = [baseline_trace(issues, 'ALL')]
+    if filter == 'Project Names':
+        projects = [project for project in issue_report.WIZ_PROJECTS if project != 'All Projects'] if 'All Projects' in selected_project else selected_project
+        for project in projects:
+            lines.append(baseline_trace(issues[issues[filter].astype(str).str.split(', ').apply(lambda names: project in names)], project[:36]))
+    else:
+        for value in issues[filter].unique():
+            lines.append(baseline_trace(issues[issues[filter] == value], value[:36]))
+    return lines
+
+@pytest.mark.parametrize('selection', [
+    (['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions'),
+    (['All Projects'], 'HIGH', 'All Resource Platforms', 'All Subscriptions'),
+    (['Project 1', 'Project 3'], 'All Severities', 'AWS', 'All Subscriptions'),
+])
+def test_line_charts_match_the_first_version(issue_report, chart_settings, selection):
+    # every value and every day of the lines, as the first version drew them
+    chart_settings(chart_top_n=None, line_chart_max_points=None)
+    selected_project, selected_severity, selected_csp, selected_subscription = issue_report.normalize_selection(*selection)
+    issues = issue_report.origin_df
+    if 'All Projects' not in selected_project:
+        issues = issues[issues['Project Names'].astype(str).str.split(', ').apply(lambda names: any(project in names for project in selected_project))]
+    if selected_severity != 'All Severities':
+        issues = issues[issues['Severity'] == selected_severity]
+    if selected_csp != 'All Resource Platforms':
+        issues = issues[issues['Resource Platform'] == selected_csp]
+    assert len(issues) > 0
+
+    for filter in issue_report.line_chart_filters:
+        chart, = issue_report.section_charts(('line', filter), issue_report.normalize_selection(*selection))
+        lines = [{'name': trace['name'], 'x': trace['x'], 'y': trace['y']} for trace in chart['data']]
+        assert lines == baseline_line_chart(issue_report, issues, filter, selected_project), filter
+
+def test_window_by_day_is_the_whole_line_cut_to_the_range(issue_report, chart_settings):
+    # a date range by day keeps the points of the whole report in the range, the open issues still count the issues created before it
+    chart_settings(chart_top_n=None, line_chart_max_points=None)
+    selection = issue_report.normalize_selection(['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions')
+    first_day, last_day = issue_report.DATASET_DAYS
+    window = issue_report.normalize_window([first_day + 20, last_day - 30], 'Day')
+    first, last = [str(pd.Timestamp(day, unit='D').date()) for day in window[:2]]
+    for filter in issue_report.line_chart_filters:
+        whole, = issue_report.section_charts(('line', filter), selection)
+        cut, = issue_report.section_charts(('line', filter), selection, window)
+        for whole_trace, cut_trace in zip(whole['data'], cut['data']):
+            points = [(x, y) for x, y in zip(whole_trace['x'], whole_trace['y']) if first <= x <= last]
+            assert list(zip(cut_trace['x'], cut_trace['y'])) == points
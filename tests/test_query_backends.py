@@ -0,0 +1,51 @@
+import pytest
+
+# selections of the dropdowns, the last ones take lists of values like the filter presets
+selections = [
+    (['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions'),
+    (['Project 1', 'Project 3'], 'HIGH', 'All Resource Platforms', 'All Subscriptions'),
+    (['All Projects'], 'All Severities', 'AWS', 'All Subscriptions'),
+    (['Project 2'], ['CRITICAL', 'LOW'], ['AWS', 'GCP'], 'All Subscriptions'),
+]
+
+def daily_sums(rows, columns)-> list:
+    """
+    created and resolved issues of the rows of a backend by columns and day, sorted so the rows of both backends are compared whatever their grouping
+    """
+    rows = rows.astype({column: object for column in columns}).where(rows.notna(), None)
+    sums = rows.groupby(columns + ['Day'], dropna=False)[['Created', 'Resolved']].sum().reset_index()
+    return sorted(sums.itertuples(index=False, name=None), key=repr)
+
+def assert_same_backends(issue_report, pandas_backend, sqlite_backend):
+    """
+    compare the answers of both backends on the selections
+    """
+    assert pandas_backend.day_range() == sqlite_backend.day_range()
+    assert pandas_backend.project_membership().astype(str).values.tolist() == sqlite_backend.project_membership().values.tolist()
+    assert pandas_backend.distinct_values(issue_report.cube_dimensions) == sqlite_backend.distinct_values(issue_report.cube_dimensions)
+    for selection in selections:
+        selection = issue_report.normalize_selection(*selection) if all(isinstance(value, str) for value in selection[1:]) else selection
+        for columns in [[], ['Severity'], ['Project Names', 'Resource Type']]:
+            assert daily_sums(pandas_backend.daily_rows(selection, columns), columns) == daily_sums(sqlite_backend.daily_rows(selection, columns), columns), (selection, columns)
+        assert pandas_backend.distinct_values(['Subscription ID'], selection) == sqlite_backend.distinct_values(['Subscription ID'], selection)
+
+def test_sqlite_backend_of_several_reports(issue_report, tmp_path):
+    # an issue of both reports is counted once, from the most recent report, like in the issue cube
+    sqlite_backend = issue_report.load_sqlite_backend(str(tmp_path / 'cube.sqlite'), issue_report.issue_report_files)
+    assert_same_backends(issue_report, issue_report.QUERY_BACKEND, sqlite_backend)
+
+def test_sqlite_backend_of_one_report(issue_report, report_paths, monkeypatch, tmp_path):
+    cube = issue_report.build_issue_cube(issue_report.load_issue_reports(report_paths[:1]))
+    pandas_backend = issue_report.PandasQueryBackend(cube, issue_report.dataset_fingerprint(cube))
+    # the projects are filtered with the membership index of the loaded data, a reload replaces it with the backend
+    monkeypatch.setattr(issue_report, 'PROJECT_MEMBERSHIP', pandas_backend.project_membership())
+    sqlite_backend = issue_report.load_sqlite_backend(str(tmp_path / 'cube.sqlite'), report_paths[:1])
+    assert_same_backends(issue_report, pandas_backend, sqlite_backend)
+
+@pytest.mark.parametrize('selection', selections[:3])
+def test_charts_of_both_backends(issue_report, monkeypatch, tmp_path, selection):
+    selection = issue_report.normalize_selection(*selection)
+    window = issue_report.normalize_window([issue_report.DATASET_DAYS[0] + 10, issue_report.DATASET_DAYS[1] - 10], 'Week')
+    expected = issue_report.filter_charts(*selection, window)
+    monkeypatch.setattr(issue_report, 'QUERY_BACKEND', issue_report.load_sqlite_backend(str(tmp_path / 'cube.sqlite'), issue_report.issue_report_files))
+    assert issue_report.filter_charts(*selection, window) == expected
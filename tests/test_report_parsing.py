@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+@pytest.mark.parametrize('value, expected', [
+    ('2023-01-02 03:04:05.123456 +0000 UTC', '2023-01-02 03:04:05.123456+00:00'),
+    # the Resolved Time anomaly of the reports, the time zone is repeated
+    ('2023-01-02 03:04:05.123456 +0000 +0000', '2023-01-02 03:04:05.123456+00:00'),
+    # other offsets are converted to UTC
+    ('2023-01-02 03:04:05.123456 +0100 UTC', '2023-01-02 02:04:05.123456+00:00'),
+    ('2023-01-02 03:04:05.123456 -0530 UTC', '2023-01-02 08:34:05.123456+00:00'),
+    ('2023-01-02 03:04:05.123456 +0200 +0200', '2023-01-02 01:04:05.123456+00:00'),
+    ('2023-01-02 03:04:05.123456 +0100', '2023-01-02 02:04:05.123456+00:00'),
+    # dates in another layout, like the ISO 8601 Created At
+    ('2023-01-02T03:04:05.123Z', '2023-01-02 03:04:05.123+00:00'),
+    ('2023-01-02 03:04:05 +0000 UTC', '2023-01-02 03:04:05+00:00'),
+])
+def test_dates_are_parsed_in_utc(issue_report, value, expected):
+    parsed = issue_report.normalize_datetime(pd.Series([value, value], index=[5, 7], name='Resolved Time'))
+    assert parsed.tolist() == [pd.Timestamp(expected)] * 2
+    assert parsed.index.tolist() == [5, 7] and parsed.name == 'Resolved Time'
+
+def test_blank_and_unparsable_cells_are_not_dates(issue_report):
+    dates = pd.Series([np.nan, '', 'not a date', '2023-01-02 03:04:05.123456 +0000 +0000', None])
+    parsed = issue_report.normalize_datetime(dates)
+    assert parsed.isna().tolist() == [True, True, True, False, True]
+    assert str(parsed.dtype) == 'datetime64[ns, UTC]'
+
+def test_column_without_any_date(issue_report):
+    # a report whose issues are all unresolved, the column is read as floats
+    parsed = issue_report.normalize_datetime(pd.Series([np.nan, np.nan]))
+    assert parsed.isna().all() and str(parsed.dtype) == 'datetime64[ns, UTC]'
+
+def test_dates_are_parsed_like_the_first_version(issue_report):
+    # the first version parsed every date on its own with the explicit formats of the report, ' UTC' after any offset or the repeated '+0000'
+    times = [f'2023-{month:02d}-{day:02d} {hour:02d}:17:09.{day * 12345:06d}' for month, day, hour in [(1, 2, 3), (6, 30, 23), (12, 31, 0)]]
+    values = [f'{time} {offset} UTC' for time in times for offset in ['+0000', '+0100', '-0800']] + [f'{time} +0000 +0000' for time in times]
+    expected = [pd.to_datetime(value, format='%Y-%m-%d %H:%M:%S.%f %z UTC') if value.endswith('UTC')
+                else pd.to_datetime(value.replace(' +0000 +0000', ' +0000'), format='%Y-%m-%d %H:%M:%S.%f %z') for value in values]
+    assert issue_report.normalize_datetime(pd.Series(values)).tolist() == [value.tz_convert('UTC') for value in expected]
@@ -0,0 +1,35 @@
+import dash
+import pytest
+
+def apply_patch(figure, patch)-> dict:
+    """
+    figure displayed by the browser after a partial update: the assigned keys of the patch replace the keys of the figure
+    """
+    figure = dict(figure)
+    for operation in patch.to_plotly_json()['operations']:
+        assert operation['operation'] == 'Assign' and len(operation['location']) == 1
+        figure[operation['location'][0]] = operation['params']['value']
+    return figure
+
+@pytest.mark.parametrize('granularities', [('Day', 'Week'), ('Week', 'Month'), ('Month', 'Day')])
+def test_line_chart_patch_follows_the_granularity(issue_report, chart_settings, granularities):
+    # the graph shown by the page gets the figure of the new granularity, its data and the title of its x axis
+    chart_settings()
+    update_section = issue_report.section_callback(('line', 'Severity'))
+    values = (['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions', None)
+    first_figure, digests = update_section(*values, granularities[0])
+    patch, new_digests = update_section(*values, granularities[1], None, digests)
+    assert isinstance(patch, dash.Patch)
+    new_figure, _ = update_section(*values, granularities[1])
+    assert apply_patch(first_figure, patch) == new_figure
+    assert new_figure['layout']['xaxis'] != first_figure['layout']['xaxis']
+    assert new_digests != digests
+
+def test_unchanged_section_is_not_sent(issue_report, chart_settings):
+    chart_settings()
+    update_section = issue_report.section_callback(('pie', 'Severity'))
+    values = (['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions', None, 'Day')
+    digests = update_section(*values)[-1]
+    # another granularity does not change the pie charts
+    with pytest.raises(dash.exceptions.PreventUpdate):
+        update_section(*values[:-1], 'Week', None, digests)
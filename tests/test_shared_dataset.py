@@ -0,0 +1,55 @@
+import json
+import os
+
+def current_version(directory)-> str:
+    """
+    version of the shared dataset current.json points to
+    """
+    with open(os.path.join(directory, 'current.json')) as current_file:
+        return json.load(current_file)['version']
+
+def test_mapped_cube_gives_the_charts_of_the_cube(issue_report, monkeypatch, tmp_path):
+    cube, fingerprint = issue_report.load_shared_dataset(str(tmp_path), issue_report.issue_report_files)
+    assert fingerprint == issue_report.DATASET_FINGERPRINT
+    # the columns are read-only views of the mapped files
+    assert not cube['Created'].to_numpy().flags.writeable
+    selection = issue_report.normalize_selection(['All Projects'], 'All Severities', 'All Resource Platforms', 'All Subscriptions')
+    window = issue_report.normalize_window([issue_report.DATASET_DAYS[0] + 10, issue_report.DATASET_DAYS[1] - 10], 'Month')
+    expected = issue_report.filter_charts(*selection, window)
+    monkeypatch.setattr(issue_report, 'QUERY_BACKEND', issue_report.PandasQueryBackend(cube, fingerprint))
+    assert issue_report.filter_charts(*selection, window) == expected
+
+def test_dataset_is_rebuilt_when_the_reports_change(issue_report, report_paths, monkeypatch, tmp_path):
+    directory = str(tmp_path)
+    oldest_cube, oldest_fingerprint = issue_report.load_shared_dataset(directory, report_paths[:1])
+    assert current_version(directory) == oldest_fingerprint
+    oldest_created = int(oldest_cube['Created'].sum())
+
+    # the same reports map the built version without loading them again
+    def fail(paths):
+        raise AssertionError('the reports are loaded again')
+    with monkeypatch.context() as patch:
+        patch.setattr(issue_report, 'load_issue_reports', fail)
+        cube, fingerprint = issue_report.load_shared_dataset(directory, report_paths[:1])
+    assert fingerprint == oldest_fingerprint and cube.equals(oldest_cube)
+
+    # another list of reports builds a new version and removes the previous one
+    cube, fingerprint = issue_report.load_shared_dataset(directory, report_paths)
+    assert fingerprint == issue_report.DATASET_FINGERPRINT != oldest_fingerprint
+    assert current_version(directory) == fingerprint
+    assert sorted(entry for entry in os.listdir(directory) if not entry.startswith('.')) == sorted(['current.json', fingerprint])
+    # a process still mapping the removed version keeps reading it
+    assert int(oldest_cube['Created'].sum()) == oldest_created > 0
+
+def test_processes_switching_versions(issue_report, report_paths, tmp_path):
+    # the workers load the dataset of one report or of both in turn, each build removes the other version while the other workers map it
+    directory = str(tmp_path)
+    reports = [report_paths[:1], report_paths] * 6
+
+    def load(paths):
+        cube, fingerprint = issue_report.load_shared_dataset(directory, paths)
+        return fingerprint, int(cube['Created'].sum())
+
+    loaded = issue_report.map_forked(load, reports, 6)
+    expected = {len(paths): load(paths) for paths in reports[:2]}
+    assert loaded == [expected[len(paths)] for paths in reports]